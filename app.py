@@ -2,10 +2,14 @@
 BrasileirãoGPT - Aplicativo de Chat com Agente de IA
 Construído com Streamlit, LangChain e OpenAI
 """
+import threading
+
 import streamlit as st
-from src.agents import create_agent
+# `src.agents` é importado sob demanda: o LangChain só carrega com a primeira mensagem
+from src import agents
 from src.prompts import prompt_loader
 from src.config import settings
+from src.telemetry import telemetry
 
 
 # Configuração da página
@@ -17,14 +21,82 @@ st.set_page_config(
 )
 
 
+def get_shared_resources():
+    """
+    Cliente LLM, ferramentas e prompts compartilhados por todas as sessões
+    
+    O pool de `get_agent_resources` já é único por processo e acompanha a
+    versão dos prompts em disco, então não é envolvido em `st.cache_resource`.
+    """
+    return agents.get_agent_resources()
+
+
+def warm_up_shared_resources():
+    """Monta os recursos compartilhados em segundo plano, antes da primeira mensagem"""
+    try:
+        # Constrói também as ferramentas, que de outra forma só seriam montadas no primeiro uso
+        get_shared_resources().tools
+    except Exception:
+        # O mesmo erro aparece para o usuário na primeira mensagem
+        pass
+
+
+@st.cache_resource
+def start_warmup() -> threading.Thread:
+    """Dispara o aquecimento uma única vez por processo"""
+    thread = threading.Thread(target=warm_up_shared_resources, name="agent-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_session_id() -> str:
+    """
+    Identificador da conversa, gerado no servidor
+    
+    O ID fica em `st.session_state`; a URL (?sid=...) leva apenas um token
+    assinado com SESSION_SECRET, que permite retomar a conversa após recarregar
+    a página ou em outra réplica (com HISTORY_BACKEND externo). Tokens não
+    emitidos pelo servidor são ignorados e iniciam uma conversa nova.
+    """
+    session_id = agents.verify_session_token(st.query_params.get("sid", ""))
+    if session_id is None:
+        session_id, token = agents.new_session_token()
+        st.query_params["sid"] = token
+    return session_id
+
+
+def get_agent():
+    """
+    Retorna o agente da sessão, criando-o na primeira mensagem
+    
+    Montar o agente (cliente LLM, ferramentas e prompts) fica fora da
+    abertura da página, que só precisa do histórico já gravado.
+    """
+    if "agent" not in st.session_state:
+        # Sem `resources`: o agente usa o pool e acompanha a recarga dos prompts
+        st.session_state.agent = agents.create_agent(session_id=st.session_state.session_id)
+    return st.session_state.agent
+
+
+def clear_history():
+    """Apaga a conversa da sessão, com ou sem o agente já criado"""
+    if "agent" in st.session_state:
+        st.session_state.agent.clear_history()
+        return
+    store = agents.get_history_store()
+    if store is not None:
+        store.delete(st.session_state.session_id)
+
+
 def initialize_session_state():
     """Inicializa as variáveis de estado da sessão"""
-    if "agent" not in st.session_state:
+    if "session_id" not in st.session_state:
         try:
-            st.session_state.agent = create_agent()
+            settings.validate()
         except ValueError as e:
             st.error(str(e))
             st.stop()
+        st.session_state.session_id = get_session_id()
     
     if "messages" not in st.session_state:
         st.session_state.messages = []
@@ -34,6 +106,8 @@ def initialize_session_state():
             "role": "assistant",
             "content": welcome_msg
         })
+        # Conversa retomada de outra réplica ou de uma recarga da página
+        st.session_state.messages.extend(agents.load_history(st.session_state.session_id))
 
 
 def display_chat_history():
@@ -43,6 +117,23 @@ def display_chat_history():
             st.markdown(message["content"])
 
 
+def render_agent_stream(events):
+    """
+    Converte os eventos do agente em trechos de texto para `st.write_stream`
+    
+    Args:
+        events: Gerador de eventos de `ConversationalAgent.stream_chat`
+    
+    Yields:
+        Trechos de texto da resposta
+    """
+    for event in events:
+        if event["type"] in ("token", "error"):
+            yield event["content"]
+        elif event["type"] == "tool_call":
+            st.toast(f"🛠️ Consultando {event['name']}...")
+
+
 def handle_user_input(user_input: str):
     """
     Processa a entrada do usuário e obtém resposta do agente
@@ -60,11 +151,10 @@ def handle_user_input(user_input: str):
     with st.chat_message("user"):
         st.markdown(user_input)
     
-    # Obtém resposta do agente
+    # Obtém resposta do agente, exibindo os tokens à medida que chegam
     with st.chat_message("assistant"):
-        with st.spinner("Pensando..."):
-            response = st.session_state.agent.chat(user_input)
-            st.markdown(response)
+        events = get_agent().stream_chat(user_input)
+        response = st.write_stream(render_agent_stream(events))
     
     # Adiciona resposta ao histórico
     st.session_state.messages.append({
@@ -73,6 +163,49 @@ def handle_user_input(user_input: str):
     })
 
 
+def telemetry_panel():
+    """Painel com as métricas de latência e tokens do processo"""
+    metrics = telemetry.metrics
+    if metrics is None:
+        return
+    
+    st.subheader("📈 Desempenho")
+    
+    turn_latency = metrics.histograms_named("agent_turn_latency_seconds")
+    turns = sum(hist.count for _, hist in turn_latency)
+    if turns == 0:
+        st.caption("Nenhum turno registrado ainda.")
+        return
+    
+    total_latency = sum(hist.sum for _, hist in turn_latency)
+    col1, col2 = st.columns(2)
+    col1.metric("Turnos", turns)
+    col2.metric("Latência média", f"{total_latency / turns:.2f}s")
+    
+    llm_latency = metrics.histogram("agent_llm_latency_seconds")
+    col1, col2 = st.columns(2)
+    col1.metric("LLM p50", f"≤{llm_latency.quantile(0.5)}s")
+    col2.metric("LLM p95", f"≤{llm_latency.quantile(0.95)}s")
+    
+    prompt_tokens = metrics.counter("agent_prompt_tokens_total")
+    cached_tokens = metrics.counter("agent_cached_tokens_total")
+    col1, col2 = st.columns(2)
+    col1.metric("Tokens de prompt", int(prompt_tokens))
+    col2.metric("Prefixo em cache", f"{cached_tokens / prompt_tokens:.0%}" if prompt_tokens else "—")
+    
+    st.caption(f"Acertos do cache de respostas: {int(metrics.counter('agent_cache_hits_total', cache='response'))}")
+    routed = sum(
+        value for (name, _), value in metrics.counters.items() if name == "agent_routed_turns_total"
+    )
+    st.caption(f"Respondidas sem o modelo (roteador): {int(routed)}")
+    
+    for labels, hist in metrics.histograms_named("agent_tool_latency_seconds"):
+        st.caption(f"🛠️ {labels['tool']}: {hist.count} chamadas, média {hist.sum / hist.count * 1000:.1f} ms")
+    
+    with st.expander("Último turno"):
+        st.json(metrics.last_trace)
+
+
 def sidebar():
     """Cria a barra lateral com configurações e informações"""
     with st.sidebar:
@@ -87,7 +220,7 @@ def sidebar():
         
         # Botão para limpar histórico
         if st.button("🗑️ Limpar Histórico", use_container_width=True):
-            st.session_state.agent.clear_history()
+            clear_history()
             st.session_state.messages = []
             # Adiciona mensagem de boas-vindas novamente
             welcome_msg = prompt_loader.get_welcome_message()
@@ -101,13 +234,20 @@ def sidebar():
         
         # Informações sobre ferramentas
         st.subheader("🛠️ Ferramentas Disponíveis")
-        tools = st.session_state.agent.tools
-        for tool in tools:
-            with st.expander(f"**{tool.name}**"):
-                st.write(tool.description)
+        if "agent" in st.session_state:
+            for tool in st.session_state.agent.tools:
+                with st.expander(f"**{tool.name}**"):
+                    st.write(tool.description)
+        else:
+            st.caption("As ferramentas são carregadas com a primeira mensagem.")
         
         st.divider()
         
+        # Painel de desempenho (opcional)
+        if settings.TELEMETRY_PANEL:
+            telemetry_panel()
+            st.divider()
+        
         # Informações adicionais
         st.subheader("ℹ️ Sobre")
         st.markdown("""
@@ -129,15 +269,19 @@ def main():
     st.title("🤖 BrasileirãoGPT")
     st.caption("Seu assistente de IA inteligente")
     
-    # Barra lateral
-    sidebar()
-    
     # Exibe histórico de mensagens
     display_chat_history()
     
     # Campo de entrada do usuário
     if prompt := st.chat_input("Digite sua mensagem..."):
         handle_user_input(prompt)
+    
+    # Barra lateral (depois da resposta, para listar as ferramentas do agente recém-criado)
+    sidebar()
+    
+    # Com a tela pronta, adianta a montagem do cliente LLM e das ferramentas
+    if settings.AGENT_WARMUP:
+        start_warmup()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,199 @@
+"""
+Benchmark de ponta a ponta do ConversationalAgent, sem rede e sem chave de API
+
+Sobe um servidor OpenAI simulado e um SofaScore simulado, executa conversas
+roteirizadas em N sessões concorrentes e reporta latência por turno
+(p50/p95/p99), vazão, tokens por turno (incluindo os servidos pelo cache de
+prefixo) e memória por sessão.
+
+Execute: python -m benchmarks.bench_agent --sessions 20 --mode stream
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+DEFAULT_SCRIPT = [
+    ["Quem é o líder do Brasileirão?", "E quem está no Z4?", "Quantos pontos tem o Flamengo?"],
+    ["Me mostra a tabela completa", "Compare Palmeiras e Botafogo"],
+    ["Oi, tudo bem?", "Quem foi rebaixado?", "Qual o saldo de gols do Bahia?", "Obrigado!"],
+]
+
+
+def _free_port() -> int:
+    """Reserva uma porta local livre"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentil por interpolação linear"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline do agente")
+    parser.add_argument("--sessions", type=int, default=10, help="Sessões concorrentes")
+    parser.add_argument("--mode", choices=["chat", "stream", "achat"], default="chat")
+    parser.add_argument("--script", help="JSON com lista de conversas (lista de listas de mensagens)")
+    parser.add_argument("--llm-first-token", type=float, default=0.3, help="Latência até o primeiro token (s)")
+    parser.add_argument("--llm-token-latency", type=float, default=0.005, help="Latência por token (s)")
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--tool-call-rate", type=float, default=1.0)
+    parser.add_argument("--sofascore-latency", type=float, default=0.2)
+    parser.add_argument("--sofascore-failure-rate", type=float, default=0.0)
+    parser.add_argument("--json", dest="json_output", help="Grava o relatório também em JSON")
+    args = parser.parse_args()
+
+    # As configurações são lidas na importação de `src`: define o ambiente antes
+    openai_port, sofascore_port = _free_port(), _free_port()
+    os.environ.update({
+        "OPENAI_API_KEY": "sk-benchmark",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{openai_port}/v1",
+        "SOFASCORE_BASE_URL": f"http://127.0.0.1:{sofascore_port}/api/v1",
+        "STANDINGS_SOURCE": "network",
+    })
+
+    import asyncio
+
+    from src.agents import create_agent, get_agent_resources
+    from src.telemetry import TraceSink, telemetry
+    from .fake_openai import FakeLLMConfig, start_fake_openai
+    from .fake_sofascore import FakeSofaScoreConfig, start_fake_sofascore
+
+    start_fake_openai(
+        FakeLLMConfig(
+            first_token_latency=args.llm_first_token,
+            token_latency=args.llm_token_latency,
+            failure_rate=args.llm_failure_rate,
+            tool_call_rate=args.tool_call_rate,
+            seed=42,
+        ),
+        openai_port,
+    )
+    sofascore_config = FakeSofaScoreConfig(args.sofascore_latency, args.sofascore_failure_rate, seed=42)
+    start_fake_sofascore(sofascore_config, sofascore_port)
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script, "r", encoding="utf-8") as f:
+            script = json.load(f)
+
+    class CollectingSink(TraceSink):
+        def __init__(self):
+            self.traces = []
+            self.lock = threading.Lock()
+
+        def emit(self, trace):
+            with self.lock:
+                self.traces.append(trace.to_dict())
+
+    sink = CollectingSink()
+    telemetry.add_sink(sink)
+
+    # Recursos compartilhados construídos fora da medição de memória por sessão
+    resources = get_agent_resources()
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    agents = [create_agent(resources=resources) for _ in range(args.sessions)]
+
+    def run_session(idx: int):
+        agent = agents[idx]
+        for message in script[idx % len(script)]:
+            if args.mode == "chat":
+                agent.chat(message)
+            else:
+                for _ in agent.stream_chat(message):
+                    pass
+
+    async def arun_session(idx: int):
+        agent = agents[idx]
+        for message in script[idx % len(script)]:
+            await agent.achat(message)
+
+    async def arun_all():
+        await asyncio.gather(*(arun_session(idx) for idx in range(args.sessions)))
+
+    started = time.perf_counter()
+    if args.mode == "achat":
+        # O cliente httpx assíncrono compartilhado pertence a um único event loop
+        asyncio.run(arun_all())
+    else:
+        with ThreadPoolExecutor(max_workers=args.sessions) as executor:
+            list(executor.map(run_session, range(args.sessions)))
+    elapsed = time.perf_counter() - started
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    session_bytes = sum(stat.size_diff for stat in after.compare_to(baseline, "filename"))
+
+    latencies = [trace["latency"] for trace in sink.traces]
+    # Primeiro token de texto de cada turno (chamadas de ferramenta não emitem texto)
+    first_tokens = [
+        next(call["first_token_latency"] for call in trace["llm_calls"] if "first_token_latency" in call)
+        for trace in sink.traces
+        if any("first_token_latency" in call for call in trace["llm_calls"])
+    ]
+    report = {
+        "mode": args.mode,
+        "sessions": args.sessions,
+        "turns": len(sink.traces),
+        "errors": sum(1 for trace in sink.traces if trace["error"]),
+        "routed_turns": sum(1 for trace in sink.traces if trace["route"]),
+        "prefetch_hits": sum(trace["prefetch"]["hits"] for trace in sink.traces if trace["prefetch"]),
+        "prefetch_discarded": sum(trace["prefetch"]["discarded"] for trace in sink.traces if trace["prefetch"]),
+        "tool_calls_coalesced": sum(
+            1 for trace in sink.traces for call in trace["tool_calls"] if call.get("coalesced")
+        ),
+        "elapsed_s": elapsed,
+        "throughput_turns_per_s": len(sink.traces) / elapsed if elapsed else 0.0,
+        "latency_p50_s": percentile(latencies, 0.50),
+        "latency_p95_s": percentile(latencies, 0.95),
+        "latency_p99_s": percentile(latencies, 0.99),
+        "first_token_p50_s": percentile(first_tokens, 0.50) if first_tokens else None,
+        "prompt_tokens_per_turn": statistics.mean(t["prompt_tokens"] for t in sink.traces) if sink.traces else 0,
+        "cached_tokens_per_turn": statistics.mean(t["cached_tokens"] for t in sink.traces) if sink.traces else 0,
+        "prefix_cache_hit_rate": (
+            sum(t["cached_tokens"] for t in sink.traces) / max(1, sum(t["prompt_tokens"] for t in sink.traces))
+        ),
+        "completion_tokens_per_turn": statistics.mean(t["completion_tokens"] for t in sink.traces) if sink.traces else 0,
+        "iterations_per_turn": statistics.mean(t["iterations"] for t in sink.traces) if sink.traces else 0,
+        "tools_bound_per_turn": (
+            statistics.mean(t["tools_bound"] for t in sink.traces if t["tools_bound"] is not None)
+            if any(t["tools_bound"] is not None for t in sink.traces) else 0
+        ),
+        "memory_per_session_kb": session_bytes / args.sessions / 1024,
+        "sofascore_requests": sofascore_config.requests,
+    }
+
+    print("=" * 60)
+    print("BENCHMARK DO AGENTE (servidores simulados)")
+    print("=" * 60)
+    for key, value in report.items():
+        if isinstance(value, float):
+            print(f"{key:<28} {value:>12.4f}")
+        else:
+            print(f"{key:<28} {str(value):>12}")
+    print("=" * 60)
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark da ingestão de partidas
+
+Compara, para as páginas de eventos do SofaScore simulado, a leitura com
+`json.loads` do corpo inteiro e a leitura incremental de `JsonArrayStream`
+(tempo e pico de memória medido com tracemalloc), e o custo de montar o
+`MatchStore` e de responder às consultas das ferramentas.
+
+Execute: python -m benchmarks.bench_matches [--seasons 10] [--repeat 5]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from src.ingestion.matches import CHUNK_SIZE
+from src.ingestion.sofascore import parse_event
+from src.ingestion.stream_json import JsonArrayStream
+from src.tools.match_store import MatchStore
+
+from .fake_sofascore import season_events
+
+
+def _chunks(body: bytes):
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start:start + CHUNK_SIZE]
+
+
+def parse_full(body: bytes) -> list:
+    """Documento inteiro em memória, convertido depois"""
+    return [parse_event(event) for event in json.loads(body)["events"]]
+
+
+def parse_stream(body: bytes) -> list:
+    """Um evento por vez, convertido assim que é lido"""
+    return [parse_event(event) for event in JsonArrayStream(_chunks(body), "events")]
+
+
+def measure(func: Callable, body: bytes, repeat: int) -> Tuple[float, int]:
+    """Retorna (melhor tempo em segundos, pico de memória em bytes)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(body)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def build_body(seasons: int) -> bytes:
+    """Uma página com as partidas de várias temporadas simuladas (IDs distintos)"""
+    events: List[dict] = []
+    for season in range(seasons):
+        for event in season_events():
+            events.append({**event, "id": event["id"] + season * 1_000_000})
+    return json.dumps({"events": events, "hasNextPage": False}).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da ingestão de partidas")
+    parser.add_argument("--seasons", type=int, default=10, help="Temporadas simuladas na página")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por medição (reporta a melhor)")
+    args = parser.parse_args()
+
+    body = build_body(args.seasons)
+    full_time, full_peak = measure(parse_full, body, args.repeat)
+    stream_time, stream_peak = measure(parse_stream, body, args.repeat)
+
+    records = parse_stream(body)
+    started = time.perf_counter()
+    store = MatchStore(records)
+    build_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for team in store.teams:
+        store.last_matches(team)
+        store.split(team)
+    store.round_matches()
+    query_time = (time.perf_counter() - started) / (2 * len(store.teams) + 1)
+
+    print("=" * 60)
+    print(f"INGESTÃO DE PARTIDAS ({len(records)} partidas, {len(body) / 1024:.0f} KB)")
+    print("=" * 60)
+    print(f"{'':<24}{'tempo (ms)':>16}{'pico (KB)':>16}")
+    print(f"{'json.loads':<24}{1000 * full_time:>16.1f}{full_peak / 1024:>16.0f}")
+    print(f"{'JsonArrayStream':<24}{1000 * stream_time:>16.1f}{stream_peak / 1024:>16.0f}")
+    print("-" * 60)
+    print(f"{'MatchStore (montagem)':<24}{1000 * build_time:>16.1f}")
+    print(f"{'consulta (média)':<24}{1000 * query_time:>16.3f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
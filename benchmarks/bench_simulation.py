@@ -0,0 +1,65 @@
+"""
+Benchmark da simulação Monte Carlo da temporada
+
+Monta a classificação e as partidas restantes a partir da temporada simulada
+do SofaScore local (30 rodadas disputadas, 8 restantes) e mede o tempo de
+`simulate_season` no próprio processo e com um pool de processos.
+
+Execute: python -m benchmarks.bench_simulation [--runs 100000] [--workers 0 2 4]
+"""
+import argparse
+import time
+
+from src.ingestion.sofascore import parse_event
+from src.tools.match_store import MatchStore
+from src.tools.simulation import simulate_season
+from src.tools.standings_store import StandingsStore
+
+from .fake_sofascore import season_events
+
+
+def build_inputs():
+    """Classificação calculada das partidas encerradas e o calendário restante"""
+    matches = MatchStore([parse_event(event) for event in season_events()])
+    rows = []
+    for team in matches.teams:
+        total = matches.split(team)["total"]
+        rows.append({"time": team, "sigla": "", **{key: value for key, value in total.items() if key != "aproveitamento"}})
+    rows.sort(key=lambda row: (-row["pontos"], -row["vitorias"], -row["saldo_gols"]))
+    for position, row in enumerate(rows, start=1):
+        row["posicao"] = position
+    return StandingsStore(rows), matches.pending_fixtures()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da simulação da temporada")
+    parser.add_argument("--runs", type=int, default=100_000, help="Simulações por medição")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2], help="Processos (0 = no próprio processo)")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por medição (reporta a melhor)")
+    args = parser.parse_args()
+
+    standings, fixtures = build_inputs()
+
+    print("=" * 60)
+    print(f"SIMULAÇÃO DA TEMPORADA ({args.runs} simulações, {len(fixtures)} partidas restantes)")
+    print("=" * 60)
+    for workers in args.workers:
+        # A primeira chamada com pool inclui a criação dos processos
+        started = time.perf_counter()
+        result = simulate_season(standings, fixtures, args.runs, workers, seed=1)
+        first = time.perf_counter() - started
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            simulate_season(standings, fixtures, args.runs, workers, seed=1)
+            best = min(best, time.perf_counter() - started)
+
+        leader = result["probabilidades"][0]
+        print(f"workers={workers:<3} primeira={first:8.3f}s  melhor={best:8.3f}s  "
+              f"{leader['time']}: título {leader['titulo']}%")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Benchmark de inicialização (cold start) do app
+
+Cada medição roda em um processo Python novo, como uma réplica recém-criada:
+
+- import_config: `from src.config import settings`
+- import_src: `import src`
+- first_paint: primeira execução do app.py (Streamlit AppTest) até a tela pronta
+- new_session_paint: nova sessão no mesmo processo (réplica já aquecida)
+- first_message: primeira mensagem da sessão, enviada após --think-time
+  segundos (o usuário digitando), com modelo e SofaScore simulados e latência
+  zero: mede só o custo de montar o agente e processar o turno
+
+Execute: python -m benchmarks.bench_startup --runs 5 --think-time 3
+"""
+import argparse
+import json
+import os
+import statistics
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+PROBES = ["import_config", "import_src", "first_paint", "new_session_paint", "first_message"]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _app_probe(think_time: float) -> dict:
+    """Mede a abertura do app e a primeira mensagem (servidores simulados já no ambiente)"""
+    from streamlit.testing.v1 import AppTest
+
+    app_path = os.path.join(ROOT, "app.py")
+    started = time.perf_counter()
+    app = AppTest.from_file(app_path, default_timeout=60).run()
+    first_paint = time.perf_counter() - started
+    modules_after_paint = len(sys.modules)
+    llm_client_loaded = "langchain_openai" in sys.modules
+
+    started = time.perf_counter()
+    AppTest.from_file(app_path, default_timeout=60).run()
+    new_session_paint = time.perf_counter() - started
+
+    time.sleep(think_time)
+    started = time.perf_counter()
+    app.chat_input[0].set_value("Quantos pontos tem o Flamengo e o Palmeiras?").run()
+    first_message = time.perf_counter() - started
+
+    return {
+        "first_paint": first_paint,
+        "new_session_paint": new_session_paint,
+        "first_message": first_message,
+        "modules_after_paint": modules_after_paint,
+        "llm_client_loaded_at_paint": llm_client_loaded,
+        "errors": [str(element.value) for element in [*app.exception, *app.error]],
+    }
+
+
+def _run_probe(name: str, think_time: float) -> dict:
+    """Executa uma medição no processo atual"""
+    started = time.perf_counter()
+    if name == "import_config":
+        from src.config import settings  # noqa: F401
+    elif name == "import_src":
+        import src  # noqa: F401
+    else:
+        return _app_probe(think_time)
+    return {name: time.perf_counter() - started, "modules": len(sys.modules)}
+
+
+def _wait_for_port(port: int, timeout: float = 30.0):
+    """Aguarda um servidor local aceitar conexões"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+@contextmanager
+def fake_servers():
+    """
+    Sobe o modelo e o SofaScore simulados em processos separados
+
+    Fora do processo medido, para que as importações dos servidores não
+    contem (nem escondam) o custo de inicialização do app.
+
+    Yields:
+        Variáveis de ambiente que apontam o app para os servidores
+    """
+    from .bench_agent import _free_port
+
+    openai_port, sofascore_port = _free_port(), _free_port()
+    servers = [
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.fake_openai", "--port", str(openai_port),
+             "--first-token-latency", "0", "--token-latency", "0"],
+            cwd=ROOT, stdout=subprocess.DEVNULL,
+        ),
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.fake_sofascore", "--port", str(sofascore_port), "--latency", "0"],
+            cwd=ROOT, stdout=subprocess.DEVNULL,
+        ),
+    ]
+    try:
+        _wait_for_port(openai_port)
+        _wait_for_port(sofascore_port)
+        yield {
+            "OPENAI_API_KEY": "sk-benchmark",
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{openai_port}/v1",
+            "SOFASCORE_BASE_URL": f"http://127.0.0.1:{sofascore_port}/api/v1",
+            "STANDINGS_SOURCE": "network",
+        }
+    finally:
+        for server in servers:
+            server.terminate()
+            server.wait()
+
+
+def _spawn(name: str, env: dict, think_time: float) -> dict:
+    """Executa uma medição em um processo novo"""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--probe", name, "--think-time", str(think_time)],
+        cwd=ROOT,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização do app")
+    parser.add_argument("--runs", type=int, default=5, help="Processos por medição (reporta a mediana)")
+    parser.add_argument("--think-time", type=float, default=3.0, help="Pausa antes da primeira mensagem (s)")
+    parser.add_argument("--probe", choices=["import_config", "import_src", "app"], help=argparse.SUPPRESS)
+    parser.add_argument("--json", dest="json_output", help="Grava o relatório também em JSON")
+    args = parser.parse_args()
+
+    if args.probe:
+        print(json.dumps(_run_probe(args.probe, args.think_time)))
+        return
+
+    samples = {probe: [] for probe in PROBES}
+    extra = {}
+    with fake_servers() as env:
+        for _ in range(args.runs):
+            for probe in ("import_config", "import_src"):
+                samples[probe].append(_spawn(probe, env, args.think_time)[probe])
+            result = _spawn("app", env, args.think_time)
+            for probe in ("first_paint", "new_session_paint", "first_message"):
+                samples[probe].append(result[probe])
+            extra = {key: result[key] for key in ("modules_after_paint", "llm_client_loaded_at_paint", "errors")}
+
+    report = {f"{probe}_s": statistics.median(values) for probe, values in samples.items()}
+    report.update(extra)
+
+    print("=" * 60)
+    print(f"BENCHMARK DE INICIALIZAÇÃO (mediana de {args.runs} processos)")
+    print("=" * 60)
+    for key, value in report.items():
+        if isinstance(value, float):
+            print(f"{key:<28} {value:>12.4f}")
+        else:
+            print(f"{key:<28} {str(value):>12}")
+    print("=" * 60)
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
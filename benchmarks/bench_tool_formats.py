@@ -0,0 +1,62 @@
+"""
+Benchmark de tokens por formato de saída das ferramentas
+
+Mede quantos tokens cada formato de `src/tools/formatting.py` gera para os
+resultados típicos das ferramentas da classificação.
+
+Execute: python -m benchmarks.bench_tool_formats [--model gpt-4o-mini]
+"""
+import argparse
+
+from src.agents.tokens import _get_encoder, count_tokens
+from src.tools.agent_tools import get_mock_brasileirao_data
+from src.tools.formatting import FORMATS, format_result
+from src.tools.standings_store import StandingsStore
+
+
+def build_samples() -> dict:
+    """Resultados representativos de cada ferramenta, a partir dos dados de exemplo"""
+    data = get_mock_brasileirao_data()
+    store = StandingsStore.from_table(data)
+
+    return {
+        "TabelaBrasileirão": data,
+        "ConsultarTime": {"success": True, "time": store.team("Flamengo")},
+        "ZonaClassificacao": {"success": True, "zona": "z4", "classificacao": store.zone("z4")},
+        "CompararTimes": {"success": True, **store.compare("Palmeiras", "Botafogo")},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tokens por formato de saída das ferramentas")
+    parser.add_argument("--model", default="gpt-4o-mini", help="Modelo usado para contar tokens")
+    args = parser.parse_args()
+
+    samples = build_samples()
+    exact = _get_encoder(args.model) is not None
+
+    print("=" * 90)
+    print(f"TOKENS POR FORMATO ({'tiktoken' if exact else 'estimativa ~4 caracteres/token'})")
+    print("=" * 90)
+    print(f"{'Ferramenta':<20}" + "".join(f"{fmt:>14}" for fmt in FORMATS))
+    print("-" * 90)
+
+    totals = {fmt: 0 for fmt in FORMATS}
+    for tool_name, sample in samples.items():
+        counts = {fmt: count_tokens(format_result(sample, fmt), args.model) for fmt in FORMATS}
+        for fmt, count in counts.items():
+            totals[fmt] += count
+        print(f"{tool_name:<20}" + "".join(f"{counts[fmt]:>14d}" for fmt in FORMATS))
+
+    print("-" * 90)
+    print(f"{'Total':<20}" + "".join(f"{totals[fmt]:>14d}" for fmt in FORMATS))
+
+    baseline = totals["json"]
+    print("\nEconomia em relação ao JSON indentado:")
+    for fmt in FORMATS:
+        print(f"  {fmt:<14} {100 * (1 - totals[fmt] / baseline):6.1f}%")
+    print("=" * 90)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Servidor local compatível com o endpoint /v1/chat/completions da OpenAI
+
+Substitui o modelo real nos benchmarks: responde sem chave de API e sem
+rede, com latência, falhas e padrão de chamadas de ferramenta configuráveis.
+Simula também o cache de prefixo do provedor: a parte inicial do prompt
+(ferramentas + mensagens) já vista em uma requisição anterior é reportada em
+`usage.prompt_tokens_details.cached_tokens`.
+
+Execute isoladamente: python -m benchmarks.fake_openai --port 8001
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+class FakeLLMConfig:
+    """Comportamento do modelo simulado"""
+
+    def __init__(
+        self,
+        first_token_latency: float = 0.3,
+        token_latency: float = 0.01,
+        failure_rate: float = 0.0,
+        tool_call_rate: float = 1.0,
+        tool_name: str = "TabelaBrasileirão",
+        answer_tokens: int = 60,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            first_token_latency: Segundos até o primeiro token
+            token_latency: Segundos por token gerado
+            failure_rate: Fração de requisições respondidas com HTTP 500
+            tool_call_rate: Probabilidade de o primeiro turno pedir uma ferramenta
+            tool_name: Ferramenta pedida (se presente na lista enviada pelo cliente)
+            answer_tokens: Tamanho aproximado da resposta final, em tokens
+            seed: Semente do gerador aleatório
+        """
+        self.first_token_latency = first_token_latency
+        self.token_latency = token_latency
+        self.failure_rate = failure_rate
+        self.tool_call_rate = tool_call_rate
+        self.tool_name = tool_name
+        self.answer_tokens = answer_tokens
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.seen_prefixes = set()
+
+    def roll(self, probability: float) -> bool:
+        with self.lock:
+            return self.random.random() < probability
+
+
+def _estimate_tokens(messages: List[Dict[str, Any]], tools: List[Dict[str, Any]]) -> int:
+    """Estimativa de tokens do prompt (~4 caracteres por token)"""
+    chars = sum(len(str(message.get("content") or "")) for message in messages)
+    chars += len(json.dumps(tools))
+    return max(1, chars // 4)
+
+
+# Como no provedor real: cache só a partir de 1024 tokens, em blocos de 128
+CACHE_MIN_TOKENS = 1024
+CACHE_BLOCK_TOKENS = 128
+
+
+def _cached_prefix_tokens(config: FakeLLMConfig, messages: List[Dict[str, Any]], tools: List[Dict[str, Any]]) -> int:
+    """Tokens do maior prefixo (em mensagens inteiras) já enviado antes"""
+    digest = hashlib.sha1(json.dumps(tools, sort_keys=True).encode("utf-8"))
+    prefixes = []
+    for i, message in enumerate(messages):
+        digest.update(json.dumps(message, sort_keys=True).encode("utf-8"))
+        prefixes.append((digest.hexdigest(), i + 1))
+
+    cached_messages = 0
+    with config.lock:
+        for key, count in prefixes:
+            if key in config.seen_prefixes:
+                cached_messages = count
+        config.seen_prefixes.update(key for key, _ in prefixes)
+
+    if cached_messages == 0:
+        return 0
+    tokens = _estimate_tokens(messages[:cached_messages], tools)
+    if tokens < CACHE_MIN_TOKENS:
+        return 0
+    return tokens // CACHE_BLOCK_TOKENS * CACHE_BLOCK_TOKENS
+
+
+def _plan_response(config: FakeLLMConfig, body: Dict[str, Any]) -> Dict[str, Any]:
+    """Decide se o turno é uma chamada de ferramenta ou uma resposta de texto"""
+    messages = body.get("messages", [])
+    tools = [tool["function"]["name"] for tool in body.get("tools", []) if "function" in tool]
+    last_role = messages[-1].get("role") if messages else "user"
+
+    if last_role != "tool" and config.tool_name in tools and config.roll(config.tool_call_rate):
+        return {
+            "tool_calls": [{
+                "id": f"call_{uuid.uuid4().hex[:8]}",
+                "type": "function",
+                "function": {"name": config.tool_name, "arguments": "{}"},
+            }],
+            "completion_tokens": 12,
+        }
+
+    words = ["Segundo", "a", "tabela", "atual", "do", "Brasileirão,", "o", "líder", "é", "o", "Botafogo."]
+    content = " ".join(words[i % len(words)] for i in range(config.answer_tokens))
+    return {"content": content, "completion_tokens": config.answer_tokens}
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Handler HTTP do modelo simulado"""
+
+    config: FakeLLMConfig = FakeLLMConfig()
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_event(self, payload: Any):
+        data = payload if isinstance(payload, str) else json.dumps(payload)
+        chunk = f"data: {data}\n\n".encode("utf-8")
+        self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        config = self.config
+
+        if config.roll(config.failure_rate):
+            self._send_json(500, {"error": {"message": "falha simulada", "type": "server_error"}})
+            return
+
+        plan = _plan_response(config, body)
+        messages, tools = body.get("messages", []), body.get("tools", [])
+        usage = {
+            "prompt_tokens": _estimate_tokens(messages, tools),
+            "completion_tokens": plan["completion_tokens"],
+            "prompt_tokens_details": {"cached_tokens": _cached_prefix_tokens(config, messages, tools)},
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        base = {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "created": int(time.time()),
+            "model": body.get("model", "fake-model"),
+        }
+        finish_reason = "tool_calls" if "tool_calls" in plan else "stop"
+
+        if body.get("stream"):
+            self._stream(base, plan, usage, finish_reason, body)
+            return
+
+        time.sleep(config.first_token_latency + config.token_latency * plan["completion_tokens"])
+        message = {"role": "assistant", "content": plan.get("content")}
+        if "tool_calls" in plan:
+            message["tool_calls"] = plan["tool_calls"]
+        self._send_json(200, {
+            **base,
+            "object": "chat.completion",
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": usage,
+        })
+
+    def _stream(self, base, plan, usage, finish_reason, body):
+        config = self.config
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def chunk(delta, finish=None):
+            return {
+                **base,
+                "object": "chat.completion.chunk",
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+            }
+
+        time.sleep(config.first_token_latency)
+        self._send_event(chunk({"role": "assistant", "content": ""}))
+
+        if "tool_calls" in plan:
+            calls = [{"index": i, **call} for i, call in enumerate(plan["tool_calls"])]
+            self._send_event(chunk({"tool_calls": calls}))
+        else:
+            for word in plan["content"].split(" "):
+                time.sleep(config.token_latency)
+                self._send_event(chunk({"content": word + " "}))
+
+        self._send_event(chunk({}, finish_reason))
+        if (body.get("stream_options") or {}).get("include_usage"):
+            self._send_event({**base, "object": "chat.completion.chunk", "choices": [], "usage": usage})
+        self._send_event("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def start_fake_openai(config: FakeLLMConfig, port: int = 0) -> ThreadingHTTPServer:
+    """
+    Inicia o servidor em uma thread de fundo
+
+    Args:
+        config: Comportamento do modelo simulado
+        port: Porta local (0 = escolhe uma livre)
+
+    Returns:
+        Servidor em execução (use `server.server_port` para a porta)
+    """
+    handler = type("ConfiguredFakeOpenAIHandler", (FakeOpenAIHandler,), {"config": config})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor OpenAI simulado")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--first-token-latency", type=float, default=0.3)
+    parser.add_argument("--token-latency", type=float, default=0.01)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--tool-call-rate", type=float, default=1.0)
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(
+        first_token_latency=args.first_token_latency,
+        token_latency=args.token_latency,
+        failure_rate=args.failure_rate,
+        tool_call_rate=args.tool_call_rate,
+    )
+    server = start_fake_openai(config, args.port)
+    print(f"OpenAI simulado em http://127.0.0.1:{server.server_port}/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
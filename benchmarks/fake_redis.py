@@ -0,0 +1,157 @@
+"""
+Servidor local que fala o protocolo do Redis (RESP)
+
+Implementa apenas os comandos usados pelo RedisHistoryStore (listas com
+expiração e transações), para testar o histórico externo sem um Redis real.
+
+Execute isoladamente: python -m benchmarks.fake_redis --port 6399
+"""
+import argparse
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class FakeRedisState:
+    """Dados do servidor simulado"""
+
+    def __init__(self):
+        self.lists: Dict[bytes, List[bytes]] = {}
+        self.expires: Dict[bytes, float] = {}
+        self.lock = threading.Lock()
+        self.commands = 0
+
+    def _expire_if_needed(self, key: bytes):
+        deadline = self.expires.get(key)
+        if deadline is not None and time.time() >= deadline:
+            self.lists.pop(key, None)
+            self.expires.pop(key, None)
+
+    def execute(self, command: List[bytes]):
+        """Executa um comando e retorna a resposta (str = status, Exception = erro)"""
+        name = command[0].upper()
+        args = command[1:]
+        with self.lock:
+            self.commands += 1
+            for key in args[:1]:
+                self._expire_if_needed(key)
+
+            if name == b"PING":
+                return "PONG"
+            if name in (b"SELECT", b"AUTH"):
+                return "OK"
+            if name == b"RPUSH":
+                items = self.lists.setdefault(args[0], [])
+                items.extend(args[1:])
+                return len(items)
+            if name == b"LRANGE":
+                items = self.lists.get(args[0], [])
+                start, stop = int(args[1]), int(args[2])
+                stop = len(items) if stop == -1 else stop + 1
+                return items[start:stop]
+            if name == b"DEL":
+                removed = 0
+                for key in args:
+                    removed += self.lists.pop(key, None) is not None
+                    self.expires.pop(key, None)
+                return removed
+            if name == b"EXPIRE":
+                if args[0] not in self.lists:
+                    return 0
+                self.expires[args[0]] = time.time() + int(args[1])
+                return 1
+        return ValueError(f"ERR unknown command '{name.decode()}'")
+
+
+def _encode(reply) -> bytes:
+    if isinstance(reply, Exception):
+        return f"-{reply}\r\n".encode()
+    if isinstance(reply, str):
+        return f"+{reply}\r\n".encode()
+    if isinstance(reply, int):
+        return f":{reply}\r\n".encode()
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    return b"*%d\r\n" % len(reply) + b"".join(_encode(item) for item in reply)
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Conexão de um cliente"""
+
+    state: FakeRedisState = FakeRedisState()
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        command = []
+        for _ in range(count):
+            length = int(self.rfile.readline()[1:-2])
+            command.append(self.rfile.read(length + 2)[:-2])
+        return command
+
+    def handle(self):
+        queued: Optional[List[List[bytes]]] = None
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+
+            name = command[0].upper()
+            if name == b"MULTI":
+                queued = []
+                reply = "OK"
+            elif name == b"EXEC":
+                reply = [self.state.execute(queued_command) for queued_command in queued or []]
+                queued = None
+            elif queued is not None:
+                queued.append(command)
+                reply = "QUEUED"
+            else:
+                reply = self.state.execute(command)
+
+            self.wfile.write(_encode(reply))
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def start_fake_redis(port: int = 0, state: Optional[FakeRedisState] = None) -> socketserver.ThreadingTCPServer:
+    """
+    Inicia o servidor em uma thread de fundo
+
+    Args:
+        port: Porta local (0 = escolhe uma livre)
+        state: Dados do servidor (padrão: um estado novo)
+
+    Returns:
+        Servidor em execução (use `server.server_address[1]` para a porta)
+    """
+    handler = type("ConfiguredFakeRedisHandler", (FakeRedisHandler,), {"state": state or FakeRedisState()})
+    server = _Server(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, name="fake-redis", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis simulado")
+    parser.add_argument("--port", type=int, default=6399)
+    args = parser.parse_args()
+
+    server = start_fake_redis(args.port)
+    print(f"Redis simulado em redis://127.0.0.1:{server.server_address[1]}/0")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Servidor local que imita os endpoints de classificação e de partidas do SofaScore
+
+Execute isoladamente: python -m benchmarks.fake_sofascore --port 8002
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from src.tools.agent_tools import get_mock_brasileirao_data
+
+
+class FakeSofaScoreConfig:
+    """Comportamento da API simulada"""
+
+    def __init__(self, latency: float = 0.2, failure_rate: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            latency: Segundos de espera por resposta
+            failure_rate: Fração de requisições respondidas com HTTP 403
+            seed: Semente do gerador aleatório
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def roll(self) -> bool:
+        with self.lock:
+            self.requests += 1
+            return self.random.random() < self.failure_rate
+
+
+def standings_payload() -> Dict[str, Any]:
+    """Classificação de exemplo no formato da API do SofaScore"""
+    rows = []
+    for team in get_mock_brasileirao_data()["classificacao"]:
+        rows.append({
+            "position": team["posicao"],
+            "team": {"name": team["time"], "shortName": team["sigla"]},
+            "points": team["pontos"],
+            "matches": team["jogos"],
+            "wins": team["vitorias"],
+            "draws": team["empates"],
+            "losses": team["derrotas"],
+            "scoresFor": team["gols_pro"],
+            "scoresAgainst": team["gols_contra"],
+        })
+    return {"standings": [{"rows": rows}]}
+
+
+# Temporada simulada: turno e returno, com as primeiras rodadas já disputadas
+PLAYED_ROUNDS = 30
+EVENTS_PER_PAGE = 30
+SEASON_START = 1_744_470_000  # 12/04/2025 16:00 BRT
+
+
+def season_events(played_rounds: int = PLAYED_ROUNDS) -> List[Dict[str, Any]]:
+    """
+    Partidas de exemplo no formato do SofaScore (turno e returno determinísticos)
+
+    Cada evento traz campos que o app não usa, como nas respostas reais, para
+    que o tamanho das páginas seja realista.
+    """
+    teams = [(team["time"], team["sigla"]) for team in get_mock_brasileirao_data()["classificacao"]]
+    rng = random.Random(2025)
+    order = list(range(len(teams)))
+    events = []
+    half = len(order) - 1
+
+    for rodada in range(1, 2 * half + 1):
+        # Método do círculo: o primeiro time fica fixo e os demais giram a cada rodada
+        rotation = order[:1] + order[1:][-(rodada - 1) % half:] + order[1:][:-(rodada - 1) % half or None]
+        # Mando equilibrado no turno (o time fixo alterna a cada rodada); o returno inverte o turno
+        pairs = [
+            (rotation[i], rotation[-1 - i]) if (i % 2 if i else (rodada - 1) % half % 2) else (rotation[-1 - i], rotation[i])
+            for i in range(len(order) // 2)
+        ]
+        if rodada > half:
+            pairs = [(away, home) for home, away in pairs]
+
+        for slot, (home, away) in enumerate(pairs):
+            finished = rodada <= played_rounds
+            event = {
+                "id": 13_000_000 + rodada * 100 + slot,
+                "slug": f"{teams[home][1].lower()}-{teams[away][1].lower()}",
+                "customId": f"x{rodada}{slot}",
+                "tournament": {"name": "Brasileirão Série A", "slug": "brasileirao-serie-a", "priority": 10},
+                "season": {"name": "Brasileirão 2025", "year": "2025", "id": 72034},
+                "roundInfo": {"round": rodada},
+                "status": {
+                    "code": 100 if finished else 0,
+                    "description": "Ended" if finished else "Not started",
+                    "type": "finished" if finished else "notstarted",
+                },
+                "homeTeam": {"name": teams[home][0], "nameCode": teams[home][1], "slug": teams[home][0].lower(),
+                             "teamColors": {"primary": "#000000", "secondary": "#ffffff", "text": "#ffffff"}},
+                "awayTeam": {"name": teams[away][0], "nameCode": teams[away][1], "slug": teams[away][0].lower(),
+                             "teamColors": {"primary": "#000000", "secondary": "#ffffff", "text": "#ffffff"}},
+                "homeScore": {},
+                "awayScore": {},
+                "time": {"injuryTime1": 2, "injuryTime2": 5, "currentPeriodStartTimestamp": 0},
+                "changes": {"changes": ["status.code", "homeScore.current"], "changeTimestamp": 0},
+                "hasGlobalHighlights": False,
+                "startTimestamp": SEASON_START + (rodada - 1) * 7 * 86400 + slot * 3 * 3600,
+            }
+            if finished:
+                home_goals, away_goals = rng.randint(0, 3), rng.randint(0, 2)
+                event["homeScore"] = {"current": home_goals, "display": home_goals, "period1": home_goals // 2}
+                event["awayScore"] = {"current": away_goals, "display": away_goals, "period1": away_goals // 2}
+            events.append(event)
+    return events
+
+
+def events_pages(events: List[Dict[str, Any]]) -> Dict[str, List[bytes]]:
+    """
+    Páginas de "last" (da mais recente para a mais antiga) e de "next"
+
+    Returns:
+        Mapa direção -> corpos JSON das páginas
+    """
+    finished = [event for event in events if event["status"]["type"] == "finished"]
+    upcoming = [event for event in events if event["status"]["type"] != "finished"]
+    pages = {}
+    for direction, items in (("last", finished[::-1]), ("next", upcoming)):
+        chunks = [items[start:start + EVENTS_PER_PAGE] for start in range(0, len(items), EVENTS_PER_PAGE)]
+        # "last" lista cada página em ordem cronológica, como o SofaScore
+        pages[direction] = [
+            json.dumps({
+                "events": page[::-1] if direction == "last" else page,
+                "hasNextPage": number < len(chunks) - 1,
+            }).encode("utf-8")
+            for number, page in enumerate(chunks)
+        ]
+    return pages
+
+
+EVENTS_PATH = re.compile(r"/events/(last|next)/(\d+)$")
+
+
+class FakeSofaScoreHandler(BaseHTTPRequestHandler):
+    """Handler HTTP da API simulada"""
+
+    config: FakeSofaScoreConfig = FakeSofaScoreConfig()
+    payload = json.dumps(standings_payload()).encode("utf-8")
+    pages = events_pages(season_events())
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.config.latency)
+
+        if self.config.roll():
+            self.send_response(403)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = None
+        if self.path.endswith("/standings/total"):
+            body = self.payload
+        else:
+            events = EVENTS_PATH.search(self.path)
+            if events:
+                pages = self.pages[events.group(1)]
+                number = int(events.group(2))
+                body = pages[number] if number < len(pages) else None
+
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_fake_sofascore(config: FakeSofaScoreConfig, port: int = 0) -> ThreadingHTTPServer:
+    """
+    Inicia o servidor em uma thread de fundo
+
+    Args:
+        config: Comportamento da API simulada
+        port: Porta local (0 = escolhe uma livre)
+
+    Returns:
+        Servidor em execução (use `server.server_port` para a porta)
+    """
+    handler = type("ConfiguredFakeSofaScoreHandler", (FakeSofaScoreHandler,), {"config": config})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-sofascore", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SofaScore simulado")
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = start_fake_sofascore(FakeSofaScoreConfig(args.latency, args.failure_rate), args.port)
+    print(f"SofaScore simulado em http://127.0.0.1:{server.server_port}/api/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
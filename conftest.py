@@ -0,0 +1,10 @@
+"""
+Configuração do pytest para os testes na raiz do projeto
+
+As configurações são lidas na importação de `src.config`: a chave precisa
+existir antes de qualquer teste importar o pacote (nenhuma chamada ao modelo
+é feita nos testes).
+"""
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
@@ -1,13 +1,14 @@
-"""Módulo principal src"""
-from .agents import ConversationalAgent, create_agent
-from .config import settings
-from .prompts import prompt_loader
-from .tools import get_all_tools
+"""Módulo principal src
 
-__all__ = [
-    "ConversationalAgent",
-    "create_agent",
-    "settings",
-    "prompt_loader",
-    "get_all_tools",
-]
+Os nomes abaixo são importados sob demanda (ver `_lazy`): importar `src` ou
+um subpacote leve como `src.config` não carrega o agente.
+"""
+from ._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "ConversationalAgent": ".agents",
+    "create_agent": ".agents",
+    "settings": ".config",
+    "prompt_loader": ".prompts",
+    "get_all_tools": ".tools",
+})
@@ -0,0 +1,39 @@
+"""
+Importação sob demanda dos atributos de um pacote (PEP 562)
+
+Os `__init__.py` declaram de qual submódulo vem cada nome exportado; o
+submódulo só é importado no primeiro acesso ao nome. Assim `import src` ou
+`from src.config import settings` não carregam o LangChain, o cliente da
+OpenAI nem as bibliotecas HTTP antes de serem necessários.
+"""
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable, List[str]]:
+    """
+    Cria o `__getattr__`, o `__dir__` e o `__all__` de um pacote
+
+    Args:
+        package: Nome do pacote (`__name__` do `__init__.py`)
+        exports: Mapa nome exportado -> submódulo relativo (ex.: ".agent_tools")
+
+    Returns:
+        Tupla (__getattr__, __dir__, __all__)
+    """
+    module = sys.modules[package]
+
+    def __getattr__(name: str):
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source, package), name)
+        # Os próximos acessos não passam mais por aqui
+        module.__dict__[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__, list(exports)
@@ -1,4 +1,26 @@
-"""Módulo de agentes"""
-from .conversational_agent import ConversationalAgent, create_agent
+"""Módulo de agentes (submódulos importados sob demanda)"""
+from .._lazy import lazy_exports
 
-__all__ = ["ConversationalAgent", "create_agent"]
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "ConversationalAgent": ".conversational_agent",
+    "create_agent": ".conversational_agent",
+    "AgentResources": ".resources",
+    "get_agent_resources": ".resources",
+    "clear_agent_resources": ".resources",
+    "ConversationMemory": ".memory",
+    "HistoryStore": ".history",
+    "InMemoryHistoryStore": ".history",
+    "SQLiteHistoryStore": ".history",
+    "RedisHistoryStore": ".history",
+    "get_history_store": ".history",
+    "load_history": ".history",
+    "new_session_token": ".history",
+    "verify_session_token": ".history",
+    "ResponseCache": ".response_cache",
+    "get_response_cache": ".response_cache",
+    "Intent": ".router",
+    "IntentRouter": ".router",
+    "get_intent_router": ".router",
+    "SingleFlight": ".single_flight",
+    "get_tool_single_flight": ".single_flight",
+})
@@ -1,13 +1,37 @@
 """
 Módulo de implementação do agente de IA
 """
-from typing import List, Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
+import asyncio
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 
 from ..config import settings
-from ..tools import get_all_tools
 from ..prompts import prompt_loader
+from ..telemetry import TurnTrace, telemetry
+from ..tools import match_cache, standings_cache
+from .history import get_history_store
+from .memory import ConversationMemory
+from .prefetch import Prefetch, predict_tool_calls
+from .response_cache import get_response_cache
+from .router import get_intent_router
+from .single_flight import invoke_tool
+from .resources import AgentResources, get_agent_resources
+
+
+# Executor limitado compartilhado para rodar ferramentas síncronas no loop assíncrono
+_tool_executor = ThreadPoolExecutor(
+    max_workers=settings.TOOL_MAX_WORKERS,
+    thread_name_prefix="agent-tool",
+)
 
 
 class ConversationalAgent:
@@ -18,6 +42,8 @@ class ConversationalAgent:
         model_name: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        resources: Optional[AgentResources] = None,
+        session_id: Optional[str] = None,
     ):
         """
         Inicializa o agente conversacional
@@ -26,6 +52,8 @@ class ConversationalAgent:
             model_name: Nome do modelo OpenAI (padrão: configurado em .env)
             temperature: Temperatura do modelo (padrão: configurado em .env)
             max_tokens: Máximo de tokens na resposta (padrão: configurado em .env)
+            resources: Recursos fixos (padrão: os do pool do processo, trocados quando os prompts mudam)
+            session_id: Identificador da sessão (padrão: gerado automaticamente)
         """
         # Valida as configurações
         settings.validate()
@@ -34,46 +62,408 @@ class ConversationalAgent:
         self.model_name = model_name or settings.OPENAI_MODEL
         self.temperature = temperature if temperature is not None else settings.TEMPERATURE
         self.max_tokens = max_tokens or settings.MAX_TOKENS
+        self.session_id = session_id or uuid.uuid4().hex
+        
+        # Cliente LLM, ferramentas e prompt são compartilhados entre sessões; os
+        # do pool são consultados de novo a cada turno (recarga dos prompts)
+        self._pooled_resources = resources is None
+        if resources is None:
+            resources = get_agent_resources(self.model_name, self.temperature, self.max_tokens)
+        self._use_resources(resources)
         
-        # Inicializa o modelo LLM
-        self.llm = ChatOpenAI(
-            model=self.model_name,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            openai_api_key=settings.OPENAI_API_KEY,
+        # Ferramentas usadas no último turno, usadas para prever o próximo
+        self._last_turn_tools: Set[str] = set()
+        
+        # Inicializa a memória da conversa (única parte própria da sessão)
+        agent_prompts = prompt_loader.get_agent_prompts()
+        self.memory = ConversationMemory(
+            token_budget=settings.MEMORY_TOKEN_BUDGET,
+            summarizer=self._summarize if settings.MEMORY_SUMMARY_ENABLED else None,
+            model_name=self.model_name,
+            summary_prefix=agent_prompts.get("summary_context", "Resumo da conversa até aqui:"),
+            store=get_history_store(),
+            session_id=self.session_id,
         )
+    
+    def _use_resources(self, resources: AgentResources):
+        """Passa a usar um conjunto de recursos (cliente LLM, ferramentas e prompt)"""
+        self.resources = resources
+        self.llm = resources.llm
+        self.system_prompt = resources.system_prompt
+    
+    def _refresh_resources(self):
+        """
+        Troca os recursos do pool se os prompts mudaram em disco
         
-        # Carrega ferramentas
-        self.tools = get_all_tools()
+        Sessões abertas passam a usar o novo prompt do sistema e as novas
+        descrições das ferramentas já no turno seguinte.
+        """
+        if not self._pooled_resources:
+            return
+        resources = get_agent_resources(self.model_name, self.temperature, self.max_tokens)
+        if resources is not self.resources:
+            self._use_resources(resources)
+            self.memory.summary_prefix = prompt_loader.get_agent_prompts().get(
+                "summary_context", self.memory.summary_prefix
+            )
+    
+    @property
+    def tools(self) -> list:
+        """Todas as ferramentas disponíveis (construídas sob demanda)"""
+        return self.resources.tools
+    
+    @property
+    def llm_with_tools(self):
+        """Modelo com todas as ferramentas"""
+        return self.resources.llm_with_tools
+    
+    @property
+    def chat_history(self) -> List[BaseMessage]:
+        """Mensagens recentes mantidas na memória da conversa"""
+        return self.memory.messages
+    
+    def _summarize(self, previous_summary: str, messages: List[BaseMessage]) -> str:
+        """
+        Atualiza o resumo da conversa com as mensagens que saíram do histórico
         
-        # Vincula as ferramentas ao modelo
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
+        Args:
+            previous_summary: Resumo atual (pode ser vazio)
+            messages: Mensagens descartadas do histórico
         
-        # Configura o prompt do sistema
-        self.system_prompt = prompt_loader.get_system_prompt()
+        Returns:
+            Novo resumo
+        """
+        transcript = "\n".join(
+            f"{'Usuário' if isinstance(msg, HumanMessage) else 'Assistente'}: {msg.content}"
+            for msg in messages
+        )
+        summary_prompt = prompt_loader.get_agent_prompts().get("summary_prompt", "")
         
-        # Inicializa a memória da conversa
-        self.chat_history = []
+        try:
+            response = self.llm.invoke([
+                SystemMessage(content=summary_prompt),
+                HumanMessage(
+                    content=f"Resumo atual:\n{previous_summary or '(vazio)'}\n\n"
+                            f"Novas mensagens:\n{transcript}"
+                ),
+            ])
+            return response.content
+        except Exception as e:
+            print(f"[ERRO] Falha ao resumir histórico: {str(e)}")
+            return previous_summary
     
-    def _execute_tool(self, tool_name: str, tool_input: Any) -> str:
+    def _invoke_tool(self, tool_name: str, tool_input: Any) -> Tuple[str, Optional[str], bool]:
+        """
+        Executa uma ferramenta sem registrar a chamada
+        
+        Args:
+            tool_name: Nome da ferramenta
+            tool_input: Entrada da ferramenta
+        
+        Returns:
+            Tupla (resultado, mensagem de erro ou None, resultado compartilhado com outra chamada)
+        """
+        tool = self.resources.registry.get(tool_name)
+        if tool is None:
+            message = f"Ferramenta '{tool_name}' não encontrada."
+            return message, message, False
+        try:
+            # Chamadas idênticas de outras sessões em andamento compartilham a execução
+            output, coalesced = invoke_tool(tool, tool_input)
+        except Exception as e:
+            message = f"Erro ao executar ferramenta: {str(e)}"
+            return message, message, False
+        return output, None, coalesced
+    
+    def _execute_tool(self, tool_name: str, tool_input: Any, trace: Optional[TurnTrace] = None) -> str:
         """
         Executa uma ferramenta
         
         Args:
             tool_name: Nome da ferramenta
             tool_input: Entrada da ferramenta
+            trace: Registro do turno onde a latência da ferramenta é anotada
         
         Returns:
             Resultado da ferramenta
         """
-        for tool in self.tools:
-            if tool.name == tool_name:
-                try:
-                    return tool.func(tool_input)
-                except Exception as e:
-                    return f"Erro ao executar ferramenta: {str(e)}"
+        started = time.perf_counter()
+        output, error, coalesced = self._invoke_tool(tool_name, tool_input)
+        if trace is not None:
+            trace.record_tool_call(tool_name, time.perf_counter() - started, error, coalesced)
+        return output
+    
+    def _start_prefetch(self, user_input: str) -> Optional[Prefetch]:
+        """
+        Dispara em paralelo as ferramentas que o modelo provavelmente vai pedir
         
-        return f"Ferramenta '{tool_name}' não encontrada."
+        Args:
+            user_input: Mensagem do usuário
+        
+        Returns:
+            Chamadas especulativas em andamento ou None
+        """
+        if not settings.SPECULATIVE_PREFETCH:
+            return None
+        calls = []
+        for tool_name, tool_input in predict_tool_calls(user_input, self._last_turn_tools):
+            tool = self.resources.registry.get(tool_name)
+            if tool is not None:
+                calls.append((tool, tool_input))
+        return Prefetch(_tool_executor, calls, lambda tool, args: invoke_tool(tool, args)[0]) if calls else None
+    
+    def _bind_tools(self, user_input: str, trace: TurnTrace):
+        """
+        Modelo com as ferramentas do turno (conforme TOOL_SELECTION)
+        
+        Args:
+            user_input: Mensagem do usuário
+            trace: Registro do turno
+        
+        Returns:
+            Runnable com as ferramentas vinculadas
+        """
+        names = self.resources.select_tools(user_input, self._last_turn_tools)
+        trace.record_tools_bound(len(names))
+        return self.resources.bind(names)
+    
+    def _finish_prefetch(self, prefetch: Optional[Prefetch], trace: TurnTrace) -> None:
+        """Descarta as chamadas especulativas não usadas e registra o resultado"""
+        if prefetch is not None:
+            discarded = prefetch.discard()
+            trace.record_prefetch(prefetch.hits, discarded)
+    
+    def _prefetched_output(
+        self,
+        tool_name: str,
+        tool_input: Any,
+        future: Future,
+        trace: Optional[TurnTrace] = None,
+    ) -> str:
+        """Aguarda o resultado antecipado; se a chamada especulativa falhou, executa de novo"""
+        started = time.perf_counter()
+        try:
+            output = future.result(timeout=settings.TOOL_TIMEOUT)
+        except Exception:
+            return self._execute_tool(tool_name, tool_input, trace)
+        
+        if trace is not None:
+            # Só o tempo que o turno ainda esperou pela ferramenta
+            trace.record_tool_call(tool_name, time.perf_counter() - started)
+        return output
+    
+    def _end_turn(self, trace: TurnTrace, error: Optional[str], prefetch: Optional[Prefetch]):
+        """Encerra o turno: descarta especulações pendentes, libera o histórico e envia o registro"""
+        self._finish_prefetch(prefetch, trace)
+        if trace.llm_calls:
+            self._last_turn_tools = {call["name"] for call in trace.tool_calls}
+        # Com armazenamento externo, o histórico só fica em memória durante o turno
+        self.memory.release()
+        telemetry.finish_turn(trace, error)
+    
+    def _build_messages(self, user_input: str) -> List[BaseMessage]:
+        """
+        Constrói a lista de mensagens enviada ao modelo
+        
+        Args:
+            user_input: Mensagem do usuário
+        
+        Returns:
+            Lista com o prefixo fixo, o resumo, o histórico e a nova mensagem
+        """
+        # O prefixo fixo vem primeiro e é o mesmo objeto em todas as sessões,
+        # para que o cache de prefixo do provedor se aplique; o que varia
+        # (resumo, histórico e a pergunta) fica sempre depois dele
+        messages = [self.resources.system_message]
+        messages.extend(self.memory.context_messages())
+        messages.append(HumanMessage(content=user_input))
+        return messages
+    
+    def _remember(self, user_input: str, output: str):
+        """
+        Adiciona um turno completo à memória da conversa
+        
+        Args:
+            user_input: Mensagem do usuário
+            output: Resposta final do agente
+        """
+        # A memória aplica o orçamento de tokens e resume os turnos descartados
+        self.memory.add_turn(user_input, output)
+    
+    def _cache_key_version(self) -> Optional[str]:
+        """
+        Versão dos dados e dos prompts usada como chave do cache de respostas
+        
+        Só perguntas sem contexto anterior são cacheáveis: a mesma frase em
+        conversas diferentes pode depender do que foi dito antes. A chave
+        inclui as partidas (ferramentas de jogos e chances de título), sem
+        buscá-las: enquanto não forem carregadas a versão é "None", que muda
+        quando chegarem.
+        
+        Returns:
+            Versão da classificação, das partidas e dos prompts ou None se o turno não for cacheável
+        """
+        if not settings.RESPONSE_CACHE_ENABLED or self.memory.messages or self.memory.summary:
+            return None
+        standings_cache.get()
+        return f"{standings_cache.version}:{match_cache.version}:{self.resources.prompt_version}"
+    
+    def _cached_response(
+        self,
+        user_input: str,
+        data_version: Optional[str],
+        trace: Optional[TurnTrace] = None,
+    ) -> Optional[str]:
+        """Procura a resposta no cache e, em caso de acerto, registra o turno na memória"""
+        if data_version is None:
+            return None
+        output = get_response_cache().get(user_input, data_version)
+        if output is not None:
+            self._remember(user_input, output)
+            if trace is not None:
+                trace.record_cache_hit("response")
+        return output
+    
+    def _routed_response(self, user_input: str, trace: Optional[TurnTrace] = None) -> Optional[str]:
+        """
+        Responde pelo roteador de intenções, sem o modelo, quando possível
+        
+        Só no início da conversa: uma continuação (ex.: sobre a Série B ou uma
+        temporada passada) depende do que foi dito antes e vai para o agente.
+        """
+        if not settings.ROUTER_ENABLED or self.memory.messages or self.memory.summary:
+            return None
+        routed = get_intent_router().route(user_input)
+        if routed is None:
+            return None
+        intent, output = routed
+        self._remember(user_input, output)
+        if trace is not None:
+            trace.record_route(intent.name)
+        return output
+    
+    def _store_response(self, user_input: str, data_version: Optional[str], output: str):
+        """Armazena a resposta de um turno cacheável"""
+        if data_version is not None and output:
+            get_response_cache().put(user_input, data_version, output)
+    
+    def _run_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        messages: List[BaseMessage],
+        trace: Optional[TurnTrace] = None,
+        prefetch: Optional[Prefetch] = None,
+    ):
+        """
+        Executa as ferramentas pedidas pelo modelo e anexa os resultados
+        
+        Args:
+            tool_calls: Chamadas de ferramenta retornadas pelo modelo
+            messages: Lista de mensagens do turno (modificada no lugar)
+            trace: Registro do turno
+            prefetch: Chamadas especulativas disparadas antes da resposta do modelo
+        """
+        for tool_call in tool_calls:
+            tool_name = tool_call["name"]
+            tool_input = tool_call["args"]
+            tool_call_id = tool_call["id"]
+            
+            # Reaproveita a chamada antecipada ou executa a ferramenta
+            future = prefetch.take(tool_name, tool_input) if prefetch is not None else None
+            if future is not None:
+                tool_output = self._prefetched_output(tool_name, tool_input, future, trace)
+            else:
+                tool_output = self._execute_tool(tool_name, tool_input, trace)
+            
+            # Adiciona o resultado da ferramenta às mensagens como ToolMessage
+            messages.append(
+                ToolMessage(
+                    content=tool_output,
+                    tool_call_id=tool_call_id,
+                )
+            )
+    
+    async def _aexecute_tool(
+        self,
+        tool_name: str,
+        tool_input: Any,
+        trace: Optional[TurnTrace] = None,
+    ) -> str:
+        """
+        Executa uma ferramenta no executor compartilhado, respeitando o tempo limite
+        
+        Args:
+            tool_name: Nome da ferramenta
+            tool_input: Entrada da ferramenta
+            trace: Registro do turno
+        
+        Returns:
+            Resultado da ferramenta
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            # A chamada é registrada só aqui: após o tempo limite a thread continua
+            # rodando e não pode anotar a mesma chamada de novo
+            output, error, coalesced = await asyncio.wait_for(
+                loop.run_in_executor(_tool_executor, self._invoke_tool, tool_name, tool_input),
+                timeout=settings.TOOL_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            output = error = f"Tempo limite excedido ao executar a ferramenta '{tool_name}'."
+            coalesced = False
+        if trace is not None:
+            trace.record_tool_call(tool_name, time.perf_counter() - started, error, coalesced)
+        return output
+    
+    async def _arun_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        messages: List[BaseMessage],
+        trace: Optional[TurnTrace] = None,
+        prefetch: Optional[Prefetch] = None,
+    ):
+        """
+        Executa concorrentemente as ferramentas pedidas em um mesmo turno do modelo
+        
+        Args:
+            tool_calls: Chamadas de ferramenta retornadas pelo modelo
+            messages: Lista de mensagens do turno (modificada no lugar)
+            trace: Registro do turno
+            prefetch: Chamadas especulativas disparadas antes da resposta do modelo
+        """
+        async def run(call):
+            future = prefetch.take(call["name"], call["args"]) if prefetch is not None else None
+            if future is None:
+                return await self._aexecute_tool(call["name"], call["args"], trace)
+            
+            started = time.perf_counter()
+            try:
+                output = await asyncio.wait_for(asyncio.wrap_future(future), settings.TOOL_TIMEOUT)
+            except Exception:
+                return await self._aexecute_tool(call["name"], call["args"], trace)
+            if trace is not None:
+                trace.record_tool_call(call["name"], time.perf_counter() - started)
+            return output
+        
+        outputs = await asyncio.gather(*(run(call) for call in tool_calls))
+        
+        # Mantém a ordem original das chamadas nas ToolMessages
+        for tool_call, tool_output in zip(tool_calls, outputs):
+            messages.append(
+                ToolMessage(
+                    content=tool_output,
+                    tool_call_id=tool_call["id"],
+                )
+            )
+    
+    def _error_message(self, error: Exception) -> str:
+        """Registra o erro e retorna a mensagem amigável para o usuário"""
+        error_msg = f"Erro ao processar mensagem: {str(error)}"
+        print(f"[ERRO] {error_msg}")
+        
+        agent_prompts = prompt_loader.get_agent_prompts()
+        return agent_prompts.get("error_message", "Desculpe, ocorreu um erro.")
     
     def chat(self, user_input: str, max_iterations: int = 5) -> str:
         """
@@ -86,66 +476,212 @@ class ConversationalAgent:
         Returns:
             Resposta do agente
         """
+        trace = telemetry.start_turn(self.session_id, mode="chat")
+        error = None
+        prefetch = None
         try:
+            self._refresh_resources()
+            
+            # Perguntas simples sobre a tabela são respondidas sem chamar o modelo
+            routed = self._routed_response(user_input, trace)
+            if routed is not None:
+                return routed
+            
+            # Perguntas repetidas são respondidas pelo cache, sem chamar o modelo
+            data_version = self._cache_key_version()
+            cached = self._cached_response(user_input, data_version, trace)
+            if cached is not None:
+                return cached
+            
             # Constrói a lista de mensagens com o histórico
-            messages = [SystemMessage(content=self.system_prompt)]
-            messages.extend(self.chat_history)
-            messages.append(HumanMessage(content=user_input))
+            messages = self._build_messages(user_input)
+            
+            # Antecipa a ferramenta provável enquanto o modelo decide
+            prefetch = self._start_prefetch(user_input)
+            llm_with_tools = self._bind_tools(user_input, trace)
             
             # Loop de execução do agente
             for i in range(max_iterations):
                 # Invoca o modelo com as ferramentas
-                response = self.llm_with_tools.invoke(messages)
+                started = time.perf_counter()
+                response = llm_with_tools.invoke(messages)
+                trace.record_llm_call(time.perf_counter() - started, response)
                 
                 # Verifica se há tool calls
                 if not response.tool_calls:
                     # Não há mais ferramentas a chamar, retorna a resposta
                     output = response.content
-                    
-                    # Adiciona à memória
-                    self.chat_history.append(HumanMessage(content=user_input))
-                    self.chat_history.append(AIMessage(content=output))
-                    
-                    # Limita o tamanho da memória (mantém últimas 20 mensagens)
-                    if len(self.chat_history) > 20:
-                        self.chat_history = self.chat_history[-20:]
-                    
+                    self._remember(user_input, output)
+                    self._store_response(user_input, data_version, output)
                     return output
                 
                 # Adiciona a resposta do modelo às mensagens
                 messages.append(response)
                 
                 # Executa as ferramentas chamadas
-                for tool_call in response.tool_calls:
-                    tool_name = tool_call["name"]
-                    tool_input = tool_call["args"]
-                    tool_call_id = tool_call["id"]
-                    
-                    # Executa a ferramenta
-                    tool_output = self._execute_tool(tool_name, tool_input)
-                    
-                    # Adiciona o resultado da ferramenta às mensagens como ToolMessage
-                    messages.append(
-                        ToolMessage(
-                            content=tool_output,
-                            tool_call_id=tool_call_id,
-                        )
-                    )
+                self._run_tool_calls(response.tool_calls, messages, trace, prefetch)
+                self._finish_prefetch(prefetch, trace)
+                prefetch = None
             
             # Se chegou aqui, atingiu o número máximo de iterações
+            error = "max_iterations"
             return "Desculpe, não consegui completar a tarefa dentro do limite de iterações."
         
         except Exception as e:
-            error_msg = f"Erro ao processar mensagem: {str(e)}"
-            print(f"[ERRO] {error_msg}")
-            
             # Retorna mensagem de erro amigável
-            agent_prompts = prompt_loader.get_agent_prompts()
-            return agent_prompts.get("error_message", "Desculpe, ocorreu um erro.")
+            error = str(e)
+            return self._error_message(e)
+        
+        finally:
+            self._end_turn(trace, error, prefetch)
+    
+    async def achat(self, user_input: str, max_iterations: int = 5) -> str:
+        """
+        Versão assíncrona de `chat`
+        
+        Usa `ainvoke` no modelo e executa em paralelo todas as ferramentas
+        pedidas em um mesmo turno, de modo que o tempo do turno seja o da
+        ferramenta mais lenta e não a soma de todas. As etapas síncronas
+        (carga da classificação, histórico externo, resumo da conversa e cache
+        de respostas) rodam em threads, sem bloquear o event loop.
+        
+        Args:
+            user_input: Mensagem do usuário
+            max_iterations: Número máximo de iterações
+        
+        Returns:
+            Resposta do agente
+        """
+        trace = telemetry.start_turn(self.session_id, mode="achat")
+        error = None
+        prefetch = None
+        try:
+            await asyncio.to_thread(self._refresh_resources)
+            routed = await asyncio.to_thread(self._routed_response, user_input, trace)
+            if routed is not None:
+                return routed
+            
+            data_version = await asyncio.to_thread(self._cache_key_version)
+            cached = await asyncio.to_thread(self._cached_response, user_input, data_version, trace)
+            if cached is not None:
+                return cached
+            
+            messages = await asyncio.to_thread(self._build_messages, user_input)
+            prefetch = await asyncio.to_thread(self._start_prefetch, user_input)
+            llm_with_tools = await asyncio.to_thread(self._bind_tools, user_input, trace)
+            
+            for i in range(max_iterations):
+                started = time.perf_counter()
+                response = await llm_with_tools.ainvoke(messages)
+                trace.record_llm_call(time.perf_counter() - started, response)
+                
+                if not response.tool_calls:
+                    output = response.content
+                    await asyncio.to_thread(self._remember, user_input, output)
+                    await asyncio.to_thread(self._store_response, user_input, data_version, output)
+                    return output
+                
+                messages.append(response)
+                await self._arun_tool_calls(response.tool_calls, messages, trace, prefetch)
+                self._finish_prefetch(prefetch, trace)
+                prefetch = None
+            
+            error = "max_iterations"
+            return "Desculpe, não consegui completar a tarefa dentro do limite de iterações."
+        
+        except Exception as e:
+            error = str(e)
+            return self._error_message(e)
+        
+        finally:
+            await asyncio.to_thread(self._end_turn, trace, error, prefetch)
+    
+    def stream_chat(self, user_input: str, max_iterations: int = 5) -> Iterator[Dict[str, Any]]:
+        """
+        Variante de `chat` que emite eventos à medida que o modelo responde
+        
+        Eventos emitidos:
+            {"type": "token", "content": str}: trecho de texto da resposta
+            {"type": "tool_call", "name": str, "args": dict}: ferramenta chamada pelo modelo
+            {"type": "error", "content": str}: mensagem de erro para o usuário (encerra o turno)
+        
+        Args:
+            user_input: Mensagem do usuário
+            max_iterations: Número máximo de iterações
+        
+        Yields:
+            Dicionários de evento
+        """
+        trace = telemetry.start_turn(self.session_id, mode="stream")
+        error = None
+        prefetch = None
+        try:
+            self._refresh_resources()
+            routed = self._routed_response(user_input, trace)
+            if routed is not None:
+                yield {"type": "token", "content": routed}
+                return
+            
+            data_version = self._cache_key_version()
+            cached = self._cached_response(user_input, data_version, trace)
+            if cached is not None:
+                yield {"type": "token", "content": cached}
+                return
+            
+            messages = self._build_messages(user_input)
+            prefetch = self._start_prefetch(user_input)
+            llm_with_tools = self._bind_tools(user_input, trace)
+            
+            for i in range(max_iterations):
+                gathered = None
+                started = time.perf_counter()
+                first_token_latency = None
+                
+                for chunk in llm_with_tools.stream(messages):
+                    gathered = chunk if gathered is None else gathered + chunk
+                    if chunk.content:
+                        if first_token_latency is None:
+                            first_token_latency = time.perf_counter() - started
+                        yield {"type": "token", "content": chunk.content}
+                
+                if gathered is None:
+                    raise RuntimeError("O modelo encerrou o stream sem retornar nenhum trecho")
+                
+                trace.record_llm_call(time.perf_counter() - started, gathered, first_token_latency)
+                
+                if not gathered.tool_calls:
+                    self._remember(user_input, gathered.content)
+                    self._store_response(user_input, data_version, gathered.content)
+                    return
+                
+                # Consolida os fragmentos em uma única mensagem com as tool calls
+                messages.append(
+                    AIMessage(content=gathered.content, tool_calls=gathered.tool_calls)
+                )
+                
+                for tool_call in gathered.tool_calls:
+                    yield {"type": "tool_call", "name": tool_call["name"], "args": tool_call["args"]}
+                
+                self._run_tool_calls(gathered.tool_calls, messages, trace, prefetch)
+                self._finish_prefetch(prefetch, trace)
+                prefetch = None
+            
+            error = "max_iterations"
+            yield {
+                "type": "token",
+                "content": "Desculpe, não consegui completar a tarefa dentro do limite de iterações.",
+            }
+        
+        except Exception as e:
+            error = str(e)
+            yield {"type": "error", "content": self._error_message(e)}
+        
+        finally:
+            self._end_turn(trace, error, prefetch)
     
     def clear_history(self):
         """Limpa o histórico da conversa"""
-        self.chat_history = []
+        self.memory.clear()
     
     def get_history(self) -> List[Dict[str, str]]:
         """
@@ -160,6 +696,7 @@ class ConversationalAgent:
                 history.append({"role": "user", "content": msg.content})
             elif isinstance(msg, AIMessage):
                 history.append({"role": "assistant", "content": msg.content})
+        self.memory.release()
         return history
 
 
@@ -167,6 +704,8 @@ def create_agent(
     model_name: Optional[str] = None,
     temperature: Optional[float] = None,
     max_tokens: Optional[int] = None,
+    resources: Optional[AgentResources] = None,
+    session_id: Optional[str] = None,
 ) -> ConversationalAgent:
     """
     Função auxiliar para criar uma instância do agente
@@ -175,6 +714,8 @@ def create_agent(
         model_name: Nome do modelo OpenAI
         temperature: Temperatura do modelo
         max_tokens: Máximo de tokens na resposta
+        resources: Recursos compartilhados entre sessões
+        session_id: Identificador da sessão
     
     Returns:
         Instância do ConversationalAgent
@@ -183,4 +724,6 @@ def create_agent(
         model_name=model_name,
         temperature=temperature,
         max_tokens=max_tokens,
+        resources=resources,
+        session_id=session_id,
     )
@@ -0,0 +1,555 @@
+"""
+Armazenamento externo do histórico das conversas
+
+Com um armazenamento externo, o estado da sessão deixa de viver apenas no
+processo do Streamlit: qualquer réplica carrega o histórico pelo ID da
+sessão no início do turno e o libera ao final, de modo que as sessões podem
+trocar de worker e a memória de cada processo fica limitada às conversas
+em andamento.
+
+Cada mensagem é gravada como um registro JSON compacto (papel, conteúdo e
+contagem de tokens), sempre por acréscimo; o histórico só é reescrito quando
+turnos antigos são resumidos. Sessões ociosas são removidas após
+HISTORY_IDLE_TIMEOUT segundos.
+
+Backends: memória do processo, SQLite e Redis (protocolo RESP, sem
+dependências extras).
+"""
+import hashlib
+import hmac
+import json
+import secrets
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from ..config import settings
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+
+# Tipos de registro: mensagem do usuário, do assistente e resumo da conversa
+USER, ASSISTANT, SUMMARY = "u", "a", "s"
+
+
+def serialize_record(kind: str, content: str, tokens: int) -> str:
+    """
+    Serializa um registro do histórico em JSON compacto
+
+    Args:
+        kind: Tipo do registro (USER, ASSISTANT ou SUMMARY)
+        content: Texto da mensagem ou do resumo
+        tokens: Contagem de tokens, guardada para não recontar ao carregar
+
+    Returns:
+        Registro serializado
+    """
+    return json.dumps({"r": kind, "c": content, "n": tokens}, ensure_ascii=False, separators=(",", ":"))
+
+
+def serialize_message(message: "BaseMessage", tokens: int) -> str:
+    """Serializa uma mensagem da conversa"""
+    kind = USER if message.type == "human" else ASSISTANT
+    return serialize_record(kind, message.content, tokens)
+
+
+def deserialize_record(record: str) -> Tuple[str, str, int]:
+    """
+    Converte um registro serializado de volta
+
+    Returns:
+        Tupla (tipo, conteúdo, tokens)
+    """
+    data = json.loads(record)
+    return data["r"], data["c"], data.get("n", 0)
+
+
+def record_to_message(kind: str, content: str) -> "BaseMessage":
+    """Reconstrói a mensagem LangChain de um registro USER ou ASSISTANT"""
+    # Importado aqui: o app lê o histórico (load_history) sem carregar o LangChain
+    from langchain_core.messages import AIMessage, HumanMessage
+
+    return HumanMessage(content=content) if kind == USER else AIMessage(content=content)
+
+
+class HistoryStore(ABC):
+    """Interface dos armazenamentos de histórico"""
+
+    def __init__(self, idle_timeout: float = 3600.0, eviction_interval: float = 60.0):
+        """
+        Args:
+            idle_timeout: Segundos sem acesso após os quais a sessão é removida
+            eviction_interval: Intervalo mínimo entre varreduras de sessões ociosas
+        """
+        self.idle_timeout = idle_timeout
+        self.eviction_interval = eviction_interval
+        self._last_eviction = time.time()
+
+    @abstractmethod
+    def load(self, session_id: str) -> List[str]:
+        """Registros da sessão, na ordem em que foram gravados"""
+
+    @abstractmethod
+    def append(self, session_id: str, records: List[str]):
+        """Acrescenta registros ao fim do histórico da sessão"""
+
+    @abstractmethod
+    def replace(self, session_id: str, records: List[str]):
+        """Substitui todo o histórico da sessão (usado ao resumir turnos antigos)"""
+
+    @abstractmethod
+    def delete(self, session_id: str):
+        """Remove a sessão"""
+
+    def evict_idle(self) -> int:
+        """
+        Remove as sessões ociosas há mais de `idle_timeout` segundos
+
+        Returns:
+            Número de sessões removidas
+        """
+        return 0
+
+    def _maybe_evict(self):
+        """Varre as sessões ociosas no máximo uma vez por `eviction_interval`"""
+        now = time.time()
+        if now - self._last_eviction >= self.eviction_interval:
+            self._last_eviction = now
+            self.evict_idle()
+
+
+class InMemoryHistoryStore(HistoryStore):
+    """Histórico na memória do processo (compartilhado entre as sessões do processo)"""
+
+    def __init__(self, idle_timeout: float = 3600.0, eviction_interval: float = 60.0):
+        super().__init__(idle_timeout, eviction_interval)
+        self._records: Dict[str, List[str]] = {}
+        self._last_access: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def load(self, session_id: str) -> List[str]:
+        with self._lock:
+            if session_id in self._records:
+                self._last_access[session_id] = time.time()
+            return list(self._records.get(session_id, []))
+
+    def append(self, session_id: str, records: List[str]):
+        with self._lock:
+            self._records.setdefault(session_id, []).extend(records)
+            self._last_access[session_id] = time.time()
+        self._maybe_evict()
+
+    def replace(self, session_id: str, records: List[str]):
+        with self._lock:
+            self._records[session_id] = list(records)
+            self._last_access[session_id] = time.time()
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._records.pop(session_id, None)
+            self._last_access.pop(session_id, None)
+
+    def evict_idle(self) -> int:
+        cutoff = time.time() - self.idle_timeout
+        with self._lock:
+            idle = [sid for sid, last in self._last_access.items() if last < cutoff]
+            for session_id in idle:
+                self._records.pop(session_id, None)
+                del self._last_access[session_id]
+        return len(idle)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_session ON history (session_id, seq);
+CREATE TABLE IF NOT EXISTS history_sessions (
+    session_id TEXT PRIMARY KEY,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_sessions_access ON history_sessions (last_access);
+"""
+
+
+class SQLiteHistoryStore(HistoryStore):
+    """Histórico em um arquivo SQLite (compartilhado pelos workers da mesma máquina)"""
+
+    def __init__(self, path: str, idle_timeout: float = 3600.0, eviction_interval: float = 60.0):
+        """
+        Args:
+            path: Caminho do arquivo SQLite (criado se não existir)
+            idle_timeout: Segundos sem acesso após os quais a sessão é removida
+            eviction_interval: Intervalo mínimo entre varreduras de sessões ociosas
+        """
+        super().__init__(idle_timeout, eviction_interval)
+        self.path = Path(path)
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexão da thread atual (sqlite3 não compartilha conexões entre threads)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    with conn:
+                        conn.executescript(_SQLITE_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def _touch(self, conn: sqlite3.Connection, session_id: str):
+        conn.execute(
+            "INSERT INTO history_sessions (session_id, last_access) VALUES (?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET last_access = excluded.last_access",
+            (session_id, time.time()),
+        )
+
+    def load(self, session_id: str) -> List[str]:
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT record FROM history WHERE session_id = ? ORDER BY seq", (session_id,)
+        ).fetchall()
+        if rows:
+            with conn:
+                self._touch(conn, session_id)
+        return [row[0] for row in rows]
+
+    def append(self, session_id: str, records: List[str]):
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO history (session_id, record) VALUES (?, ?)",
+                [(session_id, record) for record in records],
+            )
+            self._touch(conn, session_id)
+        self._maybe_evict()
+
+    def replace(self, session_id: str, records: List[str]):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM history WHERE session_id = ?", (session_id,))
+            conn.executemany(
+                "INSERT INTO history (session_id, record) VALUES (?, ?)",
+                [(session_id, record) for record in records],
+            )
+            self._touch(conn, session_id)
+
+    def delete(self, session_id: str):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM history WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM history_sessions WHERE session_id = ?", (session_id,))
+
+    def evict_idle(self) -> int:
+        conn = self._connect()
+        cutoff = time.time() - self.idle_timeout
+        with conn:
+            conn.execute(
+                "DELETE FROM history WHERE session_id IN "
+                "(SELECT session_id FROM history_sessions WHERE last_access < ?)",
+                (cutoff,),
+            )
+            cursor = conn.execute("DELETE FROM history_sessions WHERE last_access < ?", (cutoff,))
+        return cursor.rowcount
+
+
+class RespError(Exception):
+    """Erro retornado pelo servidor Redis"""
+
+
+class RespConnection:
+    """Cliente mínimo do protocolo RESP (Redis), com pipelining"""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        """
+        Args:
+            url: URL no formato redis://[:senha@]host:porta/banco
+            timeout: Tempo máximo de conexão e de leitura
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._sock.makefile("rb")
+        setup = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", str(self.db)))
+        if setup:
+            try:
+                self._send(setup)
+            except RespError:
+                # Não reaproveita uma conexão sem autenticação
+                self.close()
+                raise
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+                self._file = None
+
+    @staticmethod
+    def _encode(command: Tuple) -> bytes:
+        parts = [f"*{len(command)}\r\n".encode()]
+        for arg in command:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    def _read_reply(self):
+        """Lê uma resposta; erros do servidor vêm como RespError no lugar (inclusive dentro de arrays)"""
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Conexão com o Redis encerrada")
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode("utf-8")
+        if prefix == b"-":
+            return RespError(payload.decode("utf-8"))
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = self._file.read(length + 2)[:-2]
+            return data.decode("utf-8")
+        if prefix == b"*":
+            count = int(payload)
+            if count == -1:
+                return None
+            return [self._read_reply() for _ in range(count)]
+        raise RespError(f"Resposta RESP inválida: {line!r}")
+
+    @staticmethod
+    def _first_error(reply) -> Optional[RespError]:
+        """Primeiro erro de uma resposta (ex.: um comando que falhou dentro do EXEC)"""
+        if isinstance(reply, RespError):
+            return reply
+        if isinstance(reply, list):
+            return next((error for error in map(RespConnection._first_error, reply) if error is not None), None)
+        return None
+
+    def _send(self, commands: List[Tuple]) -> List:
+        try:
+            self._sock.sendall(b"".join(self._encode(command) for command in commands))
+            replies = [self._read_reply() for _ in commands]
+        except BaseException:
+            # Respostas lidas pela metade deixariam o próximo comando fora de sincronia
+            self.close()
+            raise
+        for reply in replies:
+            error = self._first_error(reply)
+            if error is not None:
+                raise error
+        return replies
+
+    def _stale(self) -> bool:
+        """Indica se a conexão ociosa foi encerrada pelo servidor (ou tem dados inesperados)"""
+        self._sock.setblocking(False)
+        try:
+            self._sock.recv(1, socket.MSG_PEEK)
+        except BlockingIOError:
+            return False
+        except OSError:
+            return True
+        finally:
+            self._sock.settimeout(self.timeout)
+        return True
+
+    def pipeline(self, *commands: Tuple) -> List:
+        """
+        Envia vários comandos de uma vez e lê todas as respostas
+
+        Uma conexão ociosa encerrada pelo servidor é refeita antes do envio. Só
+        falhas de conexão são repetidas: depois que os comandos saem, um erro
+        (ex.: tempo de leitura esgotado) é propagado, pois o servidor pode já
+        tê-los executado e repetir um RPUSH duplicaria o histórico.
+        """
+        if self._sock is not None and self._stale():
+            self.close()
+        if self._sock is None:
+            for attempt in range(2):
+                try:
+                    self._connect()
+                    break
+                except (ConnectionError, OSError):
+                    self.close()
+                    if attempt:
+                        raise
+        return self._send(list(commands))
+
+
+class RedisHistoryStore(HistoryStore):
+    """Histórico em listas do Redis (compartilhado por todas as réplicas)"""
+
+    def __init__(self, url: str, idle_timeout: float = 3600.0, prefix: str = "brasileiraogpt:history:"):
+        """
+        Args:
+            url: URL do Redis (redis://host:porta/banco)
+            idle_timeout: Segundos sem acesso após os quais a sessão expira
+            prefix: Prefixo das chaves
+        """
+        super().__init__(idle_timeout)
+        self.url = url
+        self.prefix = prefix
+        self._local = threading.local()
+
+    def _conn(self) -> RespConnection:
+        """Conexão da thread atual"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = RespConnection(self.url)
+        return conn
+
+    def _key(self, session_id: str) -> str:
+        return self.prefix + session_id
+
+    def load(self, session_id: str) -> List[str]:
+        key = self._key(session_id)
+        records, _ = self._conn().pipeline(("LRANGE", key, 0, -1), ("EXPIRE", key, int(self.idle_timeout)))
+        return records or []
+
+    def append(self, session_id: str, records: List[str]):
+        if not records:
+            return
+        key = self._key(session_id)
+        self._conn().pipeline(("RPUSH", key, *records), ("EXPIRE", key, int(self.idle_timeout)))
+
+    def replace(self, session_id: str, records: List[str]):
+        key = self._key(session_id)
+        commands = [("MULTI",), ("DEL", key)]
+        if records:
+            commands.append(("RPUSH", key, *records))
+            commands.append(("EXPIRE", key, int(self.idle_timeout)))
+        commands.append(("EXEC",))
+        self._conn().pipeline(*commands)
+
+    def delete(self, session_id: str):
+        self._conn().pipeline(("DEL", self._key(session_id)))
+
+    # Sessões ociosas expiram pelo próprio Redis (EXPIRE a cada acesso)
+
+
+# Sem SESSION_SECRET, a chave vale só para o processo atual
+_session_key = (settings.SESSION_SECRET or secrets.token_hex(32)).encode("utf-8")
+
+
+def _session_signature(session_id: str) -> str:
+    return hmac.new(_session_key, session_id.encode("utf-8"), hashlib.sha256).hexdigest()[:32]
+
+
+def new_session_token() -> Tuple[str, str]:
+    """
+    Gera no servidor o identificador de uma nova sessão
+
+    Returns:
+        Tupla (ID da sessão, token assinado para a URL)
+    """
+    session_id = uuid.uuid4().hex
+    return session_id, f"{session_id}.{_session_signature(session_id)}"
+
+
+def verify_session_token(token: str) -> Optional[str]:
+    """
+    Valida um token de sessão vindo da URL
+
+    Args:
+        token: Token no formato "<id>.<assinatura>"
+
+    Returns:
+        ID da sessão ou None se o token não foi emitido por este servidor
+    """
+    session_id, _, signature = (token or "").partition(".")
+    if not session_id or not hmac.compare_digest(signature, _session_signature(session_id)):
+        return None
+    return session_id
+
+
+_history_store: Optional[HistoryStore] = None
+_history_store_lock = threading.Lock()
+
+
+def get_history_store() -> Optional[HistoryStore]:
+    """
+    Retorna o armazenamento de histórico configurado em HISTORY_BACKEND
+
+    Returns:
+        Instância compartilhada ou None para o histórico local de cada agente
+    """
+    global _history_store
+
+    backend = settings.HISTORY_BACKEND.lower()
+    if backend == "local":
+        return None
+
+    if _history_store is None:
+        with _history_store_lock:
+            if _history_store is None:
+                if backend == "memory":
+                    _history_store = InMemoryHistoryStore(settings.HISTORY_IDLE_TIMEOUT)
+                elif backend == "sqlite":
+                    _history_store = SQLiteHistoryStore(settings.HISTORY_SQLITE_PATH, settings.HISTORY_IDLE_TIMEOUT)
+                elif backend == "redis":
+                    _history_store = RedisHistoryStore(settings.HISTORY_REDIS_URL, settings.HISTORY_IDLE_TIMEOUT)
+                else:
+                    raise ValueError(
+                        f"HISTORY_BACKEND desconhecido: {settings.HISTORY_BACKEND}. "
+                        "Use local, memory, sqlite ou redis"
+                    )
+    return _history_store
+
+
+def load_history(session_id: str) -> List[Dict[str, str]]:
+    """
+    Lê a conversa de uma sessão no armazenamento externo, sem montar o agente
+
+    Permite ao app redesenhar uma conversa retomada antes da primeira
+    mensagem, quando o agente da sessão ainda não existe.
+
+    Args:
+        session_id: Identificador da sessão
+
+    Returns:
+        Lista de {"role", "content"} (vazia com HISTORY_BACKEND=local)
+    """
+    store = get_history_store()
+    if store is None:
+        return []
+
+    roles = {USER: "user", ASSISTANT: "assistant"}
+    history = []
+    for record in store.load(session_id):
+        kind, content, _ = deserialize_record(record)
+        if kind in roles:
+            history.append({"role": roles[kind], "content": content})
+    return history
@@ -0,0 +1,185 @@
+"""
+Memória da conversa com orçamento de tokens e resumo incremental
+"""
+from typing import Callable, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+from .history import (
+    SUMMARY,
+    HistoryStore,
+    deserialize_record,
+    record_to_message,
+    serialize_message,
+    serialize_record,
+)
+from .tokens import count_message_tokens, count_tokens
+
+# Função que recebe o resumo anterior e as mensagens descartadas e devolve o novo resumo
+Summarizer = Callable[[str, List[BaseMessage]], str]
+
+
+class ConversationMemory:
+    """
+    Histórico da conversa limitado por tokens
+
+    Quando o histórico ultrapassa o orçamento, os turnos mais antigos são
+    removidos e incorporados a um resumo contínuo, que é atualizado apenas
+    com as mensagens recém-descartadas.
+
+    Com um HistoryStore, o histórico é carregado do armazenamento na primeira
+    leitura do turno e liberado com `release()` ao final, de modo que o
+    processo só mantém em memória as conversas em andamento.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 3000,
+        summarizer: Optional[Summarizer] = None,
+        model_name: str = "gpt-4o-mini",
+        summary_prefix: str = "Resumo da conversa até aqui:",
+        low_watermark: float = 0.75,
+        store: Optional[HistoryStore] = None,
+        session_id: Optional[str] = None,
+    ):
+        """
+        Inicializa a memória
+
+        Args:
+            token_budget: Máximo de tokens do histórico (incluindo o resumo)
+            summarizer: Função de resumo (None descarta os turnos antigos sem resumir)
+            model_name: Modelo usado na contagem de tokens
+            summary_prefix: Texto que introduz o resumo no contexto
+            low_watermark: Fração do orçamento a que o histórico é reduzido ao
+                estourar, para que o resumo não seja refeito a cada turno
+            store: Armazenamento externo do histórico (None = apenas em memória)
+            session_id: Identificador da sessão no armazenamento
+        """
+        self.token_budget = token_budget
+        self.summarizer = summarizer
+        self.model_name = model_name
+        self.summary_prefix = summary_prefix
+        self.low_watermark = low_watermark
+        self.store = store
+        self.session_id = session_id
+
+        self._messages: List[BaseMessage] = []
+        self._summary = ""
+        # Contagem de tokens de cada mensagem, em paralelo a self.messages
+        self._token_counts: List[int] = []
+        self._summary_tokens = 0
+        self._loaded = store is None
+
+    def _ensure_loaded(self):
+        """Carrega o histórico do armazenamento externo, se ainda não carregado"""
+        if self._loaded:
+            return
+        self._messages, self._token_counts = [], []
+        self._summary, self._summary_tokens = "", 0
+        for record in self.store.load(self.session_id):
+            kind, content, tokens = deserialize_record(record)
+            if kind == SUMMARY:
+                self._summary, self._summary_tokens = content, tokens
+            else:
+                self._messages.append(record_to_message(kind, content))
+                self._token_counts.append(tokens)
+        self._loaded = True
+
+    def release(self):
+        """Libera o histórico da memória do processo (apenas com armazenamento externo)"""
+        if self.store is not None:
+            self._messages, self._token_counts = [], []
+            self._summary, self._summary_tokens = "", 0
+            self._loaded = False
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """Mensagens recentes da conversa"""
+        self._ensure_loaded()
+        return self._messages
+
+    @property
+    def summary(self) -> str:
+        """Resumo dos turnos que saíram do histórico"""
+        self._ensure_loaded()
+        return self._summary
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens ocupados pelo histórico e pelo resumo"""
+        self._ensure_loaded()
+        return sum(self._token_counts) + self._summary_tokens
+
+    def add_message(self, message: BaseMessage):
+        """Adiciona uma mensagem, contando seus tokens uma única vez"""
+        self._add_messages([message])
+
+    def _add_messages(self, messages: List[BaseMessage]):
+        """Adiciona mensagens localmente e, em uma única escrita, no armazenamento"""
+        self._ensure_loaded()
+        counts = [count_message_tokens(message, self.model_name) for message in messages]
+        self._messages.extend(messages)
+        self._token_counts.extend(counts)
+        if self.store is not None:
+            self.store.append(
+                self.session_id,
+                [serialize_message(message, tokens) for message, tokens in zip(messages, counts)],
+            )
+
+    def add_turn(self, user_input: str, output: str):
+        """
+        Adiciona um turno completo e aplica o orçamento de tokens
+
+        Args:
+            user_input: Mensagem do usuário
+            output: Resposta final do agente
+        """
+        self._add_messages([HumanMessage(content=user_input), AIMessage(content=output)])
+        self._enforce_budget()
+
+    def context_messages(self) -> List[BaseMessage]:
+        """Mensagens a enviar ao modelo: resumo (se houver) seguido do histórico recente"""
+        if not self.summary:
+            return list(self.messages)
+        summary_message = SystemMessage(content=f"{self.summary_prefix}\n{self.summary}")
+        return [summary_message] + self.messages
+
+    def clear(self):
+        """Limpa o histórico e o resumo"""
+        self._messages = []
+        self._token_counts = []
+        self._summary = ""
+        self._summary_tokens = 0
+        if self.store is not None:
+            self.store.delete(self.session_id)
+            self._loaded = True
+
+    def _enforce_budget(self):
+        """Descarta os turnos mais antigos até caber no orçamento, resumindo-os"""
+        if self.total_tokens <= self.token_budget:
+            return
+
+        target = int(self.token_budget * self.low_watermark)
+        evicted: List[BaseMessage] = []
+
+        # Remove turnos inteiros (pergunta + resposta), preservando sempre o último
+        while self.total_tokens > target and len(self._messages) > 2:
+            evicted.extend(self._messages[:2])
+            del self._messages[:2]
+            del self._token_counts[:2]
+
+        if not evicted:
+            return
+
+        if self.summarizer is not None:
+            self._summary = self.summarizer(self._summary, evicted)
+            self._summary_tokens = count_tokens(self._summary, self.model_name)
+
+        # Única reescrita do histórico externo: resumo seguido das mensagens mantidas
+        if self.store is not None:
+            records = [serialize_record(SUMMARY, self._summary, self._summary_tokens)] if self._summary else []
+            records.extend(
+                serialize_message(message, tokens)
+                for message, tokens in zip(self._messages, self._token_counts)
+            )
+            self.store.replace(self.session_id, records)
@@ -0,0 +1,112 @@
+"""
+Execução especulativa de ferramentas
+
+Na maior parte das perguntas sobre futebol, a primeira resposta do modelo é
+uma chamada a `TabelaBrasileirão`. Em vez de esperar o modelo pedir a
+ferramenta, o agente dispara a busca em paralelo com a primeira chamada ao
+modelo, com base em palavras-chave da pergunta e nas ferramentas usadas no
+turno anterior. Se o modelo pedir essa chamada (argumentos comparados depois
+de normalizados; para a tabela, qualquer argumento), o resultado já está
+pronto (ou a caminho); caso contrário, ele é descartado.
+"""
+import re
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..tools import get_standings_store, standings_cache
+from .response_cache import normalize_question
+from .single_flight import tool_call_key
+
+TABLE_TOOL = "TabelaBrasileirão"
+
+_SPORTS_RE = re.compile(
+    r"\b(tabela|classificacao|brasileirao|campeonato|serie a|pontos?|lider\w*|rebaixa\w*|"
+    r"z4|g4|g6|libertadores|sul ?americana|posicao|colocacao|saldo|vitorias|derrotas|"
+    r"empates|times?|clubes?)\b"
+)
+
+
+# Ferramentas cujo resultado não depende dos argumentos (o `query` da tabela
+# não é usado): qualquer chamada do modelo aproveita a especulativa
+ARGUMENT_FREE_TOOLS = frozenset({TABLE_TOOL})
+
+
+def _call_key(tool_name: str, args: Dict[str, Any]) -> Tuple[str, str]:
+    """Chave de uma chamada, com os argumentos normalizados como no single-flight"""
+    if tool_name in ARGUMENT_FREE_TOOLS:
+        return tool_name, ""
+    return tool_call_key(tool_name, args)
+
+
+def predict_tool_calls(text: str, recent_tools: Iterable[str] = ()) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Prevê as chamadas de ferramenta que o modelo provavelmente fará
+
+    Args:
+        text: Pergunta do usuário
+        recent_tools: Ferramentas usadas no turno anterior da conversa
+
+    Returns:
+        Lista de (nome da ferramenta, argumentos)
+    """
+    if TABLE_TOOL in recent_tools or _SPORTS_RE.search(normalize_question(text)):
+        return [(TABLE_TOOL, {})]
+
+    # Times citados só são procurados com a tabela já em memória (sem I/O aqui)
+    if standings_cache.version is not None and get_standings_store().mentions(text):
+        return [(TABLE_TOOL, {})]
+    return []
+
+
+class Prefetch:
+    """Chamadas de ferramenta iniciadas antes da resposta do modelo"""
+
+    def __init__(
+        self,
+        executor: Executor,
+        calls: List[Tuple[Any, Dict[str, Any]]],
+        invoke: Optional[Callable[[Any, Dict[str, Any]], Any]] = None,
+    ):
+        """
+        Dispara as chamadas no executor
+
+        Args:
+            executor: Executor onde as ferramentas rodam
+            calls: Lista de (ferramenta, argumentos)
+            invoke: Executa uma chamada (padrão: `tool.invoke(args)`)
+        """
+        invoke = invoke or (lambda tool, args: tool.invoke(args))
+        self._futures: Dict[Tuple[str, str], Future] = {
+            _call_key(tool.name, args): executor.submit(invoke, tool, args)
+            for tool, args in calls
+        }
+        self.hits = 0
+
+    def take(self, tool_name: str, args: Dict[str, Any]) -> Optional[Future]:
+        """
+        Retira a chamada especulativa correspondente ao pedido do modelo
+
+        Args:
+            tool_name: Ferramenta pedida
+            args: Argumentos pedidos
+
+        Returns:
+            Future com o resultado ou None se essa chamada não foi antecipada
+        """
+        future = self._futures.pop(_call_key(tool_name, args), None)
+        if future is not None:
+            self.hits += 1
+        return future
+
+    def discard(self) -> int:
+        """
+        Descarta as chamadas não usadas pelo modelo
+
+        Returns:
+            Número de chamadas descartadas
+        """
+        discarded = len(self._futures)
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        return discarded
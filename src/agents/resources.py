@@ -0,0 +1,225 @@
+"""
+Recursos compartilhados entre as sessões do agente
+
+O cliente LLM (com suas conexões HTTP), as ferramentas e os prompts não
+dependem da conversa e podem ser reutilizados por todas as sessões do
+processo. Cada sessão mantém apenas o próprio histórico.
+
+O prefixo enviado ao modelo (definições das ferramentas, prompt do sistema e a
+legenda da tabela) é montado uma única vez aqui e fica idêntico, byte a byte,
+em todos os turnos e sessões, o que permite ao provedor reaproveitar o cache
+de prefixo e reduz o tempo até o primeiro token.
+"""
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+from langchain_core.messages import SystemMessage
+
+from ..config import settings
+from ..tools import ToolRegistry, get_tool_registry, standings_legend
+from ..prompts import prompt_loader
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+
+class AgentResources:
+    """Partes sem estado do agente: cliente LLM, ferramentas e prompt do sistema"""
+
+    def __init__(
+        self,
+        llm: "ChatOpenAI",
+        registry: ToolRegistry,
+        system_prompt: str,
+        prompt_version: str = "",
+        prompt_cache_key: str = "",
+    ):
+        """
+        Inicializa os recursos
+
+        Args:
+            llm: Cliente do modelo
+            registry: Registro das ferramentas disponíveis para o agente
+            system_prompt: Prompt do sistema (prefixo fixo de todas as conversas)
+            prompt_version: Versão dos prompts usada para montar os recursos
+            prompt_cache_key: Chave de roteamento do cache de prefixo (vazio = não enviar)
+        """
+        self.llm = llm
+        self.registry = registry
+        self.system_prompt = system_prompt
+        self.system_message = SystemMessage(content=system_prompt)
+        self.prompt_version = prompt_version
+
+        self._bind_kwargs = {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else {}
+        self._bound: Dict[Tuple[str, ...], Any] = {}
+        self._bound_lock = threading.Lock()
+
+    @property
+    def tools(self) -> List:
+        """Todas as ferramentas, em ordem alfabética (constrói as que faltarem)"""
+        return self.registry.tools(version=self.prompt_version)
+
+    @property
+    def llm_with_tools(self):
+        """Modelo com todas as ferramentas"""
+        return self.bind()
+
+    def select_tools(self, user_input: str, previous: Iterable[str] = ()) -> Tuple[str, ...]:
+        """
+        Ferramentas enviadas ao modelo em um turno, conforme TOOL_SELECTION
+
+        Args:
+            user_input: Mensagem do usuário
+            previous: Ferramentas usadas no turno anterior (perguntas de continuação)
+
+        Returns:
+            Nomes das ferramentas em ordem alfabética
+        """
+        if settings.TOOL_SELECTION == "all":
+            return tuple(self.registry.names())
+        return self.registry.select(user_input, previous)
+
+    def bind(self, names: Optional[Sequence[str]] = None):
+        """
+        Modelo com um subconjunto de ferramentas, montado uma vez por subconjunto
+
+        A ordem das definições é sempre alfabética, mas o prefixo só se repete
+        entre turnos com o mesmo subconjunto: vinculando todas as ferramentas
+        (TOOL_SELECTION=all) ele é o mesmo em todos os turnos e sessões; com
+        subconjuntos variáveis, cada troca de subconjunto perde o cache de prefixo.
+
+        Args:
+            names: Ferramentas a enviar (padrão: todas)
+
+        Returns:
+            Runnable do LangChain com as ferramentas vinculadas
+        """
+        key = tuple(sorted(names)) if names else tuple(self.registry.names())
+        bound = self._bound.get(key)
+        if bound is None:
+            with self._bound_lock:
+                bound = self._bound.get(key)
+                if bound is None:
+                    # Descrições da mesma versão dos prompts destes recursos
+                    tools = self.registry.tools(key, self.prompt_version)
+                    bound = self.llm.bind_tools(tools, **self._bind_kwargs)
+                    self._bound[key] = bound
+        return bound
+
+
+def _http_limits() -> httpx.Limits:
+    """Limites do pool de conexões HTTP com keep-alive"""
+    return httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def build_static_prompt() -> str:
+    """
+    Prompt do sistema seguido dos dados estáveis (legenda e zonas da tabela)
+
+    Returns:
+        Texto do prefixo fixo, sem nada que varie entre turnos ou sessões
+    """
+    agent_prompts = prompt_loader.get_agent_prompts()
+    parts = [agent_prompts.get("system_prompt", "")]
+    standings_context = agent_prompts.get("standings_context")
+    if standings_context:
+        parts.append(standings_context.format(legend=standings_legend()))
+    return "\n\n".join(part for part in parts if part)
+
+
+def build_agent_resources(
+    model_name: str,
+    temperature: float,
+    max_tokens: int,
+    llm: Optional["ChatOpenAI"] = None,
+) -> AgentResources:
+    """
+    Constrói um novo conjunto de recursos do agente
+
+    Args:
+        model_name: Nome do modelo OpenAI
+        temperature: Temperatura do modelo
+        max_tokens: Máximo de tokens na resposta
+        llm: Cliente já existente a reaproveitar (ex.: quando só os prompts mudaram)
+
+    Returns:
+        Instância de AgentResources
+    """
+    settings.validate()
+
+    # Lida antes de montar ferramentas e prompt, para nunca marcar conteúdo novo com versão antiga
+    prompt_version = prompt_loader.version
+
+    if llm is None:
+        # O cliente da OpenAI é a importação mais cara do app: só quando o agente é montado
+        from langchain_openai import ChatOpenAI
+
+        llm = ChatOpenAI(
+            model=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            openai_api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_BASE_URL or None,
+            stream_usage=True,
+            http_client=httpx.Client(limits=_http_limits()),
+            http_async_client=httpx.AsyncClient(limits=_http_limits()),
+        )
+
+    return AgentResources(
+        llm=llm,
+        registry=get_tool_registry(),
+        system_prompt=build_static_prompt(),
+        prompt_version=prompt_version,
+        prompt_cache_key=f"{settings.PROMPT_CACHE_KEY}-{prompt_version}" if settings.PROMPT_CACHE_KEY else "",
+    )
+
+
+_resources_pool: Dict[Tuple[str, float, int], AgentResources] = {}
+_resources_lock = threading.Lock()
+
+
+def get_agent_resources(
+    model_name: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+) -> AgentResources:
+    """
+    Retorna os recursos do processo para a configuração de modelo informada
+
+    Os recursos são construídos uma única vez por combinação de parâmetros e
+    remontados (reaproveitando o cliente LLM) quando os prompts mudam em disco.
+
+    Args:
+        model_name: Nome do modelo OpenAI (padrão: configurado em .env)
+        temperature: Temperatura do modelo (padrão: configurado em .env)
+        max_tokens: Máximo de tokens na resposta (padrão: configurado em .env)
+
+    Returns:
+        Instância compartilhada de AgentResources
+    """
+    key = (
+        model_name or settings.OPENAI_MODEL,
+        temperature if temperature is not None else settings.TEMPERATURE,
+        max_tokens or settings.MAX_TOKENS,
+    )
+
+    prompt_version = prompt_loader.version
+    resources = _resources_pool.get(key)
+    if resources is None or resources.prompt_version != prompt_version:
+        with _resources_lock:
+            resources = _resources_pool.get(key)
+            if resources is None or resources.prompt_version != prompt_version:
+                resources = build_agent_resources(*key, llm=resources.llm if resources else None)
+                _resources_pool[key] = resources
+    return resources
+
+
+def clear_agent_resources():
+    """Descarta os recursos em cache (ex.: após alterar as ferramentas)"""
+    with _resources_lock:
+        _resources_pool.clear()
@@ -0,0 +1,244 @@
+"""
+Cache de respostas para perguntas repetidas
+
+As respostas são indexadas pela pergunta normalizada e pela versão dos dados
+da classificação, de modo que uma mudança na tabela invalida automaticamente
+tudo o que foi respondido com os dados antigos. Além da busca exata, o cache
+pode comparar embeddings das perguntas para reaproveitar respostas de
+perguntas equivalentes escritas de outra forma.
+"""
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from ..config import settings
+
+Embedder = Callable[[str], List[float]]
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(text: str) -> str:
+    """
+    Normaliza uma pergunta para comparação exata
+
+    Remove acentos, pontuação, caixa e espaços redundantes.
+
+    Args:
+        text: Pergunta original
+
+    Returns:
+        Pergunta normalizada
+    """
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = _PUNCTUATION_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _normalize_vector(vector: List[float]) -> List[float]:
+    """Normaliza o vetor para que a similaridade de cosseno seja um produto escalar"""
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+class _CachedResponse:
+    """Resposta em cache com validade e embedding da pergunta"""
+
+    __slots__ = ("response", "expires_at", "vector")
+
+    def __init__(self, response: str, expires_at: float, vector: Optional[List[float]]):
+        self.response = response
+        self.expires_at = expires_at
+        self.vector = vector
+
+
+class ResponseCache:
+    """Cache LRU/TTL de respostas com busca exata e por similaridade"""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 600.0,
+        similarity_threshold: float = 0.0,
+        embedder: Optional[Embedder] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa o cache
+
+        Args:
+            max_entries: Número máximo de respostas armazenadas
+            ttl: Segundos em que uma resposta permanece válida
+            similarity_threshold: Similaridade de cosseno mínima para um acerto
+                semântico (0 desativa a busca por similaridade)
+            embedder: Função que gera o embedding de um texto
+            clock: Relógio monotônico (injetável para testes)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.embedder = embedder if similarity_threshold > 0 else None
+        self._clock = clock
+
+        self._entries: "OrderedDict[Tuple[str, str], _CachedResponse]" = OrderedDict()
+        self._data_version: Optional[str] = None
+        self._lock = threading.Lock()
+        # Embeddings recentes, para não recalcular no `put` após um `get` sem acerto
+        self._vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def get(self, question: str, data_version: str) -> Optional[str]:
+        """
+        Procura uma resposta para a pergunta com a versão de dados informada
+
+        Args:
+            question: Pergunta do usuário
+            data_version: Versão atual dos dados da classificação
+
+        Returns:
+            Resposta em cache ou None
+        """
+        normalized = normalize_question(question)
+        now = self._clock()
+
+        with self._lock:
+            self._sync_version(data_version)
+            self._evict_expired(now)
+
+            entry = self._entries.get((normalized, data_version))
+            if entry is not None:
+                self._entries.move_to_end((normalized, data_version))
+                self.hits += 1
+                return entry.response
+
+        if self.embedder is not None:
+            response = self._semantic_lookup(normalized, data_version)
+            if response is not None:
+                return response
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, question: str, data_version: str, response: str):
+        """
+        Armazena a resposta de uma pergunta
+
+        Args:
+            question: Pergunta do usuário
+            data_version: Versão dos dados usada para responder
+            response: Resposta gerada pelo agente
+        """
+        normalized = normalize_question(question)
+        vector = self._embed(normalized) if self.embedder is not None else None
+        key = (normalized, data_version)
+
+        with self._lock:
+            self._sync_version(data_version)
+            self._entries[key] = _CachedResponse(response, self._clock() + self.ttl, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Remove todas as respostas do cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sync_version(self, data_version: str):
+        """Descarta as respostas de versões antigas quando os dados mudam (requer o lock)"""
+        if data_version != self._data_version:
+            self._entries.clear()
+            self._data_version = data_version
+
+    def _evict_expired(self, now: float):
+        """Remove as entradas vencidas (requer o lock)"""
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+    def _embed(self, normalized: str) -> Optional[List[float]]:
+        """Gera o embedding normalizado da pergunta, ignorando falhas do provedor"""
+        vector = self._vectors.get(normalized)
+        if vector is not None:
+            return vector
+
+        try:
+            vector = _normalize_vector(self.embedder(normalized))
+        except Exception:
+            return None
+
+        with self._lock:
+            self._vectors[normalized] = vector
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+        return vector
+
+    def _semantic_lookup(self, normalized: str, data_version: str) -> Optional[str]:
+        """Busca a resposta da pergunta mais parecida acima do limiar de similaridade"""
+        vector = self._embed(normalized)
+        if vector is None:
+            return None
+
+        with self._lock:
+            best_key, best_score = None, self.similarity_threshold
+            for key, entry in self._entries.items():
+                if key[1] != data_version or entry.vector is None:
+                    continue
+                score = sum(a * b for a, b in zip(vector, entry.vector))
+                if score >= best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                return None
+
+            self._entries.move_to_end(best_key)
+            self.hits += 1
+            self.semantic_hits += 1
+            return self._entries[best_key].response
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Retorna o cache de respostas do processo, configurado a partir de `settings`
+
+    Returns:
+        Instância compartilhada de ResponseCache
+    """
+    global _response_cache
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                embedder = None
+                if settings.RESPONSE_CACHE_SIMILARITY > 0:
+                    from langchain_openai import OpenAIEmbeddings
+
+                    embedder = OpenAIEmbeddings(
+                        model=settings.EMBEDDING_MODEL,
+                        openai_api_key=settings.OPENAI_API_KEY,
+                    ).embed_query
+
+                _response_cache = ResponseCache(
+                    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+                    ttl=settings.RESPONSE_CACHE_TTL,
+                    similarity_threshold=settings.RESPONSE_CACHE_SIMILARITY,
+                    embedder=embedder,
+                )
+    return _response_cache
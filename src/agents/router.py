@@ -0,0 +1,338 @@
+"""
+Roteador de intenções para perguntas simples sobre a classificação
+
+Perguntas como "tabela completa", "quem está no Z4" ou "pontos do Flamengo"
+são respondidas diretamente a partir da tabela em cache, com textos fixos de
+`router_templates.json`, sem nenhuma chamada ao modelo. O roteador só
+responde quando a intenção é reconhecida com alta confiança; qualquer outra
+pergunta segue para o agente.
+
+A classificação usa regras de palavras-chave. A confiança de uma regra é a
+fração das palavras da pergunta explicada por ela (times, estatística, zona e
+palavras de ligação): "quantos pontos o Flamengo fez no primeiro turno" cita
+uma estatística, mas sobra parte da pergunta e ela segue para o agente.
+Opcionalmente, um classificador local (ROUTER_CLASSIFIER) é consultado quando
+nenhuma regra se aplica.
+"""
+import importlib
+import re
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..config import settings
+from ..prompts import prompt_loader
+from ..tools import StandingsStore, get_standings_store
+from .response_cache import normalize_question
+
+# Classificador opcional: recebe a pergunta e retorna (intenção, confiança) ou None
+Classifier = Callable[[str], Optional[Tuple[str, float]]]
+
+INTENTS = ("comparacao", "estatistica_time", "zona", "lider", "tabela")
+
+# Perguntas que dependem de algo além da tabela atual (outras temporadas, jogos
+# específicos, datas ou projeções) seguem para o agente
+_FALLTHROUGH_RE = re.compile(
+    r"\b(serie b|historic\w*|temporada passada|ano passado|rodada|resultado\w*|placar|"
+    r"ontem|hoje|amanha|semana|ultim[oa]s? (jogos?|partidas?)|proxim[oa]s? (jogos?|partidas?)|"
+    r"precis\w*|falt\w*|alcanc\w*|chegar|pra ser|para ser|se (ganhar|vencer|perder|empatar)|"
+    r"por ?que|chances?|probabilidade|vai|acha|deveria|previsao|"
+    r"artilheir\w*|tecnico|jogador\w*|em casa|fora de casa|mandante|visitante)\b"
+)
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+_COMPARE_RE = re.compile(r"\b(compar\w*|x|vs|versus|contra|ou|melhor|pior|frente)\b")
+_TEAM_SUMMARY_RE = re.compile(r"\b(como esta|como vai|situacao|campanha|desempenho)\b")
+_LEADER_RE = re.compile(
+    r"\b(lider|lidera|lideranca|primeiro colocado|primeiro lugar|em primeiro|ponta da tabela)\b"
+)
+_TABLE_RE = re.compile(r"\b(tabela|classificacao)\b")
+
+# Palavras de ligação e de pergunta, que não mudam a intenção
+_FILLER_WORDS = frozenset((
+    "o a os as um uma do da dos das de no na nos nas em ao aos e com para pra "
+    "qual quais quem quanto quantos quantas como que esta estao ta tem "
+    "time times clube gols me mostre mostra mostrar ver veja diga diz fala sobre "
+    "atual atualmente agora brasileirao campeonato serie completa inteira atualizada "
+    "por favor"
+).split())
+
+STAT_PATTERNS = (
+    ("saldo_gols", re.compile(r"\bsaldo( de gols)?\b")),
+    ("gols_contra", re.compile(r"\bgols (sofridos|contra|tomados)\b|\b(sofreu|tomou)\b")),
+    ("gols_pro", re.compile(r"\bgols (marcados|feitos|pro)\b|\bmarcou\b|\bquantos gols\b")),
+    # "ganhou"/"perdeu" sozinhos costumam falar de um jogo específico, não do total
+    ("vitorias", re.compile(r"\bvitorias\b")),
+    ("empates", re.compile(r"\bempates\b")),
+    ("derrotas", re.compile(r"\bderrotas\b")),
+    ("jogos", re.compile(r"\b(jogos|partidas) (disputad|jogad)\w*|\bquantos jogos\b")),
+    ("pontos", re.compile(r"\bpontos?\b|\bpts\b")),
+    ("posicao", re.compile(r"\b(posicao|colocacao|lugar|colocado)\b")),
+)
+
+ZONE_PATTERNS = (
+    ("z4", re.compile(r"\b(z4|zona de rebaixamento|rebaixa\w*|degola|caindo|cair)\b")),
+    ("g4", re.compile(r"\bg4\b")),
+    ("g6", re.compile(r"\bg6\b")),
+    ("sulamericana", re.compile(r"\bsul ?americana\b")),
+    ("libertadores", re.compile(r"\blibertadores\b")),
+)
+
+
+class Intent(NamedTuple):
+    """Intenção reconhecida em uma pergunta"""
+
+    name: str
+    confidence: float
+    params: Dict[str, Any]
+
+
+def load_classifier(path: str) -> Optional[Classifier]:
+    """
+    Carrega o classificador opcional a partir de "pacote.modulo:funcao"
+
+    Args:
+        path: Caminho do classificador (vazio = nenhum)
+
+    Returns:
+        Função classificadora ou None
+    """
+    if not path:
+        return None
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class IntentRouter:
+    """Responde perguntas simples sobre a tabela sem chamar o modelo"""
+
+    def __init__(
+        self,
+        store_provider: Callable[[], StandingsStore] = get_standings_store,
+        classifier: Optional[Classifier] = None,
+        min_confidence: float = 0.8,
+    ):
+        """
+        Inicializa o roteador
+
+        Args:
+            store_provider: Função que retorna a classificação indexada atual
+            classifier: Classificador opcional consultado quando nenhuma regra se aplica
+            min_confidence: Confiança mínima para responder sem o modelo
+        """
+        self.store_provider = store_provider
+        self.classifier = classifier
+        self.min_confidence = min_confidence
+
+    def _slots(self, store: StandingsStore, text: str, normalized: str) -> Dict[str, Any]:
+        """Extrai times, estatística e zona citados na pergunta"""
+        stat = next((name for name, pattern in STAT_PATTERNS if pattern.search(normalized)), None)
+        zone = next((name for name, pattern in ZONE_PATTERNS if pattern.search(normalized)), None)
+        return {"teams": store.mentions(text), "stat": stat, "zone": zone}
+
+    @staticmethod
+    def _coverage(store: StandingsStore, text: str, patterns: List["re.Pattern"]) -> float:
+        """
+        Fração das palavras da pergunta explicada pela regra
+
+        Args:
+            store: Classificação indexada (nomes dos times)
+            text: Pergunta do usuário
+            patterns: Expressões que a regra reconheceu na pergunta
+
+        Returns:
+            Valor entre 0 e 1: 1 quando só sobram palavras de ligação
+        """
+        total = len(normalize_question(text).split())
+        if not total:
+            return 0.0
+        remaining = store.strip_mentions(text)
+        for pattern in patterns:
+            remaining = pattern.sub(" ", remaining)
+        unexplained = [word for word in remaining.split() if word not in _FILLER_WORDS]
+        return max(0.0, 1.0 - len(unexplained) / total)
+
+    def _classify_rules(
+        self,
+        store: StandingsStore,
+        text: str,
+        slots: Dict[str, Any],
+        normalized: str,
+    ) -> Optional[Intent]:
+        """Regras de palavras-chave, da intenção mais específica para a mais geral"""
+        teams, stat, zone = slots["teams"], slots["stat"], slots["zone"]
+        stat_patterns = [pattern for name, pattern in STAT_PATTERNS if name == stat]
+        zone_patterns = [pattern for name, pattern in ZONE_PATTERNS if name == zone]
+
+        def intent(name: str, *patterns: "re.Pattern") -> Intent:
+            # O ano (se houver) já foi conferido com a temporada da tabela
+            patterns = stat_patterns + zone_patterns + list(patterns) + [_YEAR_RE]
+            return Intent(name, self._coverage(store, text, patterns), slots)
+
+        if len(teams) == 2 and _COMPARE_RE.search(normalized):
+            # A comparação pronta cobre posição, pontos e saldo; outras estatísticas vão ao agente
+            if stat in (None, "pontos", "posicao", "saldo_gols"):
+                return intent("comparacao", _COMPARE_RE)
+            return None
+        if len(teams) > 1:
+            return None
+        if len(teams) == 1:
+            if stat or _TEAM_SUMMARY_RE.search(normalized):
+                return intent("estatistica_time", _TEAM_SUMMARY_RE)
+            return None
+        if zone:
+            return intent("zona", _TABLE_RE)
+        if _LEADER_RE.search(normalized):
+            return intent("lider", _LEADER_RE, _TABLE_RE)
+        if _TABLE_RE.search(normalized) and not stat:
+            return intent("tabela", _TABLE_RE)
+        return None
+
+    def classify(self, text: str, store: Optional[StandingsStore] = None) -> Optional[Intent]:
+        """
+        Reconhece a intenção de uma pergunta
+
+        Args:
+            text: Pergunta do usuário
+            store: Classificação indexada (padrão: a atual)
+
+        Returns:
+            Intenção reconhecida ou None se a pergunta deve seguir para o agente
+        """
+        normalized = normalize_question(text)
+        if not normalized or _FALLTHROUGH_RE.search(normalized):
+            return None
+
+        store = store or self.store_provider()
+        season = str(store.metadata.get("temporada", ""))
+        if any(match.group(0) != season for match in _YEAR_RE.finditer(normalized)):
+            return None
+
+        slots = self._slots(store, text, normalized)
+        intent = self._classify_rules(store, text, slots, normalized)
+        if intent is None and self.classifier is not None:
+            result = self.classifier(text)
+            if result is not None and result[0] in INTENTS:
+                intent = Intent(result[0], result[1], slots)
+        return intent
+
+    def route(self, text: str) -> Optional[Tuple[Intent, str]]:
+        """
+        Tenta responder a pergunta a partir da tabela
+
+        Args:
+            text: Pergunta do usuário
+
+        Returns:
+            Tupla (intenção, resposta) ou None se a pergunta deve seguir para o agente
+        """
+        store = self.store_provider()
+        if store.size == 0:
+            return None
+
+        intent = self.classify(text, store)
+        if intent is None or intent.confidence < self.min_confidence:
+            return None
+
+        answer = self.render(intent, store)
+        if answer is None:
+            return None
+        return intent, answer
+
+    def render(self, intent: Intent, store: StandingsStore) -> Optional[str]:
+        """
+        Monta a resposta de uma intenção com os textos de `router_templates.json`
+
+        Args:
+            intent: Intenção reconhecida
+            store: Classificação indexada
+
+        Returns:
+            Resposta em Markdown ou None se faltar informação para a intenção
+        """
+        templates = prompt_loader.load_prompt_file("router_templates")
+        context = {
+            "campeonato": store.metadata.get("campeonato", "Brasileirão"),
+            "temporada": store.metadata.get("temporada", ""),
+        }
+        teams = intent.params.get("teams", [])
+
+        if intent.name == "tabela":
+            lines = [templates["tabela_cabecalho"].format(**context)]
+            lines.extend(
+                templates["tabela_linha"].format(**store.row(idx)) for idx in range(store.size)
+            )
+            body = "\n".join(lines)
+
+        elif intent.name == "lider":
+            body = templates["lider"].format(**context, **store.row(0))
+
+        elif intent.name == "zona":
+            zone = intent.params.get("zone")
+            rows = store.zone(zone) if zone else None
+            if not rows:
+                return None
+            lines = [templates["zona_cabecalho"].format(zona=templates["zonas"].get(zone, zone), **context)]
+            lines.extend(templates["zona_linha"].format(**row) for row in rows)
+            body = "\n".join(lines)
+
+        elif intent.name == "estatistica_time":
+            if len(teams) != 1:
+                return None
+            row = store.row(teams[0])
+            stat = intent.params.get("stat")
+            template = templates["estatisticas"].get(stat) if stat else templates["time_resumo"]
+            body = template.format(**row)
+
+        elif intent.name == "comparacao":
+            if len(teams) != 2:
+                return None
+            row_a, row_b = store.row(teams[0]), store.row(teams[1])
+            difference = row_a["pontos"] - row_b["pontos"]
+            if difference == 0:
+                summary = templates["comparacao_empate"]
+            else:
+                leader = row_a if difference > 0 else row_b
+                summary = templates["comparacao_vantagem"].format(lider=leader["time"], diferenca=abs(difference))
+            body = templates["comparacao"].format(
+                time_a=row_a["time"], posicao_a=row_a["posicao"], pontos_a=row_a["pontos"], saldo_a=row_a["saldo_gols"],
+                time_b=row_b["time"], posicao_b=row_b["posicao"], pontos_b=row_b["pontos"], saldo_b=row_b["saldo_gols"],
+                resumo=summary,
+            )
+
+        else:
+            return None
+
+        return "\n\n".join([body] + self._footer(templates, store))
+
+    @staticmethod
+    def _footer(templates, store: StandingsStore) -> List[str]:
+        """Avisos de origem dos dados (fonte e dados de exemplo)"""
+        footer = []
+        if store.metadata.get("observacao"):
+            footer.append(templates["rodape_observacao"].format(observacao=store.metadata["observacao"]))
+        if store.metadata.get("fonte"):
+            footer.append(templates["rodape_fonte"].format(fonte=store.metadata["fonte"]))
+        return footer
+
+
+_intent_router: Optional[IntentRouter] = None
+_intent_router_lock = threading.Lock()
+
+
+def get_intent_router() -> IntentRouter:
+    """
+    Retorna o roteador de intenções do processo, configurado a partir de `settings`
+
+    Returns:
+        Instância compartilhada de IntentRouter
+    """
+    global _intent_router
+
+    if _intent_router is None:
+        with _intent_router_lock:
+            if _intent_router is None:
+                _intent_router = IntentRouter(
+                    classifier=load_classifier(settings.ROUTER_CLASSIFIER),
+                    min_confidence=settings.ROUTER_MIN_CONFIDENCE,
+                )
+    return _intent_router
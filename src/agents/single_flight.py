@@ -0,0 +1,133 @@
+"""
+Agrupamento de chamadas de ferramenta idênticas em andamento (single-flight)
+
+Quando uma rodada termina, muitas sessões pedem a mesma tabela ao mesmo
+tempo. Cada sessão do Streamlit roda na própria thread; sem coordenação, cada
+uma dispararia a sua execução da ferramenta (e a sua requisição ao
+SofaScore). Aqui a primeira chamada de uma chave executa e as chamadas
+idênticas que chegam enquanto ela está em andamento aguardam e recebem o mesmo
+resultado (ou a mesma exceção). Nada é guardado depois que a execução termina:
+o cache dos dados continua sendo responsabilidade das próprias ferramentas.
+"""
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..config import settings
+
+
+def _normalize(value: Any) -> Any:
+    """Normaliza argumentos equivalentes (espaços e caixa em textos)"""
+    if isinstance(value, str):
+        return " ".join(value.split()).lower()
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def tool_call_key(tool_name: str, tool_input: Any) -> Tuple[str, str]:
+    """
+    Chave de uma chamada de ferramenta: nome e argumentos normalizados
+
+    Args:
+        tool_name: Nome da ferramenta
+        tool_input: Argumentos (dicionário ou texto)
+
+    Returns:
+        Tupla (nome, argumentos serializados de forma estável)
+    """
+    args = json.dumps(_normalize(tool_input or {}), sort_keys=True, ensure_ascii=False, default=str)
+    return tool_name, args
+
+
+class SingleFlight:
+    """Execuções compartilhadas por chave entre threads"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Executa `func()` ou aguarda a execução já em andamento para a mesma chave
+
+        Args:
+            key: Identificador da chamada
+            func: Função executada pela primeira chamada da chave
+
+        Returns:
+            Tupla (resultado, True se o resultado veio de outra chamada)
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores de execuções e de chamadas agrupadas"""
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "inflight": len(self._inflight),
+            }
+
+
+_tool_flight: Optional[SingleFlight] = None
+_tool_flight_lock = threading.Lock()
+
+
+def get_tool_single_flight() -> SingleFlight:
+    """
+    Retorna o agrupador de chamadas de ferramenta compartilhado pelas sessões do processo
+
+    Returns:
+        Instância compartilhada de SingleFlight
+    """
+    global _tool_flight
+
+    if _tool_flight is None:
+        with _tool_flight_lock:
+            if _tool_flight is None:
+                _tool_flight = SingleFlight()
+    return _tool_flight
+
+
+def invoke_tool(tool: Any, tool_input: Any) -> Tuple[Any, bool]:
+    """
+    Executa uma ferramenta, compartilhando a execução com chamadas idênticas em andamento
+
+    Args:
+        tool: Ferramenta do LangChain
+        tool_input: Argumentos da chamada
+
+    Returns:
+        Tupla (resultado, True se a chamada foi agrupada com outra)
+    """
+    if not settings.TOOL_COALESCING:
+        return tool.invoke(tool_input), False
+    return get_tool_single_flight().do(tool_call_key(tool.name, tool_input), lambda: tool.invoke(tool_input))
@@ -0,0 +1,69 @@
+"""
+Contagem de tokens para mensagens e textos
+
+Usa o tiktoken quando o encoding do modelo está disponível localmente e cai
+para uma estimativa por caracteres caso contrário (ex.: ambiente sem rede
+para baixar o arquivo do encoding).
+"""
+import functools
+from typing import Callable, Optional
+
+from langchain_core.messages import BaseMessage
+
+# Tokens extras por mensagem no formato de chat (papel, separadores)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoder(model_name: str) -> Optional[Callable[[str], list]]:
+    """Retorna a função de encoding do modelo ou None se indisponível"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+    return encoding.encode
+
+
+def count_tokens(text: str, model_name: str = "gpt-4o-mini") -> int:
+    """
+    Conta os tokens de um texto
+
+    Args:
+        text: Texto a ser contado
+        model_name: Modelo cujo tokenizador deve ser usado
+
+    Returns:
+        Número de tokens (estimado quando o tokenizador não está disponível)
+    """
+    if not text:
+        return 0
+
+    encode = _get_encoder(model_name)
+    if encode is None:
+        # Aproximação usual: ~4 caracteres por token
+        return max(1, len(text) // 4)
+    return len(encode(text))
+
+
+def count_message_tokens(message: BaseMessage, model_name: str = "gpt-4o-mini") -> int:
+    """
+    Conta os tokens de uma mensagem de chat, incluindo o overhead do formato
+
+    Args:
+        message: Mensagem do LangChain
+        model_name: Modelo cujo tokenizador deve ser usado
+
+    Returns:
+        Número de tokens da mensagem
+    """
+    content = message.content if isinstance(message.content, str) else str(message.content)
+    return count_tokens(content, model_name) + MESSAGE_OVERHEAD_TOKENS
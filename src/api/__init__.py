@@ -0,0 +1,9 @@
+"""API HTTP do agente (submódulos importados sob demanda)"""
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "create_app": ".server",
+    "AdmissionController": ".concurrency",
+    "Coalescer": ".concurrency",
+    "QueueFullError": ".concurrency",
+})
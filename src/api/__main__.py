@@ -0,0 +1,4 @@
+"""Permite executar a API com `python -m src.api`"""
+from .server import main
+
+main()
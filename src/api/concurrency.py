@@ -0,0 +1,125 @@
+"""
+Controle de carga da API
+
+- AdmissionController: limita quantas requisições rodam ao mesmo tempo e
+  quantas podem esperar na fila; além disso a requisição é recusada na hora
+  (HTTP 503), em vez de acumular latência sem limite.
+- Coalescer: requisições idênticas em andamento compartilham uma única
+  execução (single-flight).
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class QueueFullError(Exception):
+    """Fila de espera cheia ou tempo de espera esgotado"""
+
+
+class AdmissionController:
+    """Concorrência limitada com fila de espera de tamanho fixo"""
+
+    def __init__(self, max_concurrency: int = 32, max_queue: int = 128, queue_timeout: float = 30.0):
+        """
+        Inicializa o controle de admissão
+
+        Args:
+            max_concurrency: Requisições executando ao mesmo tempo
+            max_queue: Requisições aguardando vaga (além disso, recusa com 503)
+            queue_timeout: Segundos máximos de espera na fila
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    def admit(self):
+        """
+        Recusa na hora se a fila estiver cheia, sem ocupar vaga
+
+        Útil antes de respostas em streaming, cuja vaga só é ocupada quando o
+        corpo começa a ser enviado.
+
+        Raises:
+            QueueFullError: Todas as vagas ocupadas e fila de espera cheia
+        """
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise QueueFullError("Fila de requisições cheia")
+
+    @asynccontextmanager
+    async def slot(self):
+        """Ocupa uma vaga de execução durante o bloco `async with`"""
+        self.admit()
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise QueueFullError("Tempo de espera na fila esgotado")
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+
+class Coalescer:
+    """Agrupa chamadas idênticas em andamento em uma única execução"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa `factory()` ou aguarda a execução já em andamento para a mesma chave
+
+        Se a execução em andamento for cancelada, as chamadas que a aguardavam
+        não ficam presas: uma delas executa `factory()` de novo.
+
+        Args:
+            key: Identificador da chamada
+            factory: Função que cria a corrotina a executar
+
+        Returns:
+            Resultado da execução (compartilhado entre as chamadas agrupadas)
+        """
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Execução líder cancelada: tenta de novo (talvez como líder);
+                # se a cancelada foi esta chamada, propaga
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Evita aviso de exceção não lida quando ninguém mais aguardava
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
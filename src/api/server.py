@@ -0,0 +1,228 @@
+"""
+API HTTP/JSON do BrasileirãoGPT
+
+Expõe o agente e a classificação para outros serviços, sem o custo de
+reexecução do script do Streamlit:
+
+- POST /chat: resposta completa do agente
+- POST /chat/stream: resposta em Server-Sent Events (tokens e ferramentas)
+- GET /standings, /standings/team/{time}, /standings/zone/{zona}, /standings/range
+- GET /health e /metrics
+
+A concorrência é limitada (API_MAX_CONCURRENCY) com fila de espera
+(API_MAX_QUEUE); com a fila cheia a API responde 503 com Retry-After.
+Consultas idênticas à classificação em andamento são agrupadas em uma só.
+
+Execute: python -m src.api
+"""
+import asyncio
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import BaseModel
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from ..agents import ConversationalAgent, create_agent, get_tool_single_flight
+from ..config import settings
+from ..telemetry import telemetry
+from ..tools import get_standings_store, standings_cache
+from .concurrency import AdmissionController, Coalescer, QueueFullError
+
+
+class ChatRequest(BaseModel):
+    """Corpo de POST /chat e POST /chat/stream"""
+
+    message: str
+    session_id: Optional[str] = None
+
+
+class SessionPool:
+    """Agentes por sessão, com limite de sessões em memória (LRU)"""
+
+    def __init__(self, max_sessions: int = 1000):
+        """
+        Args:
+            max_sessions: Máximo de sessões mantidas; as menos recentes são descartadas
+        """
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Tuple[ConversationalAgent, asyncio.Lock]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: Optional[str]) -> Tuple[str, ConversationalAgent, asyncio.Lock]:
+        """
+        Retorna o agente da sessão, criando-o se necessário
+
+        Com HISTORY_BACKEND externo, uma sessão descartada daqui é recriada
+        com o histórico intacto.
+
+        Returns:
+            Tupla (ID da sessão, agente, lock que serializa os turnos da sessão)
+        """
+        session_id = session_id or uuid.uuid4().hex
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                agent = create_agent(session_id=session_id)
+                entry = self._sessions[session_id] = (agent, asyncio.Lock())
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session_id)
+        return (session_id,) + entry
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+def _sse(event: Dict[str, Any], name: Optional[str] = None) -> str:
+    """Formata um evento Server-Sent Events"""
+    prefix = f"event: {name}\n" if name else ""
+    return f"{prefix}data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+def _standings_metadata(store) -> Dict[str, Any]:
+    return {key: value for key, value in store.metadata.items() if key != "success"}
+
+
+def create_app() -> FastAPI:
+    """
+    Cria a aplicação FastAPI com seus controles de carga
+
+    Returns:
+        Aplicação pronta para o uvicorn
+    """
+    app = FastAPI(title="BrasileirãoGPT API")
+    admission = AdmissionController(
+        max_concurrency=settings.API_MAX_CONCURRENCY,
+        max_queue=settings.API_MAX_QUEUE,
+        queue_timeout=settings.API_QUEUE_TIMEOUT,
+    )
+    coalescer = Coalescer()
+    sessions = SessionPool(settings.API_MAX_SESSIONS)
+    app.state.admission = admission
+    app.state.coalescer = coalescer
+    app.state.sessions = sessions
+
+    @app.exception_handler(QueueFullError)
+    async def queue_full_handler(request: Request, exc: QueueFullError):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": "1"},
+        )
+
+    async def standings_lookup(key: Tuple, func):
+        """Consulta a classificação em thread, agrupando chamadas idênticas"""
+        async with admission.slot():
+            return await coalescer.run(key, lambda: run_in_threadpool(func))
+
+    @app.get("/health")
+    async def health():
+        return {
+            "status": "ok",
+            "active": admission.active,
+            "waiting": admission.waiting,
+            "rejected": admission.rejected,
+            "coalesced": coalescer.coalesced,
+            "tool_calls_coalesced": get_tool_single_flight().coalesced,
+            "sessions": len(sessions),
+            "standings_version": standings_cache.version,
+        }
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        sink = telemetry.metrics
+        if sink is None:
+            raise HTTPException(status_code=404, detail="Telemetria desativada")
+        return sink.render_prometheus()
+
+    @app.post("/chat")
+    async def chat(request: ChatRequest):
+        async with admission.slot():
+            # Criar o agente lê o histórico externo: fora do event loop
+            session_id, agent, lock = await run_in_threadpool(sessions.get, request.session_id)
+            async with lock:
+                response = await agent.achat(request.message)
+        return {"session_id": session_id, "response": response}
+
+    @app.post("/chat/stream")
+    async def chat_stream(request: ChatRequest):
+        # Fila cheia ainda gera 503; a vaga só é ocupada dentro do corpo, para
+        # ser liberada mesmo que o cliente desconecte antes de lê-lo
+        admission.admit()
+
+        async def events():
+            try:
+                async with admission.slot():
+                    session_id, agent, lock = await run_in_threadpool(sessions.get, request.session_id)
+                    async with lock:
+                        yield _sse({"session_id": session_id}, "session")
+                        async for event in iterate_in_threadpool(agent.stream_chat(request.message)):
+                            yield _sse(event, event["type"])
+                        yield _sse({}, "done")
+            except QueueFullError as e:
+                # A resposta já começou: o erro vai como evento
+                yield _sse({"type": "error", "content": str(e)}, "error")
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/standings")
+    async def standings():
+        return await standings_lookup(("standings",), standings_cache.get)
+
+    @app.get("/standings/team/{time}")
+    async def standings_team(time: str):
+        def lookup():
+            store = get_standings_store()
+            return store.team(time), _standings_metadata(store)
+
+        row, metadata = await standings_lookup(("team", time.lower()), lookup)
+        if row is None:
+            raise HTTPException(status_code=404, detail=f"Time '{time}' não encontrado na tabela.")
+        return {**metadata, "time": row}
+
+    @app.get("/standings/zone/{zona}")
+    async def standings_zone(zona: str):
+        def lookup():
+            store = get_standings_store()
+            return store.zone(zona), _standings_metadata(store)
+
+        rows, metadata = await standings_lookup(("zone", zona.lower()), lookup)
+        if rows is None:
+            raise HTTPException(status_code=404, detail=f"Zona '{zona}' desconhecida.")
+        return {**metadata, "zona": zona, "classificacao": rows}
+
+    @app.get("/standings/range")
+    async def standings_range(inicio: int = 1, fim: int = 20):
+        def lookup():
+            store = get_standings_store()
+            return store.position_range(inicio, fim), _standings_metadata(store)
+
+        rows, metadata = await standings_lookup(("range", inicio, fim), lookup)
+        return {**metadata, "classificacao": rows}
+
+    return app
+
+
+def main():
+    """Ponto de entrada de linha de comando da API (python -m src.api)"""
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="API HTTP do BrasileirãoGPT")
+    parser.add_argument("--host", default=settings.API_HOST)
+    parser.add_argument("--port", type=int, default=settings.API_PORT)
+    args = parser.parse_args()
+
+    # Um único worker: o pool de conexões e os caches são do processo
+    uvicorn.run(create_app(), host=args.host, port=args.port, log_level="info")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,110 @@ class Settings:
     
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    # Endpoint compatível com a API da OpenAI (vazio = api.openai.com)
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")
+    # Chave de roteamento do cache de prefixo do provedor (vazio = não enviar).
+    # Opcional: versões antigas do SDK da OpenAI rejeitam o parâmetro
+    PROMPT_CACHE_KEY: str = os.getenv("PROMPT_CACHE_KEY", "")
     TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
     MAX_TOKENS: int = int(os.getenv("MAX_TOKENS", "2000"))
+    # Monta o cliente LLM e as ferramentas em segundo plano após a primeira tela
+    AGENT_WARMUP: bool = os.getenv("AGENT_WARMUP", "true").lower() == "true"
+    
+    # Memória da conversa
+    MEMORY_TOKEN_BUDGET: int = int(os.getenv("MEMORY_TOKEN_BUDGET", "3000"))
+    MEMORY_SUMMARY_ENABLED: bool = os.getenv("MEMORY_SUMMARY_ENABLED", "true").lower() == "true"
+    # Armazenamento do histórico: local (no próprio agente), memory, sqlite ou redis
+    HISTORY_BACKEND: str = os.getenv("HISTORY_BACKEND", "local")
+    HISTORY_SQLITE_PATH: str = os.getenv("HISTORY_SQLITE_PATH", "data/history.db")
+    HISTORY_REDIS_URL: str = os.getenv("HISTORY_REDIS_URL", "redis://localhost:6379/0")
+    HISTORY_IDLE_TIMEOUT: float = float(os.getenv("HISTORY_IDLE_TIMEOUT", "3600"))
+    # Chave que assina o ID da sessão na URL (vazio = chave aleatória por processo)
+    SESSION_SECRET: str = os.getenv("SESSION_SECRET", "")
+    
+    # Cache de respostas (opcional)
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+    RESPONSE_CACHE_TTL: float = float(os.getenv("RESPONSE_CACHE_TTL", "600"))
+    RESPONSE_CACHE_SIMILARITY: float = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0"))
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    
+    # Roteador de intenções: perguntas simples sobre a tabela respondidas sem o LLM
+    # (desligado por padrão: as regras ainda estão em ajuste)
+    ROUTER_ENABLED: bool = os.getenv("ROUTER_ENABLED", "false").lower() == "true"
+    ROUTER_MIN_CONFIDENCE: float = float(os.getenv("ROUTER_MIN_CONFIDENCE", "0.8"))
+    # Classificador opcional no formato "pacote.modulo:funcao"
+    ROUTER_CLASSIFIER: str = os.getenv("ROUTER_CLASSIFIER", "")
+    
+    # Instrumentação
+    TELEMETRY_ENABLED: bool = os.getenv("TELEMETRY_ENABLED", "true").lower() == "true"
+    TELEMETRY_JSONL_PATH: str = os.getenv("TELEMETRY_JSONL_PATH", "")
+    TELEMETRY_PANEL: bool = os.getenv("TELEMETRY_PANEL", "false").lower() == "true"
+    
+    # Pool de conexões HTTP com o provedor do modelo
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+    
+    # Execução de ferramentas
+    TOOL_TIMEOUT: float = float(os.getenv("TOOL_TIMEOUT", "15"))
+    TOOL_MAX_WORKERS: int = int(os.getenv("TOOL_MAX_WORKERS", "8"))
+    # Dispara a ferramenta provável em paralelo com a primeira chamada ao modelo
+    SPECULATIVE_PREFETCH: bool = os.getenv("SPECULATIVE_PREFETCH", "true").lower() == "true"
+    # Chamadas idênticas em andamento (mesma ferramenta e argumentos) compartilham uma execução
+    TOOL_COALESCING: bool = os.getenv("TOOL_COALESCING", "true").lower() == "true"
+    # Ferramentas enviadas ao modelo em cada turno: all (prefixo igual em todos os
+    # turnos, aproveita o cache de prefixo) ou relevant (só as citadas pela pergunta:
+    # menos tokens, mas o prefixo muda com o subconjunto e o cache é menos reaproveitado)
+    TOOL_SELECTION: str = os.getenv("TOOL_SELECTION", "all")
+    # Descobre ferramentas de pacotes instalados (entry points "brasileiraogpt.tools")
+    TOOL_PLUGINS_ENABLED: bool = os.getenv("TOOL_PLUGINS_ENABLED", "true").lower() == "true"
+    # Formato dos resultados: json, json_compact, json_min, csv ou tsv
+    TOOL_OUTPUT_FORMAT: str = os.getenv("TOOL_OUTPUT_FORMAT", "json_compact")
+    
+    # Fonte de dados da classificação
+    SOFASCORE_BASE_URL: str = os.getenv("SOFASCORE_BASE_URL", "https://api.sofascore.com/api/v1")
+    SOFASCORE_TOURNAMENT_ID: int = int(os.getenv("SOFASCORE_TOURNAMENT_ID", "325"))
+    SOFASCORE_SEASON_ID: int = int(os.getenv("SOFASCORE_SEASON_ID", "87678"))
+    SOFASCORE_SEASON_YEAR: str = os.getenv("SOFASCORE_SEASON_YEAR", "2024")
+    SOFASCORE_TIMEOUT: float = float(os.getenv("SOFASCORE_TIMEOUT", "10"))
+    
+    # Fontes externas: API-Football opcional, hedge e circuit breaker
+    API_FOOTBALL_KEY: str = os.getenv("API_FOOTBALL_KEY", "")
+    API_FOOTBALL_LEAGUE: int = int(os.getenv("API_FOOTBALL_LEAGUE", "71"))
+    UPSTREAM_HEDGE_DELAY: float = float(os.getenv("UPSTREAM_HEDGE_DELAY", "1.5"))
+    UPSTREAM_TIMEOUT: float = float(os.getenv("UPSTREAM_TIMEOUT", "10"))
+    BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))
+    BREAKER_RESET_TIMEOUT: float = float(os.getenv("BREAKER_RESET_TIMEOUT", "60"))
+    
+    # Snapshot local e worker de ingestão
+    # STANDINGS_SOURCE: auto (snapshot se recente, senão rede), snapshot ou network
+    STANDINGS_SOURCE: str = os.getenv("STANDINGS_SOURCE", "auto")
+    STANDINGS_SNAPSHOT_PATH: str = os.getenv("STANDINGS_SNAPSHOT_PATH", "data/standings.db")
+    STANDINGS_SNAPSHOT_MAX_AGE: float = float(os.getenv("STANDINGS_SNAPSHOT_MAX_AGE", "1800"))
+    INGESTION_INTERVAL: float = float(os.getenv("INGESTION_INTERVAL", "300"))
+    
+    # Cache da classificação (segundos)
+    STANDINGS_CACHE_TTL: float = float(os.getenv("STANDINGS_CACHE_TTL", "300"))
+    STANDINGS_CACHE_STALE_TTL: float = float(os.getenv("STANDINGS_CACHE_STALE_TTL", "3600"))
+    STANDINGS_CACHE_NEGATIVE_TTL: float = float(os.getenv("STANDINGS_CACHE_NEGATIVE_TTL", "60"))
+    
+    # Partidas da temporada (rodadas, jogos e resultados)
+    MATCHES_CACHE_TTL: float = float(os.getenv("MATCHES_CACHE_TTL", "600"))
+    MATCHES_MAX_PAGES: int = int(os.getenv("MATCHES_MAX_PAGES", "20"))
+    
+    # Simulação Monte Carlo do restante da temporada
+    SIMULATION_RUNS: int = int(os.getenv("SIMULATION_RUNS", "100000"))
+    # Processos usados na simulação (0 = no próprio processo)
+    SIMULATION_WORKERS: int = int(os.getenv("SIMULATION_WORKERS", "0"))
+    
+    # API HTTP (python -m src.api)
+    API_HOST: str = os.getenv("API_HOST", "127.0.0.1")
+    API_PORT: int = int(os.getenv("API_PORT", "8000"))
+    API_MAX_CONCURRENCY: int = int(os.getenv("API_MAX_CONCURRENCY", "32"))
+    API_MAX_QUEUE: int = int(os.getenv("API_MAX_QUEUE", "128"))
+    API_QUEUE_TIMEOUT: float = float(os.getenv("API_QUEUE_TIMEOUT", "30"))
+    API_MAX_SESSIONS: int = int(os.getenv("API_MAX_SESSIONS", "1000"))
     
     @classmethod
     def validate(cls) -> bool:
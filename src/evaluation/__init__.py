@@ -0,0 +1,15 @@
+"""
+Avaliação em lote do agente (python -m src.evaluation)
+
+Os submódulos dependem do agente e do LangChain e são importados sob demanda.
+"""
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "BatchRunner": ".batch",
+    "Conversation": ".batch",
+    "TraceCollector": ".batch",
+    "load_conversations": ".batch",
+    "FakeChatModel": ".fake_llm",
+    "JsonlLLMCache": ".llm_cache",
+})
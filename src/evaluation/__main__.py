@@ -0,0 +1,4 @@
+"""Permite executar a avaliação em lote com `python -m src.evaluation`"""
+from .cli import main
+
+main()
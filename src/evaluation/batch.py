@@ -0,0 +1,360 @@
+"""
+Execução em lote de conversas com o ConversationalAgent
+
+Lê conversas de um JSONL, executa cada uma em uma sessão própria com
+concorrência limitada (threads para `chat`/`stream`, tarefas assíncronas para
+`achat`) e grava, na ordem de entrada, uma linha por conversa com as
+respostas, as chamadas de ferramenta, os tokens e os tempos de cada turno
+(extraídos do registro de turno da telemetria).
+
+Formato de entrada, uma conversa por linha:
+
+    {"id": "z4", "messages": ["Quem está no Z4?", {"content": "E o líder?", "expect": ["Botafogo"]}]}
+
+`expect` lista trechos que a resposta precisa conter (sem diferenciar acentos
+ou maiúsculas); o resultado do turno indica os que faltaram.
+"""
+import asyncio
+import json
+import statistics
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from ..agents import create_agent
+from ..agents.resources import AgentResources
+from ..telemetry import TraceSink, TurnTrace, telemetry
+from ..tools.standings_store import normalize_name
+
+
+class Conversation(NamedTuple):
+    """Conversa a executar: identificador e turnos ({"content", "expect"})"""
+
+    id: str
+    turns: List[Dict[str, Any]]
+
+
+def parse_conversation(data: Any, index: int) -> Conversation:
+    """
+    Converte uma linha do JSONL em conversa
+
+    Args:
+        data: Objeto com "messages" (e "id" opcional) ou lista de mensagens
+        index: Posição da linha (identificador padrão)
+
+    Returns:
+        Conversa com os turnos normalizados
+    """
+    if isinstance(data, list):
+        data = {"messages": data}
+    if not isinstance(data, dict) or not isinstance(data.get("messages"), list):
+        raise ValueError(f"Conversa {index + 1}: esperado um objeto com a lista 'messages'")
+
+    turns = []
+    for message in data["messages"]:
+        if isinstance(message, str):
+            message = {"content": message}
+        if not isinstance(message, dict) or not isinstance(message.get("content"), str):
+            raise ValueError(f"Conversa {index + 1}: mensagem inválida {message!r}")
+        turns.append({"content": message["content"], "expect": list(message.get("expect", []))})
+    return Conversation(str(data.get("id", index + 1)), turns)
+
+
+def load_conversations(path: str) -> Iterator[Conversation]:
+    """
+    Lê as conversas de um arquivo JSONL sob demanda (linhas vazias são ignoradas)
+
+    Args:
+        path: Arquivo JSONL
+
+    Returns:
+        Iterador de conversas na ordem do arquivo
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        index = 0
+        for line in f:
+            if not line.strip():
+                continue
+            yield parse_conversation(json.loads(line), index)
+            index += 1
+
+
+def check_expectations(output: str, expected: Iterable[str]) -> Dict[str, Any]:
+    """Verifica se a resposta contém os trechos esperados (sem acentos ou caixa)"""
+    normalized = normalize_name(output)
+    missing = [text for text in expected if normalize_name(text) not in normalized]
+    return {"passed": not missing, "missing": missing}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentil por interpolação linear"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class TraceCollector(TraceSink):
+    """Guarda os registros de turno por sessão até a conversa terminar"""
+
+    def __init__(self):
+        self._traces: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def emit(self, trace: TurnTrace):
+        if trace.session_id is None:
+            return
+        with self._lock:
+            if trace.session_id in self._traces:
+                self._traces[trace.session_id].append(trace.to_dict())
+
+    def watch(self, session_id: str):
+        """Passa a guardar os turnos da sessão"""
+        with self._lock:
+            self._traces[session_id] = []
+
+    def pop(self, session_id: str) -> List[Dict[str, Any]]:
+        """Retorna e descarta os turnos da sessão"""
+        with self._lock:
+            return self._traces.pop(session_id, [])
+
+
+class BatchRunner:
+    """Executa conversas em paralelo e grava os resultados em JSONL"""
+
+    def __init__(
+        self,
+        resources: AgentResources,
+        mode: str = "chat",
+        concurrency: int = 8,
+        collector: Optional[TraceCollector] = None,
+    ):
+        """
+        Inicializa o executor
+
+        Args:
+            resources: Recursos do agente (modelo real ou simulado)
+            mode: Variante do agente: chat, achat ou stream
+            concurrency: Conversas executadas ao mesmo tempo
+            collector: Destino de telemetria que guarda os turnos (padrão: registrado em `telemetry`)
+        """
+        if mode not in ("chat", "achat", "stream"):
+            raise ValueError(f"Modo inválido: {mode}")
+        self.resources = resources
+        self.mode = mode
+        self.concurrency = max(1, concurrency)
+        self.run_id = uuid.uuid4().hex[:8]
+
+        if collector is None:
+            collector = TraceCollector()
+            telemetry.add_sink(collector)
+        self.collector = collector
+
+    def _session_id(self, index: int) -> str:
+        # Único por execução: com histórico persistente, execuções anteriores não interferem
+        return f"eval-{self.run_id}-{index}"
+
+    def _turn_result(self, turn: Dict[str, Any], output: str, trace: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Resultado de um turno a partir da resposta e do registro da telemetria"""
+        trace = trace or {}
+        result = {
+            "input": turn["content"],
+            "output": output,
+            "latency": trace.get("latency"),
+            "iterations": trace.get("iterations"),
+            "prompt_tokens": trace.get("prompt_tokens"),
+            "completion_tokens": trace.get("completion_tokens"),
+            "cached_tokens": trace.get("cached_tokens"),
+            "tools_bound": trace.get("tools_bound"),
+            "tool_calls": trace.get("tool_calls", []),
+            "route": trace.get("route"),
+            "cache_hits": trace.get("cache_hits", []),
+            "error": trace.get("error"),
+        }
+        if turn["expect"]:
+            result["checks"] = check_expectations(output, turn["expect"])
+        return result
+
+    def _conversation_result(
+        self,
+        conversation: Conversation,
+        session_id: str,
+        outputs: List[str],
+        started: float,
+        error: Optional[str],
+    ) -> Dict[str, Any]:
+        traces = self.collector.pop(session_id)
+        turns = [
+            self._turn_result(turn, output, traces[i] if i < len(traces) else None)
+            for i, (turn, output) in enumerate(zip(conversation.turns, outputs))
+        ]
+        return {
+            "id": conversation.id,
+            "session_id": session_id,
+            "turns": turns,
+            "latency": time.perf_counter() - started,
+            "error": error,
+        }
+
+    def run_conversation(self, index: int, conversation: Conversation) -> Dict[str, Any]:
+        """
+        Executa uma conversa em uma sessão nova (modos chat e stream)
+
+        Args:
+            index: Posição da conversa na entrada
+            conversation: Conversa a executar
+
+        Returns:
+            Resultado da conversa, turno a turno
+        """
+        session_id = self._session_id(index)
+        self.collector.watch(session_id)
+        outputs: List[str] = []
+        error = None
+        started = time.perf_counter()
+        try:
+            agent = create_agent(resources=self.resources, session_id=session_id)
+            try:
+                for turn in conversation.turns:
+                    if self.mode == "stream":
+                        output = "".join(
+                            event["content"] for event in agent.stream_chat(turn["content"])
+                            if event["type"] in ("token", "error")
+                        )
+                    else:
+                        output = agent.chat(turn["content"])
+                    outputs.append(output)
+            finally:
+                agent.clear_history()
+        except Exception as e:
+            error = str(e)
+        return self._conversation_result(conversation, session_id, outputs, started, error)
+
+    async def arun_conversation(
+        self,
+        index: int,
+        conversation: Conversation,
+        semaphore: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        """Executa uma conversa com `achat`, limitada pelo semáforo"""
+        async with semaphore:
+            session_id = self._session_id(index)
+            self.collector.watch(session_id)
+            outputs: List[str] = []
+            error = None
+            started = time.perf_counter()
+            try:
+                agent = create_agent(resources=self.resources, session_id=session_id)
+                try:
+                    for turn in conversation.turns:
+                        outputs.append(await agent.achat(turn["content"]))
+                finally:
+                    agent.clear_history()
+            except Exception as e:
+                error = str(e)
+            return self._conversation_result(conversation, session_id, outputs, started, error)
+
+    def run(self, conversations: Iterable[Conversation], write: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """
+        Executa as conversas e entrega os resultados na ordem de entrada
+
+        Só uma janela de conversas fica em andamento ou aguardando gravação, então
+        a memória não cresce com o tamanho da entrada.
+
+        Args:
+            conversations: Conversas a executar
+            write: Função chamada com o resultado de cada conversa
+
+        Returns:
+            Resumo da execução (ver `summarize`)
+        """
+        results: List[Dict[str, Any]] = []
+        window = 4 * self.concurrency
+
+        def deliver(result: Dict[str, Any]):
+            write(result)
+            results.append(_compact(result))
+
+        started = time.perf_counter()
+        if self.mode == "achat":
+            # O cliente httpx assíncrono compartilhado pertence a um único event loop
+            asyncio.run(self._arun(conversations, deliver, window))
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="eval") as executor:
+                pending = deque()
+                for index, conversation in enumerate(conversations):
+                    pending.append(executor.submit(self.run_conversation, index, conversation))
+                    if len(pending) >= window:
+                        deliver(pending.popleft().result())
+                while pending:
+                    deliver(pending.popleft().result())
+        return summarize(results, time.perf_counter() - started)
+
+    async def _arun(self, conversations: Iterable[Conversation], deliver: Callable, window: int):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = deque()
+        for index, conversation in enumerate(conversations):
+            pending.append(asyncio.ensure_future(self.arun_conversation(index, conversation, semaphore)))
+            if len(pending) >= window:
+                deliver(await pending.popleft())
+        while pending:
+            deliver(await pending.popleft())
+
+
+def _compact(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Só os números do resultado usados no resumo (sem textos das respostas)"""
+    return {
+        "error": result["error"],
+        "turns": [
+            {
+                "latency": turn["latency"],
+                "error": turn["error"],
+                "prompt_tokens": turn["prompt_tokens"] or 0,
+                "completion_tokens": turn["completion_tokens"] or 0,
+                "cached_tokens": turn["cached_tokens"] or 0,
+                "tool_calls": len(turn["tool_calls"]),
+                "passed": turn["checks"]["passed"] if "checks" in turn else None,
+            }
+            for turn in result["turns"]
+        ],
+    }
+
+
+def summarize(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """
+    Resume uma execução em lote
+
+    Args:
+        results: Resultados compactados das conversas
+        elapsed: Duração total em segundos
+
+    Returns:
+        Contagens, latência por turno (p50/p95/p99), vazão e tokens
+    """
+    turns = [turn for result in results for turn in result["turns"]]
+    latencies = [turn["latency"] for turn in turns if turn["latency"] is not None]
+    checked = [turn["passed"] for turn in turns if turn["passed"] is not None]
+    return {
+        "conversations": len(results),
+        "conversation_errors": sum(1 for result in results if result["error"]),
+        "turns": len(turns),
+        "turn_errors": sum(1 for turn in turns if turn["error"]),
+        "checks": len(checked),
+        "failed_checks": sum(1 for passed in checked if not passed),
+        "elapsed_s": elapsed,
+        "throughput_turns_per_s": len(turns) / elapsed if elapsed else 0.0,
+        "latency_p50_s": percentile(latencies, 0.50),
+        "latency_p95_s": percentile(latencies, 0.95),
+        "latency_p99_s": percentile(latencies, 0.99),
+        "latency_mean_s": statistics.mean(latencies) if latencies else 0.0,
+        "prompt_tokens": sum(turn["prompt_tokens"] for turn in turns),
+        "completion_tokens": sum(turn["completion_tokens"] for turn in turns),
+        "cached_tokens": sum(turn["cached_tokens"] for turn in turns),
+        "tool_calls": sum(turn["tool_calls"] for turn in turns),
+    }
@@ -0,0 +1,96 @@
+"""
+Linha de comando da avaliação em lote
+
+Execute:
+    python -m src.evaluation conversas.jsonl -o resultados.jsonl --concurrency 16
+    python -m src.evaluation conversas.jsonl -o resultados.jsonl --llm openai --llm-cache respostas.jsonl
+
+Com `--llm fake` (padrão) as respostas vêm do modelo simulado no próprio
+processo, sem rede e sem chave de API. `--offline` lê a classificação e as
+partidas só do snapshot local (ou dos dados de exemplo, se não houver
+snapshot), sem consultar o SofaScore. O código de saída é 1 se algum turno
+falhar ou não contiver os trechos esperados.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Avaliação em lote do agente a partir de um JSONL de conversas")
+    parser.add_argument("input", help="JSONL com uma conversa por linha")
+    parser.add_argument("-o", "--output", required=True, help="JSONL de saída, uma linha por conversa")
+    parser.add_argument("--mode", choices=["chat", "achat", "stream"], default="chat", help="Variante do agente")
+    parser.add_argument("--concurrency", type=int, default=8, help="Conversas executadas ao mesmo tempo")
+    parser.add_argument("--llm", choices=["fake", "openai"], default="fake", help="Modelo usado nas respostas")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Espera por chamada do modelo simulado (s)")
+    parser.add_argument("--llm-cache", help="Cache JSONL das respostas do modelo (grava e repete)")
+    parser.add_argument("--offline", action="store_true", help="Dados só do snapshot local, sem rede")
+    parser.add_argument("--summary", help="Grava o resumo também em JSON")
+    return parser
+
+
+def main(argv=None):
+    """Ponto de entrada de linha de comando da avaliação"""
+    args = build_parser().parse_args(argv)
+
+    # As configurações são lidas na importação de `src.config`: define o ambiente antes
+    if args.llm == "fake":
+        os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+    if args.offline:
+        os.environ["STANDINGS_SOURCE"] = "snapshot"
+
+    from langchain_core.globals import set_llm_cache
+
+    from ..agents.resources import build_agent_resources
+    from ..config import settings
+    from ..telemetry import telemetry
+    from .batch import BatchRunner, load_conversations
+    from .fake_llm import FakeChatModel
+    from .llm_cache import JsonlLLMCache
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+
+    cache = None
+    if args.llm_cache:
+        cache = JsonlLLMCache(args.llm_cache)
+        set_llm_cache(cache)
+
+    llm = FakeChatModel(latency=args.llm_latency) if args.llm == "fake" else None
+    resources = build_agent_resources(settings.OPENAI_MODEL, settings.TEMPERATURE, settings.MAX_TOKENS, llm=llm)
+    if cache is not None and args.mode == "stream":
+        # O cache do LangChain só vale para invoke: o stream vira uma única chamada
+        resources.llm.disable_streaming = True
+
+    # Os resultados por turno vêm dos registros de turno
+    telemetry.enabled = True
+    runner = BatchRunner(resources, mode=args.mode, concurrency=args.concurrency)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        def write(result):
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+            f.flush()
+
+        summary = runner.run(load_conversations(args.input), write)
+
+    if cache is not None:
+        summary["llm_cache"] = cache.stats()
+
+    print("=" * 60)
+    print(f"AVALIAÇÃO EM LOTE ({args.llm}, {args.mode}, concorrência {runner.concurrency})")
+    print("=" * 60)
+    for key, value in summary.items():
+        if isinstance(value, float):
+            print(f"{key:<28} {value:>12.4f}")
+        else:
+            print(f"{key:<28} {str(value):>12}")
+    print("=" * 60)
+
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    failed = summary["conversation_errors"] + summary["turn_errors"] + summary["failed_checks"]
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,196 @@
+"""
+Modelo de chat simulado, no próprio processo, para avaliações offline
+
+Substitui o ChatOpenAI sem rede, sem chave de API e sem servidor: decide as
+chamadas de ferramenta a partir das palavras-chave do registro de ferramentas
+e dos nomes próprios e números da pergunta, e responde com um trecho do
+resultado das ferramentas. A mesma conversa produz sempre as mesmas mensagens
+(inclusive os IDs das chamadas de ferramenta), então as respostas podem ser
+guardadas no cache do LangChain e comparadas entre execuções.
+
+A contagem de tokens é uma estimativa por caracteres (~4 por token), para não
+depender de o tokenizador estar disponível no ambiente.
+"""
+import hashlib
+import json
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from ..tools import get_tool_registry
+from ..tools.standings_store import normalize_name
+
+# Ferramenta usada quando a pergunta fala da tabela sem citar outra ferramenta
+TABLE_TOOL = "TabelaBrasileirão"
+TABLE_PATTERN = re.compile(r"\b(tabela|classifica|lider|brasileir)")
+# Ferramenta usada quando a pergunta cita um time sem citar outra ferramenta
+TEAM_TOOL = "ConsultarTime"
+
+_TOKEN = re.compile(r"[\w'-]+|[.!?]")
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4) if text else 0
+
+
+def extract_terms(text: str) -> Dict[str, List[str]]:
+    """
+    Extrai da pergunta os nomes próprios (ex.: "São Paulo", "Z4") e os números
+
+    Palavras em maiúscula no início de uma frase não contam como nome próprio.
+
+    Args:
+        text: Pergunta do usuário
+
+    Returns:
+        Dicionário com as listas "nomes" e "numeros", na ordem da pergunta
+    """
+    names: List[str] = []
+    numbers: List[str] = []
+    current: List[str] = []
+    sentence_start = True
+
+    def flush():
+        if current:
+            names.append(" ".join(current))
+            current.clear()
+
+    for token in _TOKEN.findall(text):
+        if token in ".!?":
+            flush()
+            sentence_start = True
+            continue
+        if token.isdigit():
+            flush()
+            numbers.append(token)
+        elif token[0].isupper() and not sentence_start:
+            current.append(token)
+        else:
+            flush()
+        sentence_start = False
+    flush()
+    return {"nomes": names, "numeros": numbers}
+
+
+def _fill_arguments(parameters: Dict[str, Any], terms: Dict[str, List[str]]) -> Optional[Dict[str, Any]]:
+    """
+    Preenche os argumentos de uma ferramenta com os termos da pergunta
+
+    Argumentos inteiros recebem os números; os de texto, os nomes próprios (ou
+    os números, na falta de nomes). Opcionais só são preenchidos se sobrar termo.
+
+    Returns:
+        Argumentos ou None se algum argumento obrigatório ficar sem valor
+    """
+    names, numbers = list(terms["nomes"]), list(terms["numeros"])
+    required = set(parameters.get("required", []))
+    args: Dict[str, Any] = {}
+    for name, schema in parameters.get("properties", {}).items():
+        if schema.get("type") == "integer":
+            value = int(numbers.pop(0)) if numbers else None
+        else:
+            value = names.pop(0) if names else (numbers.pop(0) if numbers else None)
+        if value is not None:
+            args[name] = value
+        elif name in required:
+            return None
+    return args
+
+
+class FakeChatModel(BaseChatModel):
+    """Modelo determinístico que chama as ferramentas do app e resume os resultados"""
+
+    latency: float = 0.0
+    """Segundos de espera por chamada (simula o tempo do provedor)"""
+    answer_chars: int = 400
+    """Tamanho máximo do trecho dos resultados incluído na resposta"""
+
+    @property
+    def _llm_type(self) -> str:
+        return "brasileiraogpt-fake"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"answer_chars": self.answer_chars}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        """Vincula as ferramentas no formato da OpenAI, como o ChatOpenAI"""
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def _plan_tool_call(self, question: str, tools: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Escolhe a ferramenta e os argumentos para a pergunta (ou None para responder direto)"""
+        available = {tool["function"]["name"]: tool["function"] for tool in tools if "function" in tool}
+        terms = extract_terms(question)
+
+        candidates = [name for name in get_tool_registry().matching(question) if name in available]
+        if TABLE_PATTERN.search(normalize_name(question)):
+            candidates.append(TABLE_TOOL)
+        if terms["nomes"]:
+            candidates.append(TEAM_TOOL)
+
+        for name in candidates:
+            if name not in available:
+                continue
+            args = _fill_arguments(available[name].get("parameters", {}), terms)
+            if args is None:
+                continue
+            digest = hashlib.sha1(json.dumps([question, name, args], sort_keys=True).encode("utf-8"))
+            return {"name": name, "args": args, "id": f"call_{digest.hexdigest()[:12]}", "type": "tool_call"}
+        return None
+
+    def _answer(self, question: str, results: List[str]) -> str:
+        """Resposta final: trecho dos resultados das ferramentas ou uma resposta direta"""
+        if not results:
+            return f"Resposta simulada para \"{question}\", sem consultar ferramentas."
+        excerpt = " ".join(" ".join(results).split())
+        if len(excerpt) > self.answer_chars:
+            excerpt = excerpt[:self.answer_chars].rstrip() + "..."
+        return f"Resposta simulada com base nas ferramentas: {excerpt}"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+
+        # Resultados das ferramentas desde a última pergunta
+        results: List[str] = []
+        question = ""
+        for message in reversed(messages):
+            if isinstance(message, ToolMessage):
+                results.append(str(message.content))
+            elif isinstance(message, HumanMessage):
+                question = str(message.content)
+                break
+        results.reverse()
+
+        tool_call = None
+        if tools and isinstance(messages[-1], HumanMessage):
+            tool_call = self._plan_tool_call(question, tools)
+
+        if tool_call is not None:
+            message = AIMessage(content="", tool_calls=[tool_call])
+            output_tokens = _estimate_tokens(json.dumps(tool_call["args"])) + 8
+        else:
+            content = self._answer(question, results)
+            message = AIMessage(content=content)
+            output_tokens = _estimate_tokens(content)
+
+        prompt = "".join(str(m.content) for m in messages) + (json.dumps(tools) if tools else "")
+        input_tokens = _estimate_tokens(prompt)
+        message.usage_metadata = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)])
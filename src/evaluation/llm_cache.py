@@ -0,0 +1,109 @@
+"""
+Cache de respostas do modelo em arquivo JSONL
+
+Implementa o `BaseCache` do LangChain: registrado com `set_llm_cache`, vale
+para qualquer modelo de chat chamado com `invoke`/`ainvoke` (o modelo
+simulado ou o ChatOpenAI). Uma avaliação com o modelo real grava as respostas
+e as execuções seguintes repetem as mesmas conversas sem rede e sem custo.
+
+Cada linha guarda o hash do prompt e dos parâmetros do modelo (incluindo as
+ferramentas vinculadas) e as mensagens geradas; linhas novas são acrescentadas
+ao final do arquivo.
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+
+def _without_usage(value: Any) -> Any:
+    """Remove `usage_metadata` das mensagens serializadas"""
+    if isinstance(value, dict):
+        return {key: _without_usage(item) for key, item in value.items() if key != "usage_metadata"}
+    if isinstance(value, list):
+        return [_without_usage(item) for item in value]
+    return value
+
+
+class JsonlLLMCache(BaseCache):
+    """Cache persistente e compartilhado entre threads, indexado pelo hash do prompt"""
+
+    def __init__(self, path: str):
+        """
+        Inicializa o cache, carregando as respostas já gravadas
+
+        Args:
+            path: Arquivo JSONL (criado na primeira gravação)
+        """
+        self.path = path
+        self._entries: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry["generations"]
+                    except (ValueError, KeyError):
+                        # Linha truncada (ex.: execução interrompida durante a gravação)
+                        continue
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        # O uso de tokens das respostas no histórico não vai para o modelo e
+        # muda em acertos de cache (o LangChain acrescenta o custo zero)
+        try:
+            prompt = json.dumps(_without_usage(json.loads(prompt)), sort_keys=True)
+        except ValueError:
+            pass
+        return hashlib.sha256(f"{llm_string}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            generations = self._entries.get(key)
+            if generations is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return [
+            ChatGeneration(message=messages_from_dict([item["message"]])[0])
+            if "message" in item else Generation(text=item["text"])
+            for item in generations
+        ]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]):
+        key = self._key(prompt, llm_string)
+        generations = [
+            {"message": message_to_dict(generation.message)}
+            if isinstance(generation, ChatGeneration) else {"text": generation.text}
+            for generation in return_val
+        ]
+        line = json.dumps({"key": key, "generations": generations}, ensure_ascii=False)
+        with self._lock:
+            self._entries[key] = generations
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def clear(self, **kwargs: Any):
+        with self._lock:
+            self._entries.clear()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def stats(self) -> Dict[str, int]:
+        """Acertos, faltas e respostas guardadas"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
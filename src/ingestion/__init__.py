@@ -0,0 +1,54 @@
+"""
+Módulo de ingestão de dados da classificação e das partidas
+
+O worker e o backfill são executados como módulos (python -m src.ingestion.worker,
+python -m src.ingestion.backfill) e por isso não são importados aqui.
+"""
+from .http import RateLimiter, create_session
+from .matches import fetch_events_page, fetch_season_matches
+from .providers import (
+    ApiFootballProvider,
+    CircuitBreaker,
+    ProviderChain,
+    SnapshotProvider,
+    SofaScoreProvider,
+    StandingsProvider,
+    UpstreamError,
+)
+from .snapshot import Snapshot, SnapshotStore
+from .sofascore import (
+    MATCH_STATUS,
+    TOURNAMENTS,
+    MatchRecord,
+    events_url,
+    parse_event,
+    parse_standings,
+    resolve_tournament,
+    standings_url,
+)
+from .stream_json import JsonArrayStream
+
+__all__ = [
+    "Snapshot",
+    "SnapshotStore",
+    "parse_standings",
+    "standings_url",
+    "events_url",
+    "parse_event",
+    "MatchRecord",
+    "MATCH_STATUS",
+    "JsonArrayStream",
+    "fetch_events_page",
+    "fetch_season_matches",
+    "TOURNAMENTS",
+    "resolve_tournament",
+    "RateLimiter",
+    "create_session",
+    "ApiFootballProvider",
+    "CircuitBreaker",
+    "ProviderChain",
+    "SnapshotProvider",
+    "SofaScoreProvider",
+    "StandingsProvider",
+    "UpstreamError",
+]
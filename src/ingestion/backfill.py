@@ -0,0 +1,184 @@
+"""
+Backfill em massa da classificação de várias temporadas
+
+Busca a lista de temporadas de cada torneio e, em paralelo, a classificação
+de cada uma, gravando tudo no snapshot local. As consultas históricas do chat
+(ferramenta TabelaHistorica) leem apenas esse armazenamento.
+
+Execute: python -m src.ingestion.backfill --tournament serie-a --tournament serie-b --from 2015
+"""
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, List, Optional, Tuple
+
+import requests
+
+from ..config import settings
+from .http import RateLimiter, create_session
+from .snapshot import SnapshotStore
+from .sofascore import TOURNAMENTS, parse_standings, resolve_tournament, seasons_url, standings_url
+
+logger = logging.getLogger(__name__)
+
+
+class Backfill:
+    """Preenche o snapshot local com a classificação de muitas temporadas"""
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        workers: int = 8,
+        rate: float = 5.0,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Inicializa o backfill
+
+        Args:
+            store: Snapshot local onde os dados são gravados
+            workers: Número de requisições simultâneas
+            rate: Máximo de requisições por segundo
+            session: Sessão HTTP com pool de conexões (padrão: uma nova com `workers` conexões)
+        """
+        self.store = store
+        self.workers = workers
+        self.session = session or create_session(pool_size=workers)
+        self.limiter = RateLimiter(rate, burst=workers)
+
+    def _get_json(self, url: str) -> Optional[dict]:
+        """GET limitado por taxa; retorna o JSON ou None em caso de falha"""
+        self.limiter.acquire()
+        try:
+            response = self.session.get(url, timeout=settings.SOFASCORE_TIMEOUT)
+        except requests.RequestException as e:
+            logger.warning("Falha ao consultar %s: %s", url, e)
+            return None
+
+        if response.status_code != 200:
+            logger.warning("Status %s em %s", response.status_code, url)
+            return None
+
+        # Corpo malformado conta como falha da página, sem interromper o backfill
+        try:
+            payload = response.json()
+        except ValueError as e:
+            logger.warning("JSON inválido em %s: %s", url, e)
+            return None
+        if not isinstance(payload, dict):
+            logger.warning("Resposta inesperada em %s", url)
+            return None
+        return payload
+
+    def fetch_seasons(
+        self,
+        tournament_id: int,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Busca e registra as temporadas de um torneio dentro do intervalo de anos
+
+        Args:
+            tournament_id: ID do torneio no SofaScore
+            year_from: Primeiro ano (inclusive)
+            year_to: Último ano (inclusive)
+
+        Returns:
+            Tuplas (ID da temporada, ano, nome)
+        """
+        payload = self._get_json(seasons_url(tournament_id)) or {}
+
+        seasons = []
+        for season in payload.get("seasons", []):
+            year = str(season.get("year", ""))
+            if not year[:4].isdigit():
+                continue
+            if year_from and int(year[:4]) < year_from:
+                continue
+            if year_to and int(year[:4]) > year_to:
+                continue
+            seasons.append((season["id"], year, season.get("name", "")))
+
+        self.store.write_seasons(tournament_id, seasons)
+        return seasons
+
+    def fetch_standings(self, tournament_id: int, title: str, season_id: int, year: str) -> bool:
+        """
+        Busca e grava a classificação de uma temporada
+
+        Returns:
+            True se a temporada foi gravada
+        """
+        payload = self._get_json(standings_url(tournament_id, season_id))
+        data = parse_standings(payload, campeonato=title, temporada=year) if payload else None
+        if data is None:
+            return False
+
+        self.store.write(tournament_id, season_id, data)
+        return True
+
+    def run(
+        self,
+        tournaments: Iterable[str],
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """
+        Executa o backfill dos torneios informados
+
+        Args:
+            tournaments: Apelidos dos torneios (ex.: "serie-a")
+            year_from: Primeiro ano (inclusive)
+            year_to: Último ano (inclusive)
+
+        Returns:
+            Tupla (temporadas gravadas, temporadas com falha)
+        """
+        jobs = []
+        for name in tournaments:
+            resolved = resolve_tournament(name)
+            if resolved is None:
+                raise ValueError(f"Torneio desconhecido: {name}")
+            tournament_id, title = resolved
+            for season_id, year, _ in self.fetch_seasons(tournament_id, year_from, year_to):
+                jobs.append((tournament_id, title, season_id, year))
+
+        stored, failed = 0, 0
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="backfill") as executor:
+            futures = {executor.submit(self.fetch_standings, *job): job for job in jobs}
+            for future in as_completed(futures):
+                tournament_id, title, season_id, year = futures[future]
+                if future.result():
+                    stored += 1
+                    logger.info("%s %s gravado", title, year)
+                else:
+                    failed += 1
+
+        return stored, failed
+
+
+def main():
+    """Ponto de entrada de linha de comando do backfill"""
+    parser = argparse.ArgumentParser(description="Backfill da classificação de várias temporadas")
+    parser.add_argument(
+        "--tournament",
+        action="append",
+        help=f"Torneio a importar ({', '.join(TOURNAMENTS)}); pode ser repetido",
+    )
+    parser.add_argument("--from", dest="year_from", type=int, help="Primeiro ano (inclusive)")
+    parser.add_argument("--to", dest="year_to", type=int, help="Último ano (inclusive)")
+    parser.add_argument("--db", default=settings.STANDINGS_SNAPSHOT_PATH, help="Arquivo SQLite do snapshot")
+    parser.add_argument("--workers", type=int, default=8, help="Requisições simultâneas")
+    parser.add_argument("--rate", type=float, default=5.0, help="Máximo de requisições por segundo")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    backfill = Backfill(SnapshotStore(args.db), workers=args.workers, rate=args.rate)
+    stored, failed = backfill.run(args.tournament or list(TOURNAMENTS), args.year_from, args.year_to)
+    print(f"Backfill concluído: {stored} temporadas gravadas, {failed} com falha")
+
+
+if __name__ == "__main__":
+    main()
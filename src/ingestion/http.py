@@ -0,0 +1,62 @@
+"""
+Utilitários HTTP compartilhados pela ingestão: sessão com pool de conexões
+e limitador de taxa
+"""
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .sofascore import SOFASCORE_HEADERS
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """
+    Cria uma sessão HTTP com pool de conexões keep-alive
+
+    Args:
+        pool_size: Conexões mantidas por host (use o número de workers)
+
+    Returns:
+        Sessão configurada com os cabeçalhos do SofaScore
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(SOFASCORE_HEADERS)
+    return session
+
+
+class RateLimiter:
+    """Token bucket thread-safe: no máximo `rate` requisições por segundo"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Inicializa o limitador
+
+        Args:
+            rate: Requisições por segundo permitidas em regime
+            burst: Requisições que podem sair de uma vez (padrão: 1)
+        """
+        self.rate = rate
+        self.capacity = burst or 1
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Bloqueia até que uma requisição possa ser feita"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,86 @@
+"""
+Ingestão das partidas da temporada (rodadas, jogos e resultados)
+
+Uma temporada tem centenas de partidas, espalhadas em páginas de eventos do
+SofaScore com dezenas de campos cada. As páginas são lidas em blocos
+(`stream=True`) e cada evento é decodificado e reduzido a um `MatchRecord`
+assim que chega, sem montar o dicionário da resposta inteira.
+"""
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from ..config import settings
+from .http import RateLimiter
+from .providers import UpstreamError
+from .sofascore import MatchRecord, events_url, parse_event
+from .stream_json import JsonArrayStream
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def fetch_events_page(session: requests.Session, url: str) -> Optional[Tuple[List[MatchRecord], bool]]:
+    """
+    Lê uma página de eventos de forma incremental
+
+    Args:
+        session: Sessão HTTP com os cabeçalhos do SofaScore
+        url: URL da página (ver `events_url`)
+
+    Returns:
+        Tupla (partidas da página, há próxima página) ou None se a página não existe
+    """
+    with session.get(url, timeout=settings.SOFASCORE_TIMEOUT, stream=True) as response:
+        # O SofaScore responde 404 quando não há (mais) partidas na direção pedida
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            raise UpstreamError(f"SofaScore respondeu com status {response.status_code}")
+
+        events = JsonArrayStream(response.iter_content(CHUNK_SIZE), "events")
+        records = [record for record in map(parse_event, events) if record is not None]
+        return records, bool(events.fields.get("hasNextPage"))
+
+
+def fetch_season_matches(
+    session: requests.Session,
+    tournament_id: Optional[int] = None,
+    season_id: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> List[MatchRecord]:
+    """
+    Busca todas as partidas de uma temporada (disputadas e próximas)
+
+    Args:
+        session: Sessão HTTP com os cabeçalhos do SofaScore
+        tournament_id: ID do torneio no SofaScore (padrão: configurado)
+        season_id: ID da temporada no SofaScore (padrão: configurada)
+        max_pages: Limite de páginas por direção (padrão: MATCHES_MAX_PAGES)
+        limiter: Limitador de taxa aplicado a cada página
+
+    Returns:
+        Partidas sem repetição, em ordem de início
+    """
+    max_pages = max_pages or settings.MATCHES_MAX_PAGES
+    matches: Dict[int, MatchRecord] = {}
+
+    for direction in ("last", "next"):
+        for page in range(max_pages):
+            if limiter is not None:
+                limiter.acquire()
+            result = fetch_events_page(session, events_url(direction, page, tournament_id, season_id))
+            if result is None:
+                break
+            records, has_next = result
+            for record in records:
+                matches[record.id] = record
+            if not has_next:
+                break
+        else:
+            logger.warning("Limite de %s páginas de partidas atingido (%s)", max_pages, direction)
+
+    return sorted(matches.values(), key=lambda record: (record.inicio, record.id))
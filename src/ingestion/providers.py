@@ -0,0 +1,302 @@
+"""
+Camada de fontes externas da classificação
+
+Cada fonte (SofaScore, API-Football, snapshot local) tem seu próprio circuit
+breaker: depois de algumas falhas seguidas ela deixa de ser consultada por um
+tempo e, passado esse tempo, recebe uma única requisição de teste
+(half-open). A cadeia de fontes dispara a próxima fonte em paralelo quando a
+atual demora mais que o limiar de hedge, limitando a latência de cauda mesmo
+com uma fonte degradada. Uma chamada abandonada no prazo da cadeia continua
+ocupando sua thread até o timeout HTTP; enquanto isso a fonte não recebe nova
+chamada, então uma fonte travada nunca ocupa mais de uma thread.
+"""
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import requests
+
+from ..config import settings
+from .http import create_session
+from .snapshot import SnapshotStore
+from .sofascore import parse_standings, standings_url
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamError(Exception):
+    """Falha de uma fonte externa (status inesperado ou resposta vazia)"""
+
+
+class CircuitBreaker:
+    """Circuit breaker com estados closed, open e half-open"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa o circuit breaker
+
+        Args:
+            failure_threshold: Falhas consecutivas que abrem o circuito
+            reset_timeout: Segundos com o circuito aberto antes da requisição de teste
+            clock: Relógio monotônico (injetável para testes)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Indica se uma requisição pode ser feita agora"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            # Half-open: apenas uma requisição de teste por vez
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        """Registra sucesso e fecha o circuito"""
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Registra falha e abre o circuito se necessário"""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+
+class StandingsProvider(ABC):
+    """Fonte da classificação; `fetch` levanta exceção em caso de falha"""
+
+    name = "provider"
+
+    def __init__(self):
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.BREAKER_RESET_TIMEOUT,
+        )
+
+    @abstractmethod
+    def fetch(self) -> Dict[str, Any]:
+        """Busca a classificação no formato usado pelas ferramentas"""
+
+
+class SofaScoreProvider(StandingsProvider):
+    """Classificação da API do SofaScore"""
+
+    name = "sofascore"
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        super().__init__()
+        self.session = session or create_session(pool_size=2)
+
+    def fetch(self) -> Dict[str, Any]:
+        response = self.session.get(standings_url(), timeout=settings.SOFASCORE_TIMEOUT)
+        if response.status_code != 200:
+            raise UpstreamError(f"SofaScore respondeu com status {response.status_code}")
+
+        data = parse_standings(response.json())
+        if data is None:
+            raise UpstreamError("Resposta do SofaScore sem classificação")
+        return data
+
+
+class ApiFootballProvider(StandingsProvider):
+    """Classificação da API-Football (requer API_FOOTBALL_KEY)"""
+
+    name = "api-football"
+    url = "https://v3.football.api-sports.io/standings"
+
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
+        super().__init__()
+        self.api_key = api_key
+        self.session = session or requests.Session()
+
+    def fetch(self) -> Dict[str, Any]:
+        response = self.session.get(
+            self.url,
+            params={"league": settings.API_FOOTBALL_LEAGUE, "season": settings.SOFASCORE_SEASON_YEAR},
+            headers={"x-apisports-key": self.api_key},
+            timeout=settings.SOFASCORE_TIMEOUT,
+        )
+        if response.status_code != 200:
+            raise UpstreamError(f"API-Football respondeu com status {response.status_code}")
+
+        leagues = response.json().get("response", [])
+        if not leagues:
+            raise UpstreamError("Resposta da API-Football sem classificação")
+
+        teams_data = []
+        for row in leagues[0]["league"]["standings"][0]:
+            stats = row.get("all", {})
+            goals = stats.get("goals", {})
+            teams_data.append({
+                "posicao": row.get("rank", 0),
+                "time": row.get("team", {}).get("name", "Desconhecido"),
+                "sigla": "",
+                "pontos": row.get("points", 0),
+                "jogos": stats.get("played", 0),
+                "vitorias": stats.get("win", 0),
+                "empates": stats.get("draw", 0),
+                "derrotas": stats.get("lose", 0),
+                "gols_pro": goals.get("for", 0),
+                "gols_contra": goals.get("against", 0),
+                "saldo_gols": row.get("goalsDiff", 0),
+            })
+
+        return {
+            "success": True,
+            "campeonato": "Brasileirão Série A",
+            "temporada": settings.SOFASCORE_SEASON_YEAR,
+            "total_times": len(teams_data),
+            "fonte": "API-Football (dados reais)",
+            "classificacao": teams_data,
+        }
+
+
+class SnapshotProvider(StandingsProvider):
+    """Último snapshot local, independentemente da idade"""
+
+    name = "snapshot"
+
+    def __init__(self, store: SnapshotStore):
+        super().__init__()
+        self.store = store
+
+    def fetch(self) -> Dict[str, Any]:
+        snapshot = self.store.read(settings.SOFASCORE_TOURNAMENT_ID, settings.SOFASCORE_SEASON_ID)
+        if snapshot is None:
+            raise UpstreamError("Snapshot local ainda não gravado")
+        return snapshot.data
+
+
+class ProviderChain:
+    """Consulta as fontes em ordem, com circuit breaker e requisições hedged"""
+
+    def __init__(
+        self,
+        providers: List[StandingsProvider],
+        hedge_delay: float = 1.5,
+        timeout: float = 10.0,
+    ):
+        """
+        Inicializa a cadeia
+
+        Args:
+            providers: Fontes em ordem de preferência
+            hedge_delay: Segundos de espera antes de disparar a próxima fonte em paralelo
+            timeout: Tempo máximo total da consulta
+        """
+        self.providers = providers
+        self.hedge_delay = hedge_delay
+        self.timeout = timeout
+        # Uma thread por fonte basta: cada fonte tem no máximo uma chamada em andamento
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(providers)),
+            thread_name_prefix="standings-provider",
+        )
+        self._running: Set[StandingsProvider] = set()
+        self._running_lock = threading.Lock()
+
+    def _start(self, provider: StandingsProvider) -> Optional[Future]:
+        """
+        Dispara a fonte em segundo plano
+
+        Returns:
+            Future da chamada ou None se o circuito estiver aberto ou se uma
+            chamada anterior (ex.: abandonada no prazo) ainda estiver em andamento
+        """
+        with self._running_lock:
+            if provider in self._running or not provider.breaker.allow():
+                return None
+            self._running.add(provider)
+        return self._executor.submit(self._call, provider)
+
+    def _call(self, provider: StandingsProvider) -> Dict[str, Any]:
+        """Executa a fonte registrando o resultado no circuit breaker"""
+        try:
+            data = provider.fetch()
+        except Exception as e:
+            provider.breaker.record_failure()
+            logger.warning("Fonte %s falhou: %s", provider.name, e)
+            raise
+        finally:
+            with self._running_lock:
+                self._running.discard(provider)
+        provider.breaker.record_success()
+        return data
+
+    def fetch(self) -> Optional[Dict[str, Any]]:
+        """
+        Retorna a classificação da primeira fonte que responder com sucesso
+
+        Returns:
+            Dicionário com os dados da classificação ou None se todas falharem
+        """
+        candidates = iter(self.providers)
+        pending: Dict[Future, StandingsProvider] = {}
+        deadline = time.monotonic() + self.timeout
+
+        def launch_next() -> bool:
+            for provider in candidates:
+                future = self._start(provider)
+                if future is not None:
+                    pending[future] = provider
+                    return True
+            return False
+
+        has_more = launch_next()
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            wait_for = min(self.hedge_delay, remaining) if has_more else remaining
+            done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # Fonte lenta: dispara a próxima em paralelo (hedge)
+                has_more = has_more and launch_next()
+                continue
+
+            for future in done:
+                pending.pop(future)
+                if future.exception() is None:
+                    return future.result()
+
+            # Falha explícita: a próxima fonte entra imediatamente
+            has_more = has_more and launch_next()
+
+        return None
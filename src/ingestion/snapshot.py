@@ -0,0 +1,276 @@
+"""
+Snapshot local da classificação em SQLite
+
+O worker de ingestão grava aqui a última versão da tabela de cada
+torneio/temporada; o caminho das requisições do chat apenas lê. Cada escrita
+é uma única transação, então leitores nunca veem um snapshot pela metade, e o
+modo WAL permite leituras concorrentes com a escrita.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS standings_snapshots (
+    tournament_id INTEGER NOT NULL,
+    season_id INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (tournament_id, season_id)
+);
+CREATE TABLE IF NOT EXISTS seasons (
+    tournament_id INTEGER NOT NULL,
+    season_id INTEGER NOT NULL,
+    year TEXT NOT NULL,
+    name TEXT,
+    PRIMARY KEY (tournament_id, season_id)
+);
+CREATE INDEX IF NOT EXISTS idx_seasons_year ON seasons (tournament_id, year);
+CREATE TABLE IF NOT EXISTS match_snapshots (
+    tournament_id INTEGER NOT NULL,
+    season_id INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (tournament_id, season_id)
+);
+"""
+
+
+class Snapshot:
+    """Snapshot da classificação de um torneio/temporada"""
+
+    __slots__ = ("tournament_id", "season_id", "data", "etag", "last_modified", "fetched_at", "checked_at")
+
+    def __init__(
+        self,
+        tournament_id: int,
+        season_id: int,
+        data: Dict[str, Any],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        fetched_at: float,
+        checked_at: float,
+    ):
+        self.tournament_id = tournament_id
+        self.season_id = season_id
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.checked_at = checked_at
+
+    @property
+    def age(self) -> float:
+        """Segundos desde a última confirmação de que o dado está atual"""
+        return time.time() - self.checked_at
+
+
+class SnapshotStore:
+    """Armazenamento dos snapshots em um arquivo SQLite local"""
+
+    def __init__(self, path: str):
+        """
+        Inicializa o armazenamento
+
+        Args:
+            path: Caminho do arquivo SQLite (criado se não existir)
+        """
+        self.path = Path(path)
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexão da thread atual (sqlite3 não compartilha conexões entre threads)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    with conn:
+                        conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def exists(self) -> bool:
+        """Indica se o arquivo de snapshot já foi criado"""
+        return self.path.exists()
+
+    def read(self, tournament_id: int, season_id: int) -> Optional[Snapshot]:
+        """
+        Lê o snapshot de um torneio/temporada
+
+        Args:
+            tournament_id: ID do torneio no SofaScore
+            season_id: ID da temporada no SofaScore
+
+        Returns:
+            Snapshot ou None se ainda não houver dados
+        """
+        if not self.exists():
+            return None
+
+        row = self._connect().execute(
+            "SELECT payload, etag, last_modified, fetched_at, checked_at "
+            "FROM standings_snapshots WHERE tournament_id = ? AND season_id = ?",
+            (tournament_id, season_id),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        payload, etag, last_modified, fetched_at, checked_at = row
+        return Snapshot(
+            tournament_id, season_id, json.loads(payload), etag, last_modified, fetched_at, checked_at
+        )
+
+    def write(
+        self,
+        tournament_id: int,
+        season_id: int,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """
+        Grava atomicamente um novo snapshot
+
+        Args:
+            tournament_id: ID do torneio no SofaScore
+            season_id: ID da temporada no SofaScore
+            data: Tabela no formato usado pelas ferramentas
+            etag: Cabeçalho ETag da resposta
+            last_modified: Cabeçalho Last-Modified da resposta
+        """
+        now = time.time()
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO standings_snapshots "
+                "(tournament_id, season_id, payload, etag, last_modified, fetched_at, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (tournament_id, season_id, payload, etag, last_modified, now, now),
+            )
+
+    def touch(self, tournament_id: int, season_id: int):
+        """Registra que a fonte confirmou o snapshot atual (resposta 304)"""
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "UPDATE standings_snapshots SET checked_at = ? "
+                "WHERE tournament_id = ? AND season_id = ?",
+                (time.time(), tournament_id, season_id),
+            )
+
+    def read_matches(self, tournament_id: int, season_id: int) -> Optional[Snapshot]:
+        """
+        Lê as partidas gravadas de um torneio/temporada
+
+        Args:
+            tournament_id: ID do torneio no SofaScore
+            season_id: ID da temporada no SofaScore
+
+        Returns:
+            Snapshot cujo `data` é a lista de partidas (listas na ordem de MatchRecord) ou None
+        """
+        if not self.exists():
+            return None
+
+        row = self._connect().execute(
+            "SELECT payload, fetched_at FROM match_snapshots WHERE tournament_id = ? AND season_id = ?",
+            (tournament_id, season_id),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        payload, fetched_at = row
+        return Snapshot(tournament_id, season_id, json.loads(payload), None, None, fetched_at, fetched_at)
+
+    def write_matches(self, tournament_id: int, season_id: int, matches: Iterable[Tuple]):
+        """
+        Grava atomicamente as partidas de um torneio/temporada
+
+        Args:
+            tournament_id: ID do torneio no SofaScore
+            season_id: ID da temporada no SofaScore
+            matches: Partidas (MatchRecord ou tuplas na mesma ordem)
+        """
+        payload = json.dumps([list(match) for match in matches], ensure_ascii=False, separators=(",", ":"))
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO match_snapshots (tournament_id, season_id, payload, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (tournament_id, season_id, payload, time.time()),
+            )
+
+    def write_seasons(self, tournament_id: int, seasons: Iterable[Tuple[int, str, str]]):
+        """
+        Registra as temporadas conhecidas de um torneio
+
+        Args:
+            tournament_id: ID do torneio no SofaScore
+            seasons: Tuplas (ID da temporada, ano, nome)
+        """
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO seasons (tournament_id, season_id, year, name) "
+                "VALUES (?, ?, ?, ?)",
+                [(tournament_id, season_id, year, name) for season_id, year, name in seasons],
+            )
+
+    def find_season(self, tournament_id: int, year: str) -> Optional[int]:
+        """
+        Localiza o ID da temporada de um torneio pelo ano
+
+        Args:
+            tournament_id: ID do torneio no SofaScore
+            year: Ano da temporada (ex.: "2023")
+
+        Returns:
+            ID da temporada ou None se não registrada
+        """
+        if not self.exists():
+            return None
+
+        row = self._connect().execute(
+            "SELECT season_id FROM seasons WHERE tournament_id = ? AND year = ?",
+            (tournament_id, str(year)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def list_seasons(self, tournament_id: int) -> List[Tuple[int, str]]:
+        """
+        Lista as temporadas de um torneio que possuem classificação armazenada
+
+        Args:
+            tournament_id: ID do torneio no SofaScore
+
+        Returns:
+            Tuplas (ID da temporada, ano), da mais recente para a mais antiga
+        """
+        if not self.exists():
+            return []
+
+        return self._connect().execute(
+            "SELECT s.season_id, s.year FROM seasons s "
+            "JOIN standings_snapshots t "
+            "ON t.tournament_id = s.tournament_id AND t.season_id = s.season_id "
+            "WHERE s.tournament_id = ? ORDER BY s.year DESC",
+            (tournament_id,),
+        ).fetchall()
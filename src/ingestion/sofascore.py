@@ -0,0 +1,199 @@
+"""
+Cliente da API do SofaScore: URLs, cabeçalhos e conversão da classificação
+e das partidas
+"""
+import unicodedata
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from ..config import settings
+
+SOFASCORE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'pt-BR,pt;q=0.9',
+    'Referer': 'https://www.sofascore.com/',
+}
+
+# Torneios suportados: apelido -> (ID no SofaScore, nome do campeonato)
+TOURNAMENTS = {
+    "serie-a": (325, "Brasileirão Série A"),
+    "serie-b": (390, "Brasileirão Série B"),
+}
+
+
+def resolve_tournament(name: str) -> Optional[Tuple[int, str]]:
+    """
+    Resolve o apelido de um torneio ("serie-a", "Série B", "b", "325")
+
+    Args:
+        name: Apelido, nome ou ID do torneio
+
+    Returns:
+        Tupla (ID no SofaScore, nome do campeonato) ou None se desconhecido
+    """
+    key = unicodedata.normalize("NFKD", str(name).lower())
+    key = "".join(char for char in key if not unicodedata.combining(char))
+    key = key.replace("brasileirao", "").replace("serie", "").strip(" -_")
+
+    for alias, (tournament_id, title) in TOURNAMENTS.items():
+        if key in (alias, alias.split("-")[-1], str(tournament_id)):
+            return tournament_id, title
+    return None
+
+
+def seasons_url(tournament_id: int) -> str:
+    """URL da lista de temporadas de um torneio"""
+    return f"{settings.SOFASCORE_BASE_URL}/unique-tournament/{tournament_id}/seasons"
+
+
+def standings_url(tournament_id: Optional[int] = None, season_id: Optional[int] = None) -> str:
+    """
+    Monta a URL da classificação de um torneio/temporada
+
+    Args:
+        tournament_id: ID do torneio no SofaScore (padrão: Série A)
+        season_id: ID da temporada no SofaScore (padrão: temporada configurada)
+
+    Returns:
+        URL do endpoint de classificação
+    """
+    tournament_id = tournament_id or settings.SOFASCORE_TOURNAMENT_ID
+    season_id = season_id or settings.SOFASCORE_SEASON_ID
+    return (
+        f"{settings.SOFASCORE_BASE_URL}/unique-tournament/{tournament_id}"
+        f"/season/{season_id}/standings/total"
+    )
+
+
+def events_url(
+    direction: str,
+    page: int = 0,
+    tournament_id: Optional[int] = None,
+    season_id: Optional[int] = None,
+) -> str:
+    """
+    Monta a URL de uma página de partidas de um torneio/temporada
+
+    Args:
+        direction: "last" (já disputadas, da mais recente) ou "next" (próximas)
+        page: Página (0 = primeira)
+        tournament_id: ID do torneio no SofaScore (padrão: Série A)
+        season_id: ID da temporada no SofaScore (padrão: temporada configurada)
+
+    Returns:
+        URL do endpoint de eventos
+    """
+    tournament_id = tournament_id or settings.SOFASCORE_TOURNAMENT_ID
+    season_id = season_id or settings.SOFASCORE_SEASON_ID
+    return (
+        f"{settings.SOFASCORE_BASE_URL}/unique-tournament/{tournament_id}"
+        f"/season/{season_id}/events/{direction}/{page}"
+    )
+
+
+# Situação da partida: tipo do SofaScore -> rótulo usado pelas ferramentas
+MATCH_STATUS = {
+    "notstarted": "agendada",
+    "inprogress": "em andamento",
+    "finished": "encerrada",
+    "postponed": "adiada",
+    "canceled": "cancelada",
+}
+
+
+class MatchRecord(NamedTuple):
+    """Partida em formato compacto (uma tupla, sem o restante do evento)"""
+
+    id: int
+    rodada: int
+    inicio: int
+    mandante: str
+    sigla_mandante: str
+    visitante: str
+    sigla_visitante: str
+    gols_mandante: int
+    gols_visitante: int
+    status: str
+
+
+def parse_event(event: Dict[str, Any]) -> Optional[MatchRecord]:
+    """
+    Converte um evento do SofaScore em registro compacto
+
+    Args:
+        event: Um elemento de "events" da resposta do SofaScore
+
+    Returns:
+        MatchRecord (gols = -1 enquanto a partida não tem placar) ou None se incompleto
+    """
+    home, away = event.get("homeTeam"), event.get("awayTeam")
+    if not home or not away or "id" not in event:
+        return None
+
+    status = MATCH_STATUS.get(event.get("status", {}).get("type"), "agendada")
+    home_score = event.get("homeScore", {}).get("current")
+    away_score = event.get("awayScore", {}).get("current")
+    if status == "agendada" or home_score is None or away_score is None:
+        home_score = away_score = -1
+
+    return MatchRecord(
+        id=event["id"],
+        rodada=event.get("roundInfo", {}).get("round", 0),
+        inicio=event.get("startTimestamp", 0),
+        mandante=home.get("name", "Desconhecido"),
+        sigla_mandante=home.get("nameCode") or home.get("shortName", ""),
+        visitante=away.get("name", "Desconhecido"),
+        sigla_visitante=away.get("nameCode") or away.get("shortName", ""),
+        gols_mandante=home_score,
+        gols_visitante=away_score,
+        status=status,
+    )
+
+
+def parse_standings(
+    payload: Dict[str, Any],
+    campeonato: str = "Brasileirão Série A",
+    temporada: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Converte a resposta do SofaScore no formato de tabela usado pelas ferramentas
+
+    Args:
+        payload: JSON retornado pelo endpoint de classificação
+        campeonato: Nome do campeonato
+        temporada: Rótulo da temporada (padrão: temporada configurada)
+
+    Returns:
+        Dicionário com os dados da classificação ou None se a resposta estiver vazia
+    """
+    if 'standings' not in payload or not payload['standings']:
+        return None
+
+    standings = payload['standings'][0]['rows']
+
+    teams_data: List[Dict[str, Any]] = []
+    for row in standings:
+        team = row.get('team', {})
+        team_info = {
+            "posicao": row.get('position', 0),
+            "time": team.get('name', 'Desconhecido'),
+            "sigla": team.get('shortName', ''),
+            "pontos": row.get('points', 0),
+            "jogos": row.get('matches', 0),
+            "vitorias": row.get('wins', 0),
+            "empates": row.get('draws', 0),
+            "derrotas": row.get('losses', 0),
+            "gols_pro": row.get('scoresFor', 0),
+            "gols_contra": row.get('scoresAgainst', 0),
+            "saldo_gols": row.get('scoresFor', 0) - row.get('scoresAgainst', 0),
+        }
+        teams_data.append(team_info)
+
+    return {
+        "success": True,
+        "campeonato": campeonato,
+        "temporada": temporada or settings.SOFASCORE_SEASON_YEAR,
+        "total_times": len(teams_data),
+        "fonte": "API SofaScore (dados reais)",
+        "classificacao": teams_data
+    }
@@ -0,0 +1,118 @@
+"""
+Leitura incremental de documentos JSON grandes
+
+As páginas de eventos do SofaScore trazem dezenas de campos por partida, dos
+quais usamos poucos. Em vez de `response.json()`, que monta o documento
+inteiro em memória, `JsonArrayStream` lê a resposta em blocos e decodifica um
+elemento do array por vez com `JSONDecoder.raw_decode`; cada elemento pode
+ser convertido e descartado antes do próximo ser lido.
+"""
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator
+
+_WHITESPACE = " \t\r\n"
+
+
+class JsonArrayStream:
+    """Itera os elementos de um array do objeto raiz sem carregar o documento inteiro"""
+
+    def __init__(self, chunks: Iterable[bytes], key: str):
+        """
+        Inicializa a leitura
+
+        Args:
+            chunks: Blocos de bytes do documento (ex.: `response.iter_content()`)
+            key: Campo do objeto raiz que contém o array (ex.: "events")
+        """
+        self.key = key
+        # Demais campos do objeto raiz (ex.: hasNextPage), preenchidos durante a leitura
+        self.fields: Dict[str, Any] = {}
+
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        """
+        Acrescenta o próximo bloco ao buffer, descartando o que já foi lido
+
+        Returns:
+            False no fim do documento
+        """
+        for chunk in self._chunks:
+            text = self._text.decode(chunk)
+            if text:
+                self._buffer = self._buffer[self._pos:] + text
+                self._pos = 0
+                return True
+
+        text = self._text.decode(b"", final=True)
+        if text:
+            self._buffer = self._buffer[self._pos:] + text
+            self._pos = 0
+            return True
+        return False
+
+    def _peek(self) -> str:
+        """Próximo caractere que não é espaço ("" no fim do documento)"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, *chars: str) -> str:
+        """Consome um dos caracteres de estrutura esperados"""
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"JSON inválido na posição {self._pos}: esperado {' ou '.join(chars)}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decodifica o próximo valor completo, lendo mais blocos se necessário"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+
+            # Um número no fim do buffer pode continuar no próximo bloco
+            if end == len(self._buffer) and isinstance(value, (int, float)) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _array(self) -> Iterator[Any]:
+        """Elementos do array na posição atual"""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",", "]") == "]":
+                return
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            name = self._value()
+            self._expect(":")
+            if name == self.key:
+                yield from self._array()
+            else:
+                self.fields[name] = self._value()
+            if self._expect(",", "}") == "}":
+                return
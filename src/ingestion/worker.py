@@ -0,0 +1,191 @@
+"""
+Worker de ingestão da classificação
+
+Consulta periodicamente o endpoint de classificação do SofaScore usando
+requisições condicionais (ETag / If-Modified-Since) e grava o resultado no
+snapshot local. O chat lê apenas esse snapshot, sem I/O de rede.
+
+As partidas da temporada (opção --matches) são sincronizadas no mesmo ciclo,
+lidas página a página pelo parser incremental de `matches`.
+
+Execute: python -m src.ingestion.worker [--interval 300] [--once] [--matches]
+"""
+import argparse
+import logging
+import random
+import sqlite3
+import time
+from typing import Optional
+
+import requests
+
+from ..config import settings
+from .matches import fetch_season_matches
+from .snapshot import SnapshotStore
+from .sofascore import SOFASCORE_HEADERS, parse_standings, standings_url
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionWorker:
+    """Sincroniza o snapshot local com a classificação do SofaScore"""
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        tournament_id: Optional[int] = None,
+        season_id: Optional[int] = None,
+        session: Optional[requests.Session] = None,
+        matches: bool = False,
+    ):
+        """
+        Inicializa o worker
+
+        Args:
+            store: Snapshot local onde os dados são gravados
+            tournament_id: ID do torneio no SofaScore (padrão: configurado)
+            season_id: ID da temporada no SofaScore (padrão: configurado)
+            session: Sessão HTTP reutilizada entre as consultas
+            matches: Sincroniza também as partidas da temporada a cada ciclo
+        """
+        self.store = store
+        self.tournament_id = tournament_id or settings.SOFASCORE_TOURNAMENT_ID
+        self.season_id = season_id or settings.SOFASCORE_SEASON_ID
+        self.session = session or requests.Session()
+        self.session.headers.update(SOFASCORE_HEADERS)
+        self.matches = matches
+
+    def poll_once(self) -> str:
+        """
+        Executa uma consulta condicional e atualiza o snapshot
+
+        Resposta malformada ou falha do SQLite (ex.: banco bloqueado) contam
+        como falha da consulta, sem interromper o worker.
+
+        Returns:
+            "updated", "not_modified" ou "failed"
+        """
+        try:
+            return self._poll_standings()
+        except ValueError as e:
+            logger.warning("Resposta inválida do SofaScore: %s", e)
+        except sqlite3.Error as e:
+            logger.warning("Falha ao acessar o snapshot local: %s", e)
+        return "failed"
+
+    def _poll_standings(self) -> str:
+        current = self.store.read(self.tournament_id, self.season_id)
+
+        headers = {}
+        if current is not None:
+            if current.etag:
+                headers["If-None-Match"] = current.etag
+            if current.last_modified:
+                headers["If-Modified-Since"] = current.last_modified
+
+        try:
+            response = self.session.get(
+                standings_url(self.tournament_id, self.season_id),
+                headers=headers,
+                timeout=settings.SOFASCORE_TIMEOUT,
+            )
+        except requests.RequestException as e:
+            logger.warning("Falha ao consultar o SofaScore: %s", e)
+            return "failed"
+
+        if response.status_code == 304 and current is not None:
+            self.store.touch(self.tournament_id, self.season_id)
+            return "not_modified"
+
+        if response.status_code != 200:
+            logger.warning("SofaScore respondeu com status %s", response.status_code)
+            return "failed"
+
+        data = parse_standings(response.json())
+        if data is None:
+            logger.warning("Resposta do SofaScore sem classificação")
+            return "failed"
+
+        self.store.write(
+            self.tournament_id,
+            self.season_id,
+            data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return "updated"
+
+    def poll_matches(self) -> str:
+        """
+        Busca as partidas da temporada e atualiza o snapshot
+
+        Returns:
+            "updated" ou "failed"
+        """
+        try:
+            matches = fetch_season_matches(self.session, self.tournament_id, self.season_id)
+        except Exception as e:
+            logger.warning("Falha ao buscar partidas no SofaScore: %s", e)
+            return "failed"
+
+        if not matches:
+            logger.warning("SofaScore não retornou partidas")
+            return "failed"
+
+        try:
+            self.store.write_matches(self.tournament_id, self.season_id, matches)
+        except sqlite3.Error as e:
+            logger.warning("Falha ao gravar as partidas no snapshot local: %s", e)
+            return "failed"
+        return "updated"
+
+    def run(self, interval: float, jitter: float = 0.1):
+        """
+        Executa consultas em loop até ser interrompido
+
+        Args:
+            interval: Segundos entre consultas
+            jitter: Fração aleatória aplicada ao intervalo, para espalhar réplicas
+        """
+        while True:
+            try:
+                logger.info("Ingestão da classificação: %s", self.poll_once())
+                if self.matches:
+                    logger.info("Ingestão das partidas: %s", self.poll_matches())
+            except Exception:
+                # Um ciclo com erro inesperado não derruba o agendamento
+                logger.exception("Falha inesperada no ciclo de ingestão")
+            time.sleep(interval * (1 + random.uniform(-jitter, jitter)))
+
+
+def main():
+    """Ponto de entrada de linha de comando do worker"""
+    parser = argparse.ArgumentParser(description="Worker de ingestão da classificação do Brasileirão")
+    parser.add_argument("--db", default=settings.STANDINGS_SNAPSHOT_PATH, help="Arquivo SQLite do snapshot")
+    parser.add_argument("--interval", type=float, default=settings.INGESTION_INTERVAL, help="Segundos entre consultas")
+    parser.add_argument("--tournament", type=int, default=settings.SOFASCORE_TOURNAMENT_ID, help="ID do torneio no SofaScore")
+    parser.add_argument("--season", type=int, default=settings.SOFASCORE_SEASON_ID, help="ID da temporada no SofaScore")
+    parser.add_argument("--once", action="store_true", help="Executa uma única consulta e sai")
+    parser.add_argument("--matches", action="store_true", help="Sincroniza também as partidas da temporada")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    worker = IngestionWorker(SnapshotStore(args.db), args.tournament, args.season, matches=args.matches)
+
+    if args.once:
+        statuses = [worker.poll_once()]
+        print(f"Ingestão da classificação: {statuses[0]}")
+        if args.matches:
+            statuses.append(worker.poll_matches())
+            print(f"Ingestão das partidas: {statuses[1]}")
+        raise SystemExit(0 if "failed" not in statuses else 1)
+
+    try:
+        worker.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
 """Módulo de prompts"""
-from .loader import prompt_loader, PromptLoader
+from .loader import prompt_loader, PromptLoader, PromptFile
 
-__all__ = ["prompt_loader", "PromptLoader"]
+__all__ = ["prompt_loader", "PromptLoader", "PromptFile"]
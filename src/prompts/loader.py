@@ -1,19 +1,39 @@
 """
 Módulo para carregar prompts de arquivos JSON
+
+Cada arquivo é lido e decodificado uma única vez; as chamadas seguintes
+devolvem a versão em cache, que só é recarregada quando o mtime do arquivo
+muda (edição em disco) ou quando o cache é invalidado explicitamente.
 """
+import hashlib
 import json
 import os
-from typing import Dict, Any
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional
 from pathlib import Path
 
 
+class PromptFile(NamedTuple):
+    """Conteúdo imutável de um arquivo de prompt"""
+
+    name: str
+    version: str
+    mtime_ns: int
+    data: Mapping[str, Any]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Atalho para `data.get`"""
+        return self.data.get(key, default)
+
+
 class PromptLoader:
     """Classe para carregar e gerenciar prompts de arquivos JSON"""
-    
+
     def __init__(self, prompts_dir: str = None):
         """
         Inicializa o carregador de prompts
-        
+
         Args:
             prompts_dir: Diretório onde os prompts estão armazenados
         """
@@ -23,47 +43,106 @@ class PromptLoader:
             self.prompts_dir = current_dir
         else:
             self.prompts_dir = Path(prompts_dir)
-    
-    def load_prompt_file(self, filename: str) -> Dict[str, Any]:
+
+        self._cache: Dict[str, PromptFile] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(filename: str) -> str:
+        return filename if filename.endswith('.json') else filename + '.json'
+
+    def load(self, filename: str) -> PromptFile:
         """
-        Carrega um arquivo JSON de prompt
-        
+        Retorna o arquivo de prompt, recarregando-o apenas se mudou em disco
+
         Args:
             filename: Nome do arquivo JSON (com ou sem extensão)
-        
+
         Returns:
-            Dicionário com os prompts carregados
+            PromptFile com o conteúdo e a versão (hash do arquivo)
         """
-        if not filename.endswith('.json'):
-            filename += '.json'
-        
+        filename = self._normalize(filename)
         filepath = self.prompts_dir / filename
-        
+
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            mtime_ns = os.stat(filepath).st_mtime_ns
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Arquivo de prompt não encontrado: {filepath}"
             )
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"Erro ao decodificar JSON do arquivo {filepath}: {e}"
+
+        cached = self._cache.get(filename)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
+
+        with self._lock:
+            cached = self._cache.get(filename)
+            if cached is not None and cached.mtime_ns == mtime_ns:
+                return cached
+
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            try:
+                data = json.loads(raw.decode('utf-8'))
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"Erro ao decodificar JSON do arquivo {filepath}: {e}"
+                )
+
+            prompt_file = PromptFile(
+                name=filename,
+                version=hashlib.sha1(raw).hexdigest()[:12],
+                mtime_ns=mtime_ns,
+                data=MappingProxyType(data),
             )
-    
-    def get_agent_prompts(self) -> Dict[str, str]:
+            self._cache[filename] = prompt_file
+            return prompt_file
+
+    def invalidate(self, filename: Optional[str] = None):
+        """
+        Descarta o cache de um arquivo (ou de todos)
+
+        Args:
+            filename: Nome do arquivo; None descarta todos
+        """
+        with self._lock:
+            if filename is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(self._normalize(filename), None)
+
+    def load_prompt_file(self, filename: str) -> Mapping[str, Any]:
+        """
+        Carrega um arquivo JSON de prompt
+
+        Args:
+            filename: Nome do arquivo JSON (com ou sem extensão)
+
+        Returns:
+            Dicionário somente leitura com os prompts carregados
+        """
+        return self.load(filename).data
+
+    @property
+    def version(self) -> str:
+        """Versão combinada dos prompts do agente e das ferramentas"""
+        return "-".join(
+            self.load(name).version for name in ("agent_prompts.json", "tool_prompts.json")
+        )
+
+    def get_agent_prompts(self) -> Mapping[str, str]:
         """Carrega os prompts do agente"""
         return self.load_prompt_file("agent_prompts.json")
-    
-    def get_tool_prompts(self) -> Dict[str, str]:
+
+    def get_tool_prompts(self) -> Mapping[str, str]:
         """Carrega os prompts das ferramentas"""
         return self.load_prompt_file("tool_prompts.json")
-    
+
     def get_system_prompt(self) -> str:
         """Retorna o prompt do sistema para o agente"""
         agent_prompts = self.get_agent_prompts()
         return agent_prompts.get("system_prompt", "")
-    
+
     def get_welcome_message(self) -> str:
         """Retorna a mensagem de boas-vindas"""
         agent_prompts = self.get_agent_prompts()
@@ -0,0 +1,14 @@
+"""Módulo de instrumentação e métricas do agente"""
+from .recorder import Telemetry, telemetry
+from .sinks import Histogram, JsonlSink, MetricsSink, TraceSink
+from .trace import TurnTrace
+
+__all__ = [
+    "Telemetry",
+    "telemetry",
+    "TurnTrace",
+    "TraceSink",
+    "JsonlSink",
+    "MetricsSink",
+    "Histogram",
+]
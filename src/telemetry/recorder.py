@@ -0,0 +1,69 @@
+"""
+Instrumentação do agente: cria os registros de turno e os envia aos destinos
+"""
+import logging
+from typing import List, Optional
+
+from ..config import settings
+from .sinks import JsonlSink, MetricsSink, TraceSink
+from .trace import TurnTrace
+
+logger = logging.getLogger(__name__)
+
+
+class Telemetry:
+    """Ponto central da instrumentação, com destinos plugáveis"""
+
+    def __init__(self, sinks: Optional[List[TraceSink]] = None, enabled: bool = True):
+        """
+        Inicializa a instrumentação
+
+        Args:
+            sinks: Destinos que recebem cada turno concluído
+            enabled: Desativa a emissão sem alterar o código do agente
+        """
+        self.sinks = list(sinks or [])
+        self.enabled = enabled
+
+    def add_sink(self, sink: TraceSink):
+        """Registra um novo destino"""
+        self.sinks.append(sink)
+
+    @property
+    def metrics(self) -> Optional[MetricsSink]:
+        """Primeiro destino de métricas em memória, se houver"""
+        for sink in self.sinks:
+            if isinstance(sink, MetricsSink):
+                return sink
+        return None
+
+    def start_turn(self, session_id: Optional[str] = None, mode: str = "chat") -> TurnTrace:
+        """Inicia o registro de um turno"""
+        return TurnTrace(session_id=session_id, mode=mode)
+
+    def finish_turn(self, trace: TurnTrace, error: Optional[str] = None):
+        """
+        Encerra o turno e o envia aos destinos
+
+        Falhas de um destino não interrompem o atendimento.
+        """
+        trace.finish(error)
+        if not self.enabled:
+            return
+        for sink in self.sinks:
+            try:
+                sink.emit(trace)
+            except Exception as e:
+                logger.warning("Falha ao exportar registro de turno: %s", e)
+
+
+def _build_default_telemetry() -> Telemetry:
+    """Configura a instrumentação do processo a partir de `settings`"""
+    sinks: List[TraceSink] = [MetricsSink()]
+    if settings.TELEMETRY_JSONL_PATH:
+        sinks.append(JsonlSink(settings.TELEMETRY_JSONL_PATH))
+    return Telemetry(sinks, enabled=settings.TELEMETRY_ENABLED)
+
+
+# Instância global de instrumentação
+telemetry = _build_default_telemetry()
@@ -0,0 +1,160 @@
+"""
+Destinos dos registros de turno: arquivo JSONL e métricas em memória
+"""
+import bisect
+import json
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .trace import TurnTrace
+
+# Limites dos buckets de latência (segundos)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Limites dos buckets de tokens por turno
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+
+
+class TraceSink(ABC):
+    """Interface dos destinos de registros de turno"""
+
+    @abstractmethod
+    def emit(self, trace: TurnTrace):
+        """Recebe o registro de um turno encerrado"""
+
+
+class JsonlSink(TraceSink):
+    """Acrescenta cada turno como uma linha JSON em um arquivo"""
+
+    def __init__(self, path: str):
+        """
+        Inicializa o destino
+
+        Args:
+            path: Caminho do arquivo JSONL (criado se não existir)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def emit(self, trace: TurnTrace):
+        line = json.dumps(trace.to_dict(), ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class Histogram:
+    """Histograma com buckets fixos, no estilo Prometheus"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimativa do quantil pelo limite superior do bucket"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for idx, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets[idx] if idx < len(self.buckets) else float("inf")
+        return float("inf")
+
+
+class MetricsSink(TraceSink):
+    """Contadores e histogramas em memória, exportáveis no formato texto do Prometheus"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self.histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+        self.last_trace: Dict[str, Any] = {}
+
+    def _inc(self, name: str, value: float = 1, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def _observe(self, name: str, value: float, buckets=LATENCY_BUCKETS, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(buckets)
+        histogram.observe(value)
+
+    def emit(self, trace: TurnTrace):
+        with self._lock:
+            self._inc("agent_turns_total", mode=trace.mode)
+            if trace.error:
+                self._inc("agent_turn_errors_total", mode=trace.mode)
+            self._observe("agent_turn_latency_seconds", trace.latency or 0.0, mode=trace.mode)
+            self._observe("agent_turn_iterations", trace.iterations, buckets=(0, 1, 2, 3, 4, 5))
+            self._observe("agent_turn_prompt_tokens", trace.prompt_tokens, buckets=TOKEN_BUCKETS)
+
+            self._inc("agent_prompt_tokens_total", trace.prompt_tokens)
+            self._inc("agent_completion_tokens_total", trace.completion_tokens)
+            self._inc("agent_cached_tokens_total", trace.cached_tokens)
+
+            for call in trace.llm_calls:
+                self._observe("agent_llm_latency_seconds", call["latency"])
+            for call in trace.tool_calls:
+                self._observe("agent_tool_latency_seconds", call["latency"], tool=call["name"])
+                if call["error"]:
+                    self._inc("agent_tool_errors_total", tool=call["name"])
+                if call.get("coalesced"):
+                    self._inc("agent_tool_coalesced_total", tool=call["name"])
+            for cache in trace.cache_hits:
+                self._inc("agent_cache_hits_total", cache=cache)
+            if trace.prefetch:
+                self._inc("agent_prefetch_total", trace.prefetch["hits"], result="hit")
+                self._inc("agent_prefetch_total", trace.prefetch["discarded"], result="discarded")
+            if trace.route:
+                self._inc("agent_routed_turns_total", intent=trace.route)
+            if trace.tools_bound is not None:
+                self._observe("agent_turn_tools_bound", trace.tools_bound, buckets=(1, 2, 4, 8, 16, 32, 64))
+
+            self.last_trace = trace.to_dict()
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Valor atual de um contador"""
+        return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """Histograma de uma métrica (vazio se ainda não observado)"""
+        return self.histograms.get((name, tuple(sorted(labels.items())))) or Histogram(LATENCY_BUCKETS)
+
+    def histograms_named(self, name: str) -> List[Tuple[Dict[str, str], Histogram]]:
+        """Todos os histogramas de uma métrica, com seus rótulos"""
+        return [(dict(labels), hist) for (metric, labels), hist in self.histograms.items() if metric == name]
+
+    def render_prometheus(self) -> str:
+        """Exporta as métricas no formato texto de exposição do Prometheus"""
+        def fmt_labels(labels, extra=None):
+            items = list(labels) + (extra or [])
+            if not items:
+                return ""
+            return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}"
+
+        lines = []
+        with self._lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                lines.append(f"{name}{fmt_labels(labels)} {value}")
+            for (name, labels), hist in sorted(self.histograms.items(), key=lambda item: item[0]):
+                cumulative = 0
+                for bound, count in zip(hist.buckets, hist.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{fmt_labels(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{name}_bucket{fmt_labels(labels, [('le', '+Inf')])} {hist.count}")
+                lines.append(f"{name}_sum{fmt_labels(labels)} {hist.sum}")
+                lines.append(f"{name}_count{fmt_labels(labels)} {hist.count}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,125 @@
+"""
+Registro de um turno do agente: chamadas ao modelo, ferramentas e caches
+"""
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+
+def _usage(response: Any) -> Dict[str, int]:
+    """Extrai a contagem de tokens de uma resposta do LangChain (0 se ausente)"""
+    usage = getattr(response, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    return {
+        "prompt_tokens": usage.get("input_tokens", 0),
+        "completion_tokens": usage.get("output_tokens", 0),
+        "cached_tokens": details.get("cache_read", 0),
+    }
+
+
+class TurnTrace:
+    """Medições de um turno de conversa"""
+
+    def __init__(self, session_id: Optional[str] = None, mode: str = "chat"):
+        """
+        Inicializa o registro
+
+        Args:
+            session_id: Identificador da sessão (opcional)
+            mode: Variante usada (chat, achat ou stream)
+        """
+        self.turn_id = uuid.uuid4().hex[:12]
+        self.session_id = session_id
+        self.mode = mode
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+
+        self.llm_calls: List[Dict[str, Any]] = []
+        self.tool_calls: List[Dict[str, Any]] = []
+        self.cache_hits: List[str] = []
+        self.route: Optional[str] = None
+        self.prefetch: Optional[Dict[str, int]] = None
+        self.tools_bound: Optional[int] = None
+        self.latency: Optional[float] = None
+        self.error: Optional[str] = None
+        # Ferramentas podem rodar em paralelo (achat)
+        self._lock = threading.Lock()
+
+    def record_llm_call(self, latency: float, response: Any, first_token_latency: Optional[float] = None):
+        """
+        Registra uma chamada ao modelo
+
+        Args:
+            latency: Duração da chamada em segundos
+            response: Mensagem retornada (para extrair o uso de tokens)
+            first_token_latency: Tempo até o primeiro token (modo streaming)
+        """
+        call = {"iteration": len(self.llm_calls) + 1, "latency": latency, **_usage(response)}
+        if first_token_latency is not None:
+            call["first_token_latency"] = first_token_latency
+        self.llm_calls.append(call)
+
+    def record_tool_call(self, name: str, latency: float, error: Optional[str] = None, coalesced: bool = False):
+        """Registra a execução de uma ferramenta (coalesced: resultado compartilhado com outra chamada)"""
+        with self._lock:
+            self.tool_calls.append({"name": name, "latency": latency, "error": error, "coalesced": coalesced})
+
+    def record_cache_hit(self, cache: str):
+        """Registra um acerto de cache durante o turno (ex.: "response")"""
+        self.cache_hits.append(cache)
+
+    def record_route(self, intent: str):
+        """Registra que o turno foi respondido pelo roteador de intenções"""
+        self.route = intent
+
+    def record_prefetch(self, hits: int, discarded: int):
+        """Registra o uso das chamadas de ferramenta especulativas do turno"""
+        self.prefetch = {"hits": hits, "discarded": discarded}
+
+    def record_tools_bound(self, count: int):
+        """Registra quantas ferramentas foram enviadas ao modelo no turno"""
+        self.tools_bound = count
+
+    def finish(self, error: Optional[str] = None):
+        """Encerra a medição do turno"""
+        self.latency = time.perf_counter() - self._started
+        self.error = error
+
+    @property
+    def iterations(self) -> int:
+        """Número de chamadas ao modelo no turno"""
+        return len(self.llm_calls)
+
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(call["prompt_tokens"] for call in self.llm_calls)
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(call["completion_tokens"] for call in self.llm_calls)
+
+    @property
+    def cached_tokens(self) -> int:
+        return sum(call["cached_tokens"] for call in self.llm_calls)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representação serializável do turno"""
+        return {
+            "turn_id": self.turn_id,
+            "session_id": self.session_id,
+            "mode": self.mode,
+            "started_at": self.started_at,
+            "latency": self.latency,
+            "iterations": self.iterations,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "llm_calls": self.llm_calls,
+            "tool_calls": self.tool_calls,
+            "route": self.route,
+            "prefetch": self.prefetch,
+            "tools_bound": self.tools_bound,
+            "cache_hits": self.cache_hits,
+            "error": self.error,
+        }
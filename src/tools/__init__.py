@@ -1,14 +1,38 @@
-"""Módulo de ferramentas do agente"""
-from .agent_tools import (
-    get_all_tools,
-    create_brasileirao_tool,
-    test_brasileirao_extraction,
-    extract_brasileirao_table
-)
+"""Módulo de ferramentas do agente (submódulos importados sob demanda)"""
+from .._lazy import lazy_exports
 
-__all__ = [
-    "get_all_tools",
-    "create_brasileirao_tool",
-    "test_brasileirao_extraction",
-    "extract_brasileirao_table"
-]
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "get_all_tools": ".agent_tools",
+    "create_tool": ".agent_tools",
+    "ToolRegistry": ".registry",
+    "get_tool_registry": ".registry",
+    "create_brasileirao_tool": ".agent_tools",
+    "test_brasileirao_extraction": ".agent_tools",
+    "extract_brasileirao_table": ".agent_tools",
+    "load_standings": ".agent_tools",
+    "snapshot_store": ".agent_tools",
+    "standings_cache": ".agent_tools",
+    "StandingsCache": ".swr_cache",
+    "get_standings_store": ".agent_tools",
+    "create_standings_query_tools": ".agent_tools",
+    "lookup_team": ".agent_tools",
+    "get_position_range": ".agent_tools",
+    "get_table_zone": ".agent_tools",
+    "compare_teams": ".agent_tools",
+    "get_historical_standings": ".agent_tools",
+    "match_cache": ".agent_tools",
+    "get_match_store": ".agent_tools",
+    "create_match_tools": ".agent_tools",
+    "get_last_matches": ".agent_tools",
+    "get_next_matches": ".agent_tools",
+    "get_round_results": ".agent_tools",
+    "get_home_away_split": ".agent_tools",
+    "MatchStore": ".match_store",
+    "create_odds_tool": ".agent_tools",
+    "get_season_odds": ".agent_tools",
+    "get_season_simulation": ".agent_tools",
+    "simulate_season": ".simulation",
+    "StandingsStore": ".standings_store",
+    "format_result": ".formatting",
+    "standings_legend": ".formatting",
+})
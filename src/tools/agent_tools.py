@@ -2,9 +2,29 @@
 Ferramentas para extração de dados do Brasileirão
 """
 from langchain_core.tools import StructuredTool
-import requests
-from typing import Optional
-import json
+from concurrent.futures import Future
+from typing import Dict, Optional
+import hashlib
+import logging
+import threading
+
+from ..config import settings
+from ..ingestion.http import create_session
+from ..ingestion.matches import fetch_season_matches
+from ..ingestion.providers import (
+    ApiFootballProvider,
+    ProviderChain,
+    SnapshotProvider,
+    SofaScoreProvider,
+)
+from ..ingestion.snapshot import SnapshotStore
+from ..ingestion.sofascore import resolve_tournament
+from .formatting import format_result
+from .match_store import MatchStore
+from .swr_cache import StandingsCache
+from .standings_store import StandingsStore
+
+logger = logging.getLogger(__name__)
 
 
 def get_mock_brasileirao_data() -> dict:
@@ -43,77 +63,465 @@ def get_mock_brasileirao_data() -> dict:
     }
 
 
+# Snapshot local mantido pelo worker de ingestão (python -m src.ingestion.worker)
+snapshot_store = SnapshotStore(settings.STANDINGS_SNAPSHOT_PATH)
+
+# Fontes externas em ordem de preferência, cada uma com seu circuit breaker
+sofascore_provider = SofaScoreProvider()
+snapshot_provider = SnapshotProvider(snapshot_store)
+
+_network_providers = [sofascore_provider]
+if settings.API_FOOTBALL_KEY:
+    _network_providers.append(ApiFootballProvider(settings.API_FOOTBALL_KEY))
+
+network_chain = ProviderChain(
+    _network_providers,
+    hedge_delay=settings.UPSTREAM_HEDGE_DELAY,
+    timeout=settings.UPSTREAM_TIMEOUT,
+)
+standings_providers = ProviderChain(
+    _network_providers + [snapshot_provider],
+    hedge_delay=settings.UPSTREAM_HEDGE_DELAY,
+    timeout=settings.UPSTREAM_TIMEOUT,
+)
+
+
+def load_standings() -> Optional[dict]:
+    """
+    Carrega a classificação da fonte configurada em STANDINGS_SOURCE
+    
+    - snapshot: apenas o snapshot local, sem I/O de rede
+    - network: apenas as fontes externas (SofaScore, API-Football)
+    - auto: o snapshot, se existir e for recente; senão as fontes externas,
+      com o snapshot antigo como último recurso
+    
+    Returns:
+        Dicionário com os dados da classificação ou None se nenhuma fonte responder
+    """
+    source = settings.STANDINGS_SOURCE
+    
+    if source in ("auto", "snapshot"):
+        snapshot = snapshot_store.read(settings.SOFASCORE_TOURNAMENT_ID, settings.SOFASCORE_SEASON_ID)
+        if snapshot is not None and (
+            source == "snapshot" or snapshot.age <= settings.STANDINGS_SNAPSHOT_MAX_AGE
+        ):
+            return snapshot.data
+        if source == "snapshot":
+            return None
+    
+    if source == "network":
+        return network_chain.fetch()
+    
+    return standings_providers.fetch()
+
+
+# Cache de processo compartilhado por todas as sessões
+standings_cache = StandingsCache(
+    loader=load_standings,
+    fallback=get_mock_brasileirao_data,
+    ttl=settings.STANDINGS_CACHE_TTL,
+    stale_ttl=settings.STANDINGS_CACHE_STALE_TTL,
+    negative_ttl=settings.STANDINGS_CACHE_NEGATIVE_TTL,
+)
+
+
 def extract_brasileirao_table(query: str = "") -> str:
     """
     Extrai dados da tabela de classificação do Brasileirão Série A
     
-    Tenta múltiplas fontes de dados:
-    1. API do SofaScore (frequentemente bloqueada)
-    2. API-Football (requer chave de API - não configurada)
-    3. Dados de exemplo (fallback)
+    Os dados são servidos pelo cache de processo (`standings_cache`), que
+    consulta as fontes abaixo apenas quando o conteúdo expira:
+    1. Snapshot local gravado pelo worker de ingestão
+    2. API do SofaScore (frequentemente bloqueada)
+    3. API-Football (se API_FOOTBALL_KEY estiver configurada)
+    4. Dados de exemplo (fallback)
     
     Args:
         query: Query opcional (não usado, apenas para compatibilidade)
     
     Returns:
-        Dados da tabela em formato JSON string
+        Dados da tabela no formato configurado em TOOL_OUTPUT_FORMAT
+    """
+    result = standings_cache.get()
+    return format_result(result)
+
+
+_store: Optional[StandingsStore] = None
+_store_version: Optional[str] = None
+_store_lock = threading.Lock()
+
+
+def get_standings_store() -> StandingsStore:
     """
+    Retorna a classificação atual indexada, reconstruída só quando os dados mudam
     
-    # Tentativa 1: API SofaScore
-    api_url = "https://api.sofascore.com/api/v1/unique-tournament/325/season/87678/standings/total"
+    Returns:
+        Instância de StandingsStore correspondente à versão em cache
+    """
+    global _store, _store_version
     
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'pt-BR,pt;q=0.9',
-            'Referer': 'https://www.sofascore.com/',
-        }
-        
-        response = requests.get(api_url, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            
-            if 'standings' in data and data['standings']:
-                standings = data['standings'][0]['rows']
-                
-                teams_data = []
-                for row in standings:
-                    team = row.get('team', {})
-                    team_info = {
-                        "posicao": row.get('position', 0),
-                        "time": team.get('name', 'Desconhecido'),
-                        "sigla": team.get('shortName', ''),
-                        "pontos": row.get('points', 0),
-                        "jogos": row.get('matches', 0),
-                        "vitorias": row.get('wins', 0),
-                        "empates": row.get('draws', 0),
-                        "derrotas": row.get('losses', 0),
-                        "gols_pro": row.get('scoresFor', 0),
-                        "gols_contra": row.get('scoresAgainst', 0),
-                        "saldo_gols": row.get('scoresFor', 0) - row.get('scoresAgainst', 0),
-                    }
-                    teams_data.append(team_info)
-                
-                result = {
-                    "success": True,
-                    "campeonato": "Brasileirão Série A",
-                    "temporada": "2024",
-                    "total_times": len(teams_data),
-                    "fonte": "API SofaScore (dados reais)",
-                    "classificacao": teams_data
-                }
-                
-                return json.dumps(result, ensure_ascii=False, indent=2)
+    data = standings_cache.get()
+    version = standings_cache.version
+    
+    with _store_lock:
+        if _store is None or version != _store_version:
+            _store = StandingsStore.from_table(data)
+            _store_version = version
+        return _store
+
+
+def lookup_team(time: str) -> str:
+    """
+    Consulta a linha de um time na classificação
+    
+    Args:
+        time: Nome, sigla ou parte do nome do time
+    
+    Returns:
+        Linha do time no formato configurado
+    """
+    row = get_standings_store().team(time)
+    if row is None:
+        return format_result({"success": False, "message": f"Time '{time}' não encontrado na tabela."})
+    return format_result({"success": True, "time": row})
+
+
+def get_position_range(inicio: int, fim: int) -> str:
+    """
+    Consulta os times entre duas posições da tabela
+    
+    Args:
+        inicio: Primeira posição (inclusive)
+        fim: Última posição (inclusive)
+    
+    Returns:
+        Linhas da faixa no formato configurado
+    """
+    rows = get_standings_store().position_range(inicio, fim)
+    return format_result({"success": True, "classificacao": rows})
+
+
+def get_table_zone(zona: str) -> str:
+    """
+    Consulta os times de uma zona da tabela
     
+    Args:
+        zona: g4, g6, libertadores, sulamericana, z4 ou rebaixamento
+    
+    Returns:
+        Linhas da zona no formato configurado
+    """
+    rows = get_standings_store().zone(zona)
+    if rows is None:
+        return format_result({
+            "success": False,
+            "message": f"Zona '{zona}' desconhecida. Use g4, g6, libertadores, sulamericana ou z4.",
+        })
+    return format_result({"success": True, "zona": zona, "classificacao": rows})
+
+
+def compare_teams(time_a: str, time_b: str) -> str:
+    """
+    Compara dois times da tabela
+    
+    Args:
+        time_a: Nome ou sigla do primeiro time
+        time_b: Nome ou sigla do segundo time
+    
+    Returns:
+        Comparação no formato configurado
+    """
+    comparison = get_standings_store().compare(time_a, time_b)
+    if comparison is None:
+        return format_result({
+            "success": False,
+            "message": f"Não foi possível encontrar '{time_a}' e/ou '{time_b}' na tabela.",
+        })
+    return format_result({"success": True, **comparison})
+
+
+def get_historical_standings(campeonato: str = "serie-a", temporada: str = "") -> str:
+    """
+    Consulta a classificação de qualquer temporada já importada para o snapshot local
+    
+    Não faz I/O de rede: os dados são gravados previamente pelo backfill
+    (python -m src.ingestion.backfill).
+    
+    Args:
+        campeonato: Torneio ("serie-a" ou "serie-b")
+        temporada: Ano da temporada (ex.: "2019"); vazio lista as temporadas disponíveis
+    
+    Returns:
+        Tabela da temporada no formato configurado
+    """
+    resolved = resolve_tournament(campeonato)
+    if resolved is None:
+        return format_result({
+            "success": False,
+            "message": f"Campeonato '{campeonato}' desconhecido. Use serie-a ou serie-b.",
+        })
+    tournament_id, title = resolved
+    
+    available = [year for _, year in snapshot_store.list_seasons(tournament_id)]
+    season_id = snapshot_store.find_season(tournament_id, temporada) if temporada else None
+    snapshot = snapshot_store.read(tournament_id, season_id) if season_id else None
+    
+    if snapshot is None:
+        return format_result({
+            "success": False,
+            "campeonato": title,
+            "message": f"Temporada '{temporada}' não disponível." if temporada else "Informe a temporada.",
+            "temporadas_disponiveis": available,
+        })
+    return format_result(snapshot.data)
+
+
+def _matches_metadata(fonte: str) -> dict:
+    """Informações do campeonato anexadas às partidas"""
+    return {
+        "campeonato": "Brasileirão Série A",
+        "temporada": settings.SOFASCORE_SEASON_YEAR,
+        "fonte": fonte,
+    }
+
+
+# Sessão própria: a leitura das páginas de partidas é longa e não deve disputar o pool da classificação
+match_session = create_session(pool_size=2)
+
+
+def load_matches() -> Optional[MatchStore]:
+    """
+    Carrega as partidas da temporada da fonte configurada em STANDINGS_SOURCE
+    
+    Mesma política de `load_standings`: o snapshot gravado pelo worker
+    (python -m src.ingestion.worker --matches) quando recente, senão as
+    páginas de eventos do SofaScore, lidas de forma incremental.
+    
+    Returns:
+        MatchStore com as partidas ou None se nenhuma fonte responder
+    """
+    source = settings.STANDINGS_SOURCE
+    tournament_id, season_id = settings.SOFASCORE_TOURNAMENT_ID, settings.SOFASCORE_SEASON_ID
+    
+    snapshot = None
+    if source in ("auto", "snapshot"):
+        snapshot = snapshot_store.read_matches(tournament_id, season_id)
+        if snapshot is not None and (
+            source == "snapshot" or snapshot.age <= settings.STANDINGS_SNAPSHOT_MAX_AGE
+        ):
+            return MatchStore(snapshot.data, _matches_metadata("Snapshot local"))
+        if source == "snapshot":
+            return None
+    
+    try:
+        matches = fetch_season_matches(match_session, tournament_id, season_id)
     except Exception as e:
-        # Continua para o fallback
-        pass
+        logger.warning("Falha ao buscar partidas no SofaScore: %s", e)
+        matches = None
     
-    # Fallback: Retorna dados de exemplo
-    result = get_mock_brasileirao_data()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    if matches:
+        return MatchStore(matches, _matches_metadata("API SofaScore (dados reais)"))
+    if snapshot is not None:
+        return MatchStore(snapshot.data, _matches_metadata("Snapshot local"))
+    return None
+
+
+# Partidas da temporada, com a mesma revalidação em segundo plano da classificação
+match_cache = StandingsCache(
+    loader=load_matches,
+    fallback=lambda: MatchStore([]),
+    ttl=settings.MATCHES_CACHE_TTL,
+    stale_ttl=settings.STANDINGS_CACHE_STALE_TTL,
+    negative_ttl=settings.STANDINGS_CACHE_NEGATIVE_TTL,
+    versioner=lambda store: store.version,
+)
+
+
+def get_match_store() -> MatchStore:
+    """
+    Retorna as partidas da temporada indexadas
+    
+    Returns:
+        MatchStore em cache (vazio se nenhuma fonte respondeu)
+    """
+    return match_cache.get()
+
+
+def _matches_unavailable() -> str:
+    return format_result({
+        "success": False,
+        "message": "Dados de partidas indisponíveis no momento.",
+    })
+
+
+def get_last_matches(time: str, quantidade: int = 5) -> str:
+    """
+    Consulta as últimas partidas disputadas de um time
+    
+    Args:
+        time: Nome, sigla ou apelido do time
+        quantidade: Número de partidas (padrão: 5)
+    
+    Returns:
+        Partidas, da mais recente, e a sequência de resultados no formato configurado
+    """
+    store = get_match_store()
+    if not store.available:
+        return _matches_unavailable()
+    result = store.last_matches(time, quantidade)
+    if result is None:
+        return format_result({"success": False, "message": f"Time '{time}' não encontrado nas partidas."})
+    return format_result({"success": True, **store.metadata, **result})
+
+
+def get_next_matches(time: str, quantidade: int = 5) -> str:
+    """
+    Consulta as próximas partidas de um time
+    
+    Args:
+        time: Nome, sigla ou apelido do time
+        quantidade: Número de partidas (padrão: 5)
+    
+    Returns:
+        Partidas, da mais próxima, no formato configurado
+    """
+    store = get_match_store()
+    if not store.available:
+        return _matches_unavailable()
+    result = store.next_matches(time, quantidade)
+    if result is None:
+        return format_result({"success": False, "message": f"Time '{time}' não encontrado nas partidas."})
+    return format_result({"success": True, **store.metadata, **result})
+
+
+def get_round_results(rodada: int = 0) -> str:
+    """
+    Consulta as partidas e os placares de uma rodada
+    
+    Args:
+        rodada: Número da rodada (0 = última rodada com partida encerrada)
+    
+    Returns:
+        Partidas da rodada no formato configurado
+    """
+    store = get_match_store()
+    if not store.available:
+        return _matches_unavailable()
+    rodada, matches = store.round_matches(rodada)
+    if not matches:
+        return format_result({"success": False, "message": f"Rodada {rodada} não encontrada."})
+    return format_result({"success": True, **store.metadata, "rodada": rodada, "partidas": matches})
+
+
+def get_home_away_split(time: str) -> str:
+    """
+    Consulta a campanha de um time em casa, fora e no total
+    
+    Args:
+        time: Nome, sigla ou apelido do time
+    
+    Returns:
+        Campanha por local no formato configurado
+    """
+    store = get_match_store()
+    if not store.available:
+        return _matches_unavailable()
+    result = store.split(time)
+    if result is None:
+        return format_result({"success": False, "message": f"Time '{time}' não encontrado nas partidas."})
+    return format_result({"success": True, **store.metadata, **result})
+
+
+_odds: Optional[dict] = None
+_odds_key: Optional[tuple] = None
+_odds_inflight: Dict[tuple, Future] = {}
+_odds_lock = threading.Lock()
+
+
+def get_season_simulation() -> dict:
+    """
+    Simula o restante da temporada, recalculando só quando os dados mudam
+    
+    O resultado é memorizado pela versão da classificação e das partidas. A
+    simulação roda fora do lock: chamadas concorrentes da mesma versão
+    aguardam a primeira e as demais consultas não esperam por ela. As
+    partidas nunca são buscadas aqui; sem elas em cache, a busca é disparada
+    em segundo plano e a simulação usa só a classificação até lá.
+    
+    Returns:
+        Resultado de `simulate_season` para os dados em cache
+    """
+    global _odds, _odds_key
+    # NumPy só é carregado na primeira simulação
+    from .simulation import simulate_season
+    
+    standings = get_standings_store()
+    matches = match_cache.peek()
+    fixtures = matches.pending_fixtures() if matches is not None and matches.available else None
+    key = (
+        standings_cache.version,
+        match_cache.version if fixtures is not None else None,
+        settings.SIMULATION_RUNS,
+    )
+    
+    with _odds_lock:
+        if _odds is not None and key == _odds_key:
+            return _odds
+        future = _odds_inflight.get(key)
+        if future is None:
+            future = _odds_inflight[key] = Future()
+            leader = True
+        else:
+            leader = False
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        # Semente derivada dos dados: réplicas diferentes respondem o mesmo
+        seed = int(hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:8], 16)
+        result = simulate_season(
+            standings,
+            fixtures,
+            runs=settings.SIMULATION_RUNS,
+            workers=settings.SIMULATION_WORKERS,
+            seed=seed,
+        )
+    except BaseException as e:
+        with _odds_lock:
+            _odds_inflight.pop(key, None)
+        future.set_exception(e)
+        raise
+    
+    with _odds_lock:
+        _odds, _odds_key = result, key
+        _odds_inflight.pop(key, None)
+    future.set_result(result)
+    return result
+
+
+def get_season_odds(time: str = "") -> str:
+    """
+    Consulta as chances de título, Libertadores e rebaixamento
+    
+    Args:
+        time: Nome, sigla ou apelido do time (vazio = todos os times)
+    
+    Returns:
+        Probabilidades (%) estimadas por simulação no formato configurado
+    """
+    simulation = get_season_simulation()
+    rows = simulation["probabilidades"]
+    if not rows:
+        return format_result({"success": False, "message": "Classificação indisponível para a simulação."})
+    
+    metadata = {key: value for key, value in simulation.items() if key != "probabilidades"}
+    if time:
+        idx = get_standings_store().find_team(time)
+        if idx is None:
+            return format_result({"success": False, "message": f"Time '{time}' não encontrado na tabela."})
+        rows = [rows[idx]]
+    return format_result({"success": True, **metadata, "probabilidades": rows})
 
 
 def test_brasileirao_extraction():
@@ -129,77 +537,163 @@ def test_brasileirao_extraction():
     print("\nResultado da extração:")
     print(result)
     
-    # Parse do JSON para análise
-    try:
-        data = json.loads(result)
-        if data.get("success"):
-            print(f"\n✅ Sucesso! {data['total_times']} times encontrados")
-            print(f"Campeonato: {data['campeonato']}")
-            print(f"Temporada: {data['temporada']}")
-            
-            if 'observacao' in data:
-                print(f"\n{data['observacao']}")
-            
-            if 'fonte' in data:
-                print(f"Fonte: {data['fonte']}")
-            
-            print("\n🏆 TOP 10 - Classificação:")
-            print("-" * 80)
-            print(f"{'Pos':<4} {'Time':<25} {'Pts':<4} {'J':<3} {'V':<3} {'E':<3} {'D':<3} {'GP':<3} {'GC':<3} {'SG':<4}")
-            print("-" * 80)
-            for team in data['classificacao'][:10]:
-                print(f"{team['posicao']:<4d} {team['time']:<25s} {team['pontos']:<4d} "
-                      f"{team['jogos']:<3d} {team['vitorias']:<3d} {team['empates']:<3d} "
-                      f"{team['derrotas']:<3d} {team['gols_pro']:<3d} {team['gols_contra']:<3d} "
-                      f"{team['saldo_gols']:+4d}")
-            
-            print("\n⬇️ ZONA DE REBAIXAMENTO:")
-            print("-" * 80)
-            for team in data['classificacao'][-4:]:
-                print(f"{team['posicao']:<4d} {team['time']:<25s} {team['pontos']:<4d} "
-                      f"{team['jogos']:<3d} {team['vitorias']:<3d} {team['empates']:<3d} "
-                      f"{team['derrotas']:<3d} {team['gols_pro']:<3d} {team['gols_contra']:<3d} "
-                      f"{team['saldo_gols']:+4d}")
-        else:
-            print(f"\n❌ Erro: {data.get('error')}")
-            print(f"   Mensagem: {data.get('message')}")
-            if 'sugestao' in data:
-                print(f"   Sugestão: {data.get('sugestao')}")
-    except json.JSONDecodeError:
-        print("\n❌ Erro ao decodificar JSON")
+    # Dados estruturados para análise
+    data = standings_cache.get()
+    if data.get("success"):
+        print(f"\n✅ Sucesso! {data['total_times']} times encontrados")
+        print(f"Campeonato: {data['campeonato']}")
+        print(f"Temporada: {data['temporada']}")
+
+        if 'observacao' in data:
+            print(f"\n{data['observacao']}")
+
+        if 'fonte' in data:
+            print(f"Fonte: {data['fonte']}")
+
+        print("\n🏆 TOP 10 - Classificação:")
+        print("-" * 80)
+        print(f"{'Pos':<4} {'Time':<25} {'Pts':<4} {'J':<3} {'V':<3} {'E':<3} {'D':<3} {'GP':<3} {'GC':<3} {'SG':<4}")
+        print("-" * 80)
+        for team in data['classificacao'][:10]:
+            print(f"{team['posicao']:<4d} {team['time']:<25s} {team['pontos']:<4d} "
+                  f"{team['jogos']:<3d} {team['vitorias']:<3d} {team['empates']:<3d} "
+                  f"{team['derrotas']:<3d} {team['gols_pro']:<3d} {team['gols_contra']:<3d} "
+                  f"{team['saldo_gols']:+4d}")
+
+        print("\n⬇️ ZONA DE REBAIXAMENTO:")
+        print("-" * 80)
+        for team in data['classificacao'][-4:]:
+            print(f"{team['posicao']:<4d} {team['time']:<25s} {team['pontos']:<4d} "
+                  f"{team['jogos']:<3d} {team['vitorias']:<3d} {team['empates']:<3d} "
+                  f"{team['derrotas']:<3d} {team['gols_pro']:<3d} {team['gols_contra']:<3d} "
+                  f"{team['saldo_gols']:+4d}")
+    else:
+        print(f"\n❌ Erro: {data.get('error')}")
+        print(f"   Mensagem: {data.get('message')}")
+        if 'sugestao' in data:
+            print(f"   Sugestão: {data.get('sugestao')}")
     
     print("=" * 80)
 
 
-def create_brasileirao_tool() -> StructuredTool:
-    """Cria e retorna a ferramenta de extração do Brasileirão"""
-    from ..prompts import prompt_loader
+# Definição das ferramentas: nome -> (função, chave da descrição em tool_prompts.json, descrição padrão)
+TOOL_DEFINITIONS = {
+    "TabelaBrasileirão": (
+        extract_brasileirao_table,
+        "brasileirao_description",
+        "Útil para obter a tabela de classificação atualizada do Campeonato Brasileiro Série A. "
+        "Extrai dados de posição, times, pontos e estatísticas do SofaScore.",
+    ),
+    "ChancesCampeonato": (
+        get_season_odds,
+        "season_odds_description",
+        "Retorna as chances (%) de título, Libertadores e rebaixamento dos times do Brasileirão, "
+        "estimadas por simulação do restante da temporada.",
+    ),
+    "ConsultarTime": (
+        lookup_team,
+        "lookup_team_description",
+        "Retorna posição, pontos e estatísticas de um único time do Brasileirão.",
+    ),
+    "FaixaClassificacao": (
+        get_position_range,
+        "position_range_description",
+        "Retorna os times entre duas posições da tabela do Brasileirão.",
+    ),
+    "ZonaClassificacao": (
+        get_table_zone,
+        "table_zone_description",
+        "Retorna os times de uma zona da tabela: g4, g6, libertadores, sulamericana ou z4.",
+    ),
+    "TabelaHistorica": (
+        get_historical_standings,
+        "historical_standings_description",
+        "Retorna a classificação final de temporadas anteriores da Série A ou Série B.",
+    ),
+    "CompararTimes": (
+        compare_teams,
+        "compare_teams_description",
+        "Compara dois times do Brasileirão lado a lado.",
+    ),
+    "UltimosJogos": (
+        get_last_matches,
+        "last_matches_description",
+        "Retorna as últimas partidas disputadas de um time do Brasileirão e sua sequência recente.",
+    ),
+    "ProximosJogos": (
+        get_next_matches,
+        "next_matches_description",
+        "Retorna as próximas partidas de um time do Brasileirão.",
+    ),
+    "ResultadosRodada": (
+        get_round_results,
+        "round_results_description",
+        "Retorna as partidas e os placares de uma rodada do Brasileirão.",
+    ),
+    "DesempenhoCasaFora": (
+        get_home_away_split,
+        "home_away_description",
+        "Retorna a campanha de um time do Brasileirão em casa, fora e no total.",
+    ),
+}
+
+
+def create_tool(name: str) -> StructuredTool:
+    """
+    Cria uma ferramenta a partir de `TOOL_DEFINITIONS`
+    
+    Args:
+        name: Nome da ferramenta
     
-    tool_prompts = prompt_loader.get_tool_prompts()
+    Returns:
+        Ferramenta do LangChain com a descrição de tool_prompts.json
+    """
+    from ..prompts import prompt_loader
     
+    func, prompt_key, default_description = TOOL_DEFINITIONS[name]
     return StructuredTool.from_function(
-        func=extract_brasileirao_table,
-        name="TabelaBrasileirão",
-        description=tool_prompts.get(
-            "brasileirao_description",
-            "Útil para obter a tabela de classificação atualizada do Campeonato Brasileiro Série A. "
-            "Extrai dados de posição, times, pontos e estatísticas do SofaScore."
-        )
+        func=func,
+        name=name,
+        description=prompt_loader.get_tool_prompts().get(prompt_key, default_description),
     )
 
 
+def create_brasileirao_tool() -> StructuredTool:
+    """Cria e retorna a ferramenta de extração do Brasileirão"""
+    return create_tool("TabelaBrasileirão")
+
+
+def create_odds_tool() -> StructuredTool:
+    """Cria a ferramenta de probabilidades de título, Libertadores e rebaixamento"""
+    return create_tool("ChancesCampeonato")
+
+
+def create_standings_query_tools() -> list:
+    """Cria as ferramentas de consulta pontual à classificação"""
+    return [
+        create_tool(name)
+        for name in ("ConsultarTime", "FaixaClassificacao", "ZonaClassificacao", "TabelaHistorica", "CompararTimes")
+    ]
+
+
+def create_match_tools() -> list:
+    """Cria as ferramentas de consulta às partidas da temporada"""
+    return [
+        create_tool(name)
+        for name in ("UltimosJogos", "ProximosJogos", "ResultadosRodada", "DesempenhoCasaFora")
+    ]
+
+
 def get_all_tools() -> list:
     """
-    Retorna todas as ferramentas disponíveis para o agente
+    Retorna todas as ferramentas disponíveis para o agente, incluindo as de plugins
     
     Returns:
-        Lista de ferramentas do LangChain
+        Lista de ferramentas do LangChain em ordem alfabética
     """
-    tools = [
-        create_brasileirao_tool(),
-    ]
+    from .registry import get_tool_registry
     
-    return tools
+    return get_tool_registry().tools()
 
 
 # Permite executar o teste diretamente
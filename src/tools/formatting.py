@@ -0,0 +1,129 @@
+"""
+Serialização dos resultados das ferramentas
+
+O resultado das ferramentas é a maior parte do prompt de cada turno. Este
+módulo oferece formatos alternativos ao JSON indentado, com a legenda das
+colunas declarada uma única vez:
+
+- json: JSON indentado com as chaves completas (formato original)
+- json_compact: JSON sem espaços, chaves completas
+- json_min: JSON sem espaços, chaves curtas e legenda
+- csv / tsv: metadados e legenda em linhas de comentário, seguidos de uma tabela
+"""
+import json
+from typing import Any, Dict, List, Optional
+
+from ..config import settings
+from .standings_store import ZONES
+
+FORMATS = ("json", "json_compact", "json_min", "csv", "tsv")
+
+# Chaves curtas usadas em json_min e no cabeçalho das tabelas
+SHORT_KEYS = {
+    "posicao": "p",
+    "time": "t",
+    "sigla": "s",
+    "pontos": "pts",
+    "jogos": "j",
+    "vitorias": "v",
+    "empates": "e",
+    "derrotas": "d",
+    "gols_pro": "gp",
+    "gols_contra": "gc",
+    "saldo_gols": "sg",
+}
+
+# Chaves que carregam linhas (da classificação ou de partidas), em ordem de prioridade
+ROW_KEYS = ("classificacao", "partidas", "probabilidades", "times", "time")
+
+
+def legend() -> str:
+    """Legenda das chaves curtas, no formato `p=posicao, t=time, ...`"""
+    return ", ".join(f"{short}={full}" for full, short in SHORT_KEYS.items())
+
+
+def standings_legend() -> str:
+    """
+    Legenda estável da classificação (colunas e zonas)
+
+    Não depende dos dados da rodada, então pode compor o prefixo fixo do
+    prompt, idêntico em todos os turnos e sessões.
+    """
+    zones = ", ".join(
+        f"{name}={start}-{end}" if start > 0 else f"{name}=últimas {-start} posições"
+        for name, (start, end) in ZONES.items()
+    )
+    return f"Colunas: {legend()}. Zonas: {zones}."
+
+
+def _split_rows(data: Dict[str, Any]):
+    """Separa as linhas da classificação dos demais campos do resultado"""
+    for key in ROW_KEYS:
+        value = data.get(key)
+        if isinstance(value, dict):
+            value = [value]
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            metadata = {k: v for k, v in data.items() if k != key}
+            return key, value, metadata
+    return None, [], data
+
+
+def _columns(rows: List[Dict[str, Any]]) -> List[str]:
+    """Colunas presentes nas linhas, na ordem da primeira linha"""
+    return list(rows[0].keys()) if rows else []
+
+
+def _format_delimited(data: Dict[str, Any], delimiter: str) -> str:
+    """Formata o resultado como tabela delimitada com cabeçalho de chaves curtas"""
+    key, rows, metadata = _split_rows(data)
+    lines = [f"# {name}: {value}" for name, value in metadata.items()]
+
+    if rows:
+        columns = _columns(rows)
+        lines.append(f"# {key} ({legend()})")
+        lines.append(delimiter.join(SHORT_KEYS.get(column, column) for column in columns))
+        for row in rows:
+            lines.append(delimiter.join(str(row.get(column, "")) for column in columns))
+
+    return "\n".join(lines)
+
+
+def _format_json_min(data: Dict[str, Any]) -> str:
+    """Formata o resultado como JSON compacto com chaves curtas e legenda única"""
+    key, rows, metadata = _split_rows(data)
+    if not rows:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    columns = _columns(rows)
+    result = dict(metadata)
+    result["legenda"] = legend()
+    result["colunas"] = [SHORT_KEYS.get(column, column) for column in columns]
+    result[key] = [[row.get(column) for column in columns] for row in rows]
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+
+
+def format_result(data: Dict[str, Any], fmt: Optional[str] = None) -> str:
+    """
+    Serializa o resultado de uma ferramenta no formato configurado
+
+    Args:
+        data: Resultado da ferramenta
+        fmt: Formato (padrão: settings.TOOL_OUTPUT_FORMAT)
+
+    Returns:
+        Resultado serializado
+    """
+    fmt = (fmt or settings.TOOL_OUTPUT_FORMAT).lower()
+
+    if fmt == "json":
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    if fmt == "json_compact":
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    if fmt == "json_min":
+        return _format_json_min(data)
+    if fmt == "csv":
+        return _format_delimited(data, ",")
+    if fmt == "tsv":
+        return _format_delimited(data, "\t")
+
+    raise ValueError(f"Formato de saída desconhecido: {fmt}. Use um de {', '.join(FORMATS)}")
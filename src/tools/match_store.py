@@ -0,0 +1,285 @@
+"""
+Armazenamento compacto das partidas da temporada
+
+As partidas ficam em colunas `array` (inteiros de tamanho fixo, sem um objeto
+Python por campo) e os times em uma lista com índice por nome e sigla. Os
+agregados de cada time (campanha total, em casa e fora, e a ordem
+cronológica dos seus jogos) são calculados uma única vez na construção; as
+consultas das ferramentas apenas leem esses índices.
+"""
+import hashlib
+import json
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .standings_store import TEAM_ALIASES, normalize_name
+
+# Horário de Brasília (sem horário de verão desde 2019)
+BRT = timezone(timedelta(hours=-3))
+
+STATUS_LABELS = ("agendada", "em andamento", "encerrada", "adiada", "cancelada")
+_STATUS_CODES = {label: code for code, label in enumerate(STATUS_LABELS)}
+FINISHED = _STATUS_CODES["encerrada"]
+
+# Agregados por time: três blocos (total, casa, fora) com estas estatísticas
+SPLITS = ("total", "casa", "fora")
+STATS = ("jogos", "vitorias", "empates", "derrotas", "gols_pro", "gols_contra")
+_GAMES, _WINS, _DRAWS, _LOSSES, _GOALS_FOR, _GOALS_AGAINST = range(len(STATS))
+
+
+class MatchStore:
+    """Partidas da temporada em colunas com agregados por time"""
+
+    def __init__(self, matches: Iterable[Sequence], metadata: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa o armazenamento
+
+        Args:
+            matches: Partidas na ordem de campos de `MatchRecord` (tuplas ou listas)
+            metadata: Informações do campeonato (nome, temporada, fonte)
+        """
+        records = sorted((tuple(match) for match in matches), key=lambda match: (match[2], match[0]))
+        self.metadata = metadata or {}
+        self.size = len(records)
+        self.version = hashlib.sha1(
+            json.dumps(records, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:12]
+
+        self.teams: List[str] = []
+        self.siglas: List[str] = []
+        self._by_name: Dict[str, int] = {}
+        self._by_sigla: Dict[str, int] = {}
+
+        self.ids = array("q")
+        self.rounds = array("h")
+        self.starts = array("q")
+        self.home = array("h")
+        self.away = array("h")
+        self.home_goals = array("h")
+        self.away_goals = array("h")
+        self.status = array("b")
+
+        for match_id, rodada, inicio, home, home_sigla, away, away_sigla, home_goals, away_goals, status in records:
+            self.ids.append(match_id)
+            self.rounds.append(rodada)
+            self.starts.append(inicio)
+            self.home.append(self._team_id(home, home_sigla))
+            self.away.append(self._team_id(away, away_sigla))
+            self.home_goals.append(home_goals)
+            self.away_goals.append(away_goals)
+            self.status.append(_STATUS_CODES.get(status, 0))
+
+        self._build_indexes()
+
+    def _team_id(self, name: str, sigla: str) -> int:
+        """Índice do time, cadastrando-o na primeira aparição"""
+        key = normalize_name(name)
+        idx = self._by_name.get(key)
+        if idx is None:
+            idx = self._by_name[key] = len(self.teams)
+            self.teams.append(name)
+            self.siglas.append(sigla)
+            if sigla:
+                self._by_sigla.setdefault(normalize_name(sigla), idx)
+        return idx
+
+    def _build_indexes(self):
+        """Jogos de cada time, jogos de cada rodada e agregados de campanha"""
+        self._team_matches: List[array] = [array("i") for _ in self.teams]
+        self._by_round: Dict[int, array] = {}
+        self._stats: List[array] = [array("i", [0] * len(SPLITS) * len(STATS)) for _ in self.teams]
+        self._current_round: Optional[int] = None
+
+        for idx in range(self.size):
+            home, away = self.home[idx], self.away[idx]
+            self._team_matches[home].append(idx)
+            self._team_matches[away].append(idx)
+            self._by_round.setdefault(self.rounds[idx], array("i")).append(idx)
+
+            if self.status[idx] != FINISHED:
+                continue
+            self._current_round = max(self._current_round or 0, self.rounds[idx])
+            for team, split, goals_for, goals_against in (
+                (home, 1, self.home_goals[idx], self.away_goals[idx]),
+                (away, 2, self.away_goals[idx], self.home_goals[idx]),
+            ):
+                result = _WINS if goals_for > goals_against else _DRAWS if goals_for == goals_against else _LOSSES
+                for offset in (0, split * len(STATS)):
+                    stats = self._stats[team]
+                    stats[offset + _GAMES] += 1
+                    stats[offset + result] += 1
+                    stats[offset + _GOALS_FOR] += goals_for
+                    stats[offset + _GOALS_AGAINST] += goals_against
+
+    @property
+    def available(self) -> bool:
+        """Indica se há partidas carregadas"""
+        return self.size > 0
+
+    @property
+    def current_round(self) -> Optional[int]:
+        """Última rodada com partida encerrada (None antes da primeira)"""
+        return self._current_round
+
+    def find_team(self, query: str) -> Optional[int]:
+        """
+        Localiza um time pelo nome, sigla, apelido ou parte do nome
+
+        Args:
+            query: Nome, sigla, apelido ou trecho do nome do time
+
+        Returns:
+            Índice do time ou None se não encontrado
+        """
+        key = normalize_name(query)
+        if not key:
+            return None
+
+        if key in self._by_sigla:
+            return self._by_sigla[key]
+        if key in self._by_name:
+            return self._by_name[key]
+        if TEAM_ALIASES.get(key) in self._by_name:
+            return self._by_name[TEAM_ALIASES[key]]
+
+        for name, idx in self._by_name.items():
+            if name.startswith(key) or key in name:
+                return idx
+        return None
+
+    def match(self, idx: int, team: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Reconstrói uma partida
+
+        Args:
+            idx: Índice da partida
+            team: Time de referência, para incluir local e resultado do ponto de vista dele
+
+        Returns:
+            Dicionário com rodada, data, times, placar e situação
+        """
+        played = self.status[idx] in (FINISHED, _STATUS_CODES["em andamento"])
+        row = {
+            "rodada": self.rounds[idx],
+            "data": datetime.fromtimestamp(self.starts[idx], BRT).strftime("%d/%m/%Y %H:%M"),
+            "mandante": self.teams[self.home[idx]],
+            "visitante": self.teams[self.away[idx]],
+            "placar": f"{self.home_goals[idx]}x{self.away_goals[idx]}" if played else "",
+            "status": STATUS_LABELS[self.status[idx]],
+        }
+        if team is not None:
+            home = self.home[idx] == team
+            row["local"] = "casa" if home else "fora"
+            row["resultado"] = self._result(idx, team) if self.status[idx] == FINISHED else ""
+        return row
+
+    def _result(self, idx: int, team: int) -> str:
+        """V, E ou D do ponto de vista do time em uma partida encerrada"""
+        goals_for, goals_against = self.home_goals[idx], self.away_goals[idx]
+        if self.away[idx] == team:
+            goals_for, goals_against = goals_against, goals_for
+        return "V" if goals_for > goals_against else "E" if goals_for == goals_against else "D"
+
+    def _finished(self, team: int) -> List[int]:
+        """Partidas encerradas do time, em ordem cronológica"""
+        return [idx for idx in self._team_matches[team] if self.status[idx] == FINISHED]
+
+    def form(self, team: int, count: int = 5) -> str:
+        """Resultados das últimas partidas do time, do mais antigo ao mais recente (ex.: "VVEDV")"""
+        return "".join(self._result(idx, team) for idx in self._finished(team)[-count:])
+
+    def last_matches(self, query: str, count: int = 5) -> Optional[Dict[str, Any]]:
+        """
+        Últimas partidas disputadas de um time
+
+        Args:
+            query: Nome, sigla ou apelido do time
+            count: Número de partidas
+
+        Returns:
+            Time, sequência recente e partidas (da mais recente) ou None se o time não existir
+        """
+        team = self.find_team(query)
+        if team is None:
+            return None
+        count = max(count, 0)
+        recent = self._finished(team)[-count:] if count else []
+        return {
+            "time": self.teams[team],
+            "forma": self.form(team, count),
+            "partidas": [self.match(idx, team) for idx in reversed(recent)],
+        }
+
+    def _pending(self, indexes: Iterable[int]) -> List[int]:
+        """Partidas ainda não encerradas (agendadas, adiadas ou em andamento)"""
+        return [idx for idx in indexes if self.status[idx] not in (FINISHED, _STATUS_CODES["cancelada"])]
+
+    def pending_fixtures(self) -> List[Tuple[str, str]]:
+        """
+        Partidas que faltam na temporada
+
+        Returns:
+            Pares (mandante, visitante) em ordem de início
+        """
+        return [(self.teams[self.home[idx]], self.teams[self.away[idx]]) for idx in self._pending(range(self.size))]
+
+    def next_matches(self, query: str, count: int = 5) -> Optional[Dict[str, Any]]:
+        """
+        Próximas partidas de um time (agendadas, adiadas ou em andamento)
+
+        Args:
+            query: Nome, sigla ou apelido do time
+            count: Número de partidas
+
+        Returns:
+            Time e partidas (da mais próxima) ou None se o time não existir
+        """
+        team = self.find_team(query)
+        if team is None:
+            return None
+        pending = self._pending(self._team_matches[team])
+        return {
+            "time": self.teams[team],
+            "partidas": [self.match(idx, team) for idx in pending[:max(count, 0)]],
+        }
+
+    def round_matches(self, rodada: Optional[int] = None) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        """
+        Partidas de uma rodada
+
+        Args:
+            rodada: Número da rodada (padrão: última rodada com partida encerrada)
+
+        Returns:
+            Tupla (rodada consultada, partidas em ordem de início)
+        """
+        if not rodada:
+            rodada = self.current_round
+        return rodada, [self.match(idx) for idx in self._by_round.get(rodada, ())]
+
+    def split(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Campanha de um time no total, em casa e fora
+
+        Args:
+            query: Nome, sigla ou apelido do time
+
+        Returns:
+            Agregados por local, com pontos, saldo e aproveitamento, ou None se o time não existir
+        """
+        team = self.find_team(query)
+        if team is None:
+            return None
+
+        stats = self._stats[team]
+        result: Dict[str, Any] = {"time": self.teams[team]}
+        for block, name in enumerate(SPLITS):
+            values = dict(zip(STATS, stats[block * len(STATS):(block + 1) * len(STATS)]))
+            points = 3 * values["vitorias"] + values["empates"]
+            values["pontos"] = points
+            values["saldo_gols"] = values["gols_pro"] - values["gols_contra"]
+            values["aproveitamento"] = round(100 * points / (3 * values["jogos"]), 1) if values["jogos"] else 0.0
+            result[name] = values
+        result["forma"] = self.form(team)
+        return result
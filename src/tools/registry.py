@@ -0,0 +1,248 @@
+"""
+Registro das ferramentas do agente
+
+As ferramentas ficam em um dicionário por nome e só são construídas no
+primeiro uso: registrar uma ferramenta guarda apenas o nome, a fábrica e as
+palavras-chave que a relacionam a uma pergunta. Ferramentas de outros pacotes
+são descobertas pelo grupo de entry points `brasileiraogpt.tools`, lendo só os
+metadados dos pacotes instalados; o módulo do plugin é importado quando a
+ferramenta é usada pela primeira vez.
+
+Um plugin declara no próprio pacote (o nome do entry point é o nome da
+ferramenta e o valor, uma função sem argumentos que retorna a ferramenta):
+
+    [project.entry-points."brasileiraogpt.tools"]
+    ArtilheirosBrasileirao = "meu_pacote.ferramentas:create_scorers_tool"
+
+As palavras-chave de um plugin podem vir em `tool.metadata["keywords"]`; até
+a ferramenta ser construída ela só é enviada ao modelo nos turnos que recebem
+todas as ferramentas.
+"""
+import importlib
+import logging
+import re
+import threading
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..config import settings
+from .standings_store import normalize_name
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "brasileiraogpt.tools"
+
+# Ferramentas do próprio app: (nome, palavras-chave, sempre enviada ao modelo).
+# As palavras-chave são trechos de expressão regular aplicados à pergunta
+# normalizada (sem acentos e em minúsculas) no início de uma palavra.
+BUILTIN_TOOLS: Tuple[Tuple[str, Tuple[str, ...], bool], ...] = (
+    ("TabelaBrasileirão", (), True),
+    ("ConsultarTime", (), True),
+    ("FaixaClassificacao", ("entre (o|a)", "posic", "top", "primeiros", "colocad"), False),
+    ("ZonaClassificacao", ("g4", "g6", "z4", "zona", "libertadores", "sul ?americana", "rebaixa", "degola", "cai"), False),
+    ("CompararTimes", ("compar", "vs", "versus", "x ", "melhor", "pior", "diferenca", "frente"), False),
+    ("TabelaHistorica", ("serie b", "historic", "temporada", "ano passado", "(19|20)\\d\\d"), False),
+    ("ChancesCampeonato", ("chance", "probabil", "risco", "previs", "cai", "rebaixa", "campea", "titulo"), False),
+    ("UltimosJogos", ("ultim", "jog", "partida", "forma", "sequencia", "resultado", "venceu", "perdeu"), False),
+    ("ProximosJogos", ("proxim", "jog", "partida", "agenda", "calendario", "enfrenta"), False),
+    ("ResultadosRodada", ("rodada", "resultado", "placar"), False),
+    ("DesempenhoCasaFora", ("casa", "fora", "mandante", "visitante", "desempenho", "campanha"), False),
+)
+
+
+def _builtin_factory(name: str) -> Callable[[], "BaseTool"]:
+    """Fábrica que importa `agent_tools` só quando a ferramenta é construída"""
+    def factory():
+        return importlib.import_module(".agent_tools", __package__).create_tool(name)
+    return factory
+
+
+class ToolSpec:
+    """Ferramenta registrada; construída no primeiro `ToolRegistry.get`"""
+
+    __slots__ = ("name", "factory", "core", "pattern", "tool", "version")
+
+    def __init__(self, name: str, factory: Callable[[], "BaseTool"], keywords: Iterable[str] = (), core: bool = False):
+        self.name = name
+        self.factory = factory
+        self.core = core
+        self.pattern = self._compile(keywords)
+        self.tool: Optional["BaseTool"] = None
+        # Versão dos prompts com que a ferramenta foi construída (descrição)
+        self.version: Optional[str] = None
+
+    @staticmethod
+    def _compile(keywords: Iterable[str]) -> Optional["re.Pattern"]:
+        keywords = list(keywords)
+        return re.compile(r"\b(" + "|".join(keywords) + ")") if keywords else None
+
+    def matches(self, text: str) -> bool:
+        """Indica se a pergunta normalizada cita alguma palavra-chave da ferramenta"""
+        return self.pattern is not None and self.pattern.search(text) is not None
+
+    def hits(self, text: str) -> int:
+        """Quantas palavras-chave da ferramenta a pergunta normalizada cita"""
+        return len(self.pattern.findall(text)) if self.pattern is not None else 0
+
+
+class ToolRegistry:
+    """Ferramentas indexadas por nome, construídas sob demanda"""
+
+    def __init__(self):
+        self._specs: Dict[str, ToolSpec] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], "BaseTool"],
+        keywords: Iterable[str] = (),
+        core: bool = False,
+    ):
+        """
+        Registra uma ferramenta sem construí-la
+
+        Args:
+            name: Nome da ferramenta (o mesmo que o modelo usa para chamá-la)
+            factory: Função sem argumentos que constrói a ferramenta
+            keywords: Trechos de regex que relacionam a ferramenta a uma pergunta
+            core: Envia a ferramenta ao modelo em todos os turnos
+        """
+        with self._lock:
+            self._specs[name] = ToolSpec(name, factory, keywords, core)
+
+    def discover(self, group: str = ENTRY_POINT_GROUP) -> int:
+        """
+        Registra as ferramentas declaradas por pacotes instalados
+
+        Args:
+            group: Grupo de entry points
+
+        Returns:
+            Número de ferramentas registradas
+        """
+        count = 0
+        for entry_point in entry_points(group=group):
+            if entry_point.name in self._specs:
+                logger.warning("Plugin ignorado: ferramenta '%s' já registrada", entry_point.name)
+                continue
+            self.register(entry_point.name, lambda entry_point=entry_point: entry_point.load()())
+            count += 1
+        return count
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def names(self) -> List[str]:
+        """Nomes registrados em ordem alfabética (ordem estável do prefixo do prompt)"""
+        return sorted(self._specs)
+
+    def get(self, name: str, version: Optional[str] = None) -> Optional["BaseTool"]:
+        """
+        Retorna a ferramenta, construindo-a no primeiro uso
+
+        Args:
+            name: Nome da ferramenta
+            version: Versão dos prompts exigida; se a ferramenta foi construída
+                com outra, é reconstruída (descrição nova de tool_prompts.json)
+
+        Returns:
+            Ferramenta ou None se o nome não estiver registrado
+        """
+        spec = self._specs.get(name)
+        if spec is None:
+            return None
+        if spec.tool is None or (version is not None and spec.version != version):
+            with self._lock:
+                if spec.tool is None or (version is not None and spec.version != version):
+                    tool = spec.factory()
+                    keywords = (getattr(tool, "metadata", None) or {}).get("keywords")
+                    if keywords and spec.pattern is None:
+                        spec.pattern = ToolSpec._compile(keywords)
+                    spec.tool = tool
+                    spec.version = version
+        return spec.tool
+
+    def tools(self, names: Optional[Sequence[str]] = None, version: Optional[str] = None) -> List["BaseTool"]:
+        """
+        Constrói (se necessário) e retorna ferramentas em ordem alfabética
+
+        Args:
+            names: Ferramentas desejadas (padrão: todas)
+            version: Versão dos prompts exigida (ver `get`)
+
+        Returns:
+            Lista de ferramentas do LangChain
+        """
+        selected = sorted(name for name in (names or self._specs) if name in self._specs)
+        return [self.get(name, version) for name in selected]
+
+    def matching(self, text: str) -> Tuple[str, ...]:
+        """
+        Ferramentas cujas palavras-chave aparecem na pergunta
+
+        Args:
+            text: Pergunta do usuário
+
+        Returns:
+            Nomes das mais citadas para as menos e, no empate, em ordem
+            alfabética (vazio se nenhuma palavra-chave aparecer)
+        """
+        normalized = normalize_name(text)
+        hits = {name: spec.hits(normalized) for name, spec in self._specs.items()}
+        return tuple(sorted((name for name, count in hits.items() if count), key=lambda name: (-hits[name], name)))
+
+    def select(self, text: str, extra: Iterable[str] = ()) -> Tuple[str, ...]:
+        """
+        Escolhe as ferramentas relevantes para uma pergunta
+
+        Args:
+            text: Pergunta do usuário
+            extra: Ferramentas a incluir de qualquer forma (ex.: as do turno anterior)
+
+        Returns:
+            Nomes em ordem alfabética: as ferramentas fixas, as citadas pela
+            pergunta e as extras, ou todas se a pergunta não citar nenhuma
+        """
+        matched = set(self.matching(text))
+        if not matched:
+            return tuple(self.names())
+        core = {name for name, spec in self._specs.items() if spec.core}
+        extra = {name for name in extra if name in self._specs}
+        return tuple(sorted(core | matched | extra))
+
+
+def register_builtin_tools(registry: ToolRegistry):
+    """Registra as ferramentas do próprio app"""
+    for name, keywords, core in BUILTIN_TOOLS:
+        registry.register(name, _builtin_factory(name), keywords, core)
+
+
+_registry: Optional[ToolRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_tool_registry() -> ToolRegistry:
+    """
+    Retorna o registro do processo, com as ferramentas do app e dos plugins
+
+    Returns:
+        Instância compartilhada de ToolRegistry
+    """
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = ToolRegistry()
+                register_builtin_tools(registry)
+                if settings.TOOL_PLUGINS_ENABLED:
+                    registry.discover()
+                _registry = registry
+    return _registry
@@ -0,0 +1,290 @@
+"""
+Simulação Monte Carlo do restante da temporada
+
+Cada partida restante recebe probabilidades de vitória, empate e derrota a
+partir de um modelo de Poisson com a força de ataque e de defesa dos times
+(gols por jogo na tabela, suavizados para o início do campeonato) e o fator
+casa. As simulações sorteiam todas as partidas de uma vez com NumPy: os
+resultados viram pontos e vitórias por multiplicação com a matriz de
+incidência das partidas, e a posição final de cada time sai de um `argsort`
+por simulação. Os lotes podem ser divididos entre processos.
+
+Critérios de desempate: pontos, vitórias e, por fim, o saldo de gols atual.
+"""
+import math
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .standings_store import ZONES, StandingsStore
+
+# Gols a mais do mandante (e a menos do visitante) em relação a um jogo neutro
+HOME_FACTOR = 1.15
+# Jogos "médios" somados a cada time para suavizar a força no começo do campeonato
+PRIOR_GAMES = 5
+# Placar máximo considerado no cálculo das probabilidades de cada partida
+MAX_GOALS = 10
+# Simulações por lote (limita a memória das matrizes de sorteio)
+BATCH_SIZE = 10_000
+
+
+class SeasonModel(NamedTuple):
+    """Entrada da simulação: situação atual e partidas restantes com probabilidades"""
+
+    points: np.ndarray
+    wins: np.ndarray
+    tiebreak: np.ndarray
+    home: np.ndarray
+    away: np.ndarray
+    p_home: np.ndarray
+    p_draw: np.ndarray
+
+
+def _poisson_pmf(lam: np.ndarray) -> np.ndarray:
+    """Probabilidade de 0..MAX_GOALS gols para cada média (linhas = partidas)"""
+    goals = np.arange(MAX_GOALS + 1)
+    factorials = np.array([math.factorial(k) for k in goals], dtype=float)
+    return np.exp(-lam[:, None]) * lam[:, None] ** goals / factorials
+
+
+def outcome_probabilities(home_lambda: np.ndarray, away_lambda: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Probabilidades de vitória do mandante e de empate
+
+    Args:
+        home_lambda: Gols esperados do mandante em cada partida
+        away_lambda: Gols esperados do visitante em cada partida
+
+    Returns:
+        Tupla (vitória do mandante, empate), normalizadas pelos placares considerados
+    """
+    joint = _poisson_pmf(home_lambda)[:, :, None] * _poisson_pmf(away_lambda)[:, None, :]
+    total = joint.sum(axis=(1, 2))
+    home_win = np.tril(np.ones((MAX_GOALS + 1, MAX_GOALS + 1)), -1)
+    p_home = (joint * home_win).sum(axis=(1, 2)) / total
+    p_draw = np.trace(joint, axis1=1, axis2=2) / total
+    return p_home, p_draw
+
+
+def build_model(
+    standings: StandingsStore,
+    fixtures: Optional[Sequence[Tuple[str, str]]] = None,
+) -> Tuple[SeasonModel, int]:
+    """
+    Monta a entrada da simulação
+
+    Sem calendário (`fixtures=None`), cada time joga as partidas que faltam
+    para completar o turno e o returno contra um adversário médio, em campo
+    neutro.
+
+    Args:
+        standings: Classificação atual
+        fixtures: Partidas restantes como pares (mandante, visitante)
+
+    Returns:
+        Tupla (modelo, partidas do calendário ignoradas por times fora da tabela)
+    """
+    size = standings.size
+    column = lambda name: np.array([value or 0 for value in standings.columns[name]], dtype=float)
+    games, goals_for, goals_against = column("jogos"), column("gols_pro"), column("gols_contra")
+
+    # O índice `size` é o adversário médio (ataque e defesa = 1)
+    average = goals_for.sum() / games.sum() if games.sum() else 1.3
+    attack = np.append((goals_for + PRIOR_GAMES * average) / ((games + PRIOR_GAMES) * average), 1.0)
+    defense = np.append((goals_against + PRIOR_GAMES * average) / ((games + PRIOR_GAMES) * average), 1.0)
+
+    skipped = 0
+    home: List[int] = []
+    away: List[int] = []
+    if fixtures is None:
+        remaining = np.maximum(2 * (size - 1) - games, 0).astype(int)
+        for team, count in enumerate(remaining):
+            for game in range(count):
+                home.append(team if game % 2 == 0 else size)
+                away.append(size if game % 2 == 0 else team)
+        home_factor = 1.0
+    else:
+        for home_name, away_name in fixtures:
+            home_idx, away_idx = standings.find_team(home_name), standings.find_team(away_name)
+            if home_idx is None or away_idx is None or home_idx == away_idx:
+                skipped += 1
+                continue
+            home.append(home_idx)
+            away.append(away_idx)
+        home_factor = HOME_FACTOR
+
+    home_idx, away_idx = np.array(home, dtype=np.intp), np.array(away, dtype=np.intp)
+    p_home, p_draw = outcome_probabilities(
+        average * attack[home_idx] * defense[away_idx] * home_factor,
+        average * attack[away_idx] * defense[home_idx] / home_factor,
+    )
+
+    # Desempate final pelo saldo e gols pró atuais, como fração menor que uma vitória
+    order = np.lexsort((-goals_for, -column("saldo_gols")))
+    tiebreak = np.empty(size)
+    tiebreak[order] = (size - 1 - np.arange(size)) / size
+
+    model = SeasonModel(
+        points=column("pontos"),
+        wins=column("vitorias"),
+        tiebreak=tiebreak,
+        home=home_idx,
+        away=away_idx,
+        p_home=p_home.astype(np.float32),
+        p_draw=p_draw.astype(np.float32),
+    )
+    return model, skipped
+
+
+def simulate_chunk(model: SeasonModel, runs: int, seed: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Executa um lote de simulações
+
+    Args:
+        model: Entrada da simulação
+        runs: Número de simulações
+        seed: Semente (ou SeedSequence) do gerador
+
+    Returns:
+        Tupla (contagem de posições finais [time, posição], soma dos pontos finais por time)
+    """
+    rng = np.random.default_rng(seed)
+    size = model.points.size
+    fixtures = model.home.size
+
+    # Matrizes de incidência partida -> time (a última coluna é o adversário médio)
+    home_incidence = np.zeros((fixtures, size + 1), dtype=np.float32)
+    away_incidence = np.zeros((fixtures, size + 1), dtype=np.float32)
+    home_incidence[np.arange(fixtures), model.home] = 1
+    away_incidence[np.arange(fixtures), model.away] = 1
+    home_draw_limit = model.p_home + model.p_draw
+
+    # Pontos valem mais que qualquer número de vitórias, que valem mais que o desempate
+    base_score = model.points * 64 + model.wins + model.tiebreak
+    cells = (np.arange(size) * size)[None, :]
+    positions = np.zeros(size * size, dtype=np.int64)
+    points_sum = np.zeros(size)
+
+    for start in range(0, runs, BATCH_SIZE):
+        batch = min(BATCH_SIZE, runs - start)
+        draws = rng.random((batch, fixtures), dtype=np.float32)
+        home_win = (draws < model.p_home).astype(np.float32)
+        draw = (draws < home_draw_limit).astype(np.float32) - home_win
+        away_win = 1 - home_win - draw
+
+        points = ((3 * home_win + draw) @ home_incidence + (3 * away_win + draw) @ away_incidence)[:, :size]
+        wins = (home_win @ home_incidence + away_win @ away_incidence)[:, :size]
+
+        order = np.argsort(-(base_score + points * 64 + wins), axis=1)
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.broadcast_to(np.arange(size), order.shape), axis=1)
+
+        positions += np.bincount((cells + ranks).ravel(), minlength=size * size)
+        points_sum += points.sum(axis=0)
+
+    return positions.reshape(size, size), points_sum
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_simulation_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Retorna o pool de processos da simulação, criado no primeiro uso
+
+    Usa `spawn`: os processos não herdam as threads e os locks do app.
+
+    Args:
+        workers: Número de processos
+
+    Returns:
+        Pool compartilhado do processo
+    """
+    global _pool, _pool_workers
+
+    if _pool is None or _pool_workers != workers:
+        with _pool_lock:
+            if _pool is None or _pool_workers != workers:
+                if _pool is not None:
+                    _pool.shutdown(wait=False)
+                _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+                _pool_workers = workers
+    return _pool
+
+
+def _zone_positions(name: str, size: int) -> slice:
+    """Posições (base 0) de uma zona da tabela"""
+    start, end = ZONES[name]
+    start = start - 1 if start > 0 else size + start
+    end = end if end > 0 else size + end + 1
+    return slice(start, end)
+
+
+def simulate_season(
+    standings: StandingsStore,
+    fixtures: Optional[Sequence[Tuple[str, str]]] = None,
+    runs: int = 100_000,
+    workers: int = 0,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Estima as chances de título, Libertadores e rebaixamento de cada time
+
+    Args:
+        standings: Classificação atual
+        fixtures: Partidas restantes como pares (mandante, visitante); None estima o calendário
+        runs: Número de simulações
+        workers: Processos usados (0 = no próprio processo)
+        seed: Semente, para resultados reproduzíveis
+
+    Returns:
+        Dicionário com o número de simulações, de partidas restantes e as
+        probabilidades (%) por time, na ordem da tabela atual
+    """
+    model, skipped = build_model(standings, fixtures)
+    size = standings.size
+    if size == 0:
+        return {"simulacoes": 0, "jogos_restantes": 0, "probabilidades": []}
+
+    chunks = max(1, min(workers, runs))
+    seeds = np.random.SeedSequence(seed).spawn(chunks)
+    sizes = [runs // chunks + (1 if index < runs % chunks else 0) for index in range(chunks)]
+
+    if workers > 0:
+        pool = get_simulation_pool(workers)
+        results = list(pool.map(simulate_chunk, [model] * chunks, sizes, seeds))
+    else:
+        results = [simulate_chunk(model, sizes[0], seeds[0])]
+
+    positions = sum(result[0] for result in results)
+    points_sum = sum(result[1] for result in results)
+
+    share = lambda zone: 100 * positions[:, _zone_positions(zone, size)].sum(axis=1) / runs
+    title, libertadores, relegation = 100 * positions[:, 0] / runs, share("libertadores"), share("rebaixamento")
+
+    rows = []
+    for idx in range(size):
+        rows.append({
+            "posicao": standings.columns["posicao"][idx],
+            "time": standings.columns["time"][idx],
+            "pontos": standings.columns["pontos"][idx],
+            "pontos_esperados": round(float(model.points[idx] + points_sum[idx] / runs), 1),
+            "titulo": round(float(title[idx]), 1),
+            "libertadores": round(float(libertadores[idx]), 1),
+            "rebaixamento": round(float(relegation[idx]), 1),
+        })
+
+    result = {
+        "simulacoes": runs,
+        "jogos_restantes": int(model.home.size),
+        "calendario": "partidas restantes" if fixtures is not None else "estimado (adversário médio)",
+        "probabilidades": rows,
+    }
+    if skipped:
+        result["partidas_ignoradas"] = skipped
+    return result
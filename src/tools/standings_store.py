@@ -0,0 +1,273 @@
+"""
+Armazenamento indexado da tabela de classificação
+
+Converte as linhas produzidas por `extract_brasileirao_table` em colunas e
+mantém índices por posição, nome e sigla, para que as ferramentas possam
+devolver ao modelo apenas as linhas necessárias para cada pergunta.
+"""
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+COLUMNS = (
+    "posicao",
+    "time",
+    "sigla",
+    "pontos",
+    "jogos",
+    "vitorias",
+    "empates",
+    "derrotas",
+    "gols_pro",
+    "gols_contra",
+    "saldo_gols",
+)
+
+# Zonas da tabela: (primeira posição, última posição). Posições negativas
+# contam a partir do fim, para funcionar com qualquer número de times.
+ZONES = {
+    "g4": (1, 4),
+    "g6": (1, 6),
+    "libertadores": (1, 6),
+    "sulamericana": (7, 12),
+    "z4": (-4, -1),
+    "rebaixamento": (-4, -1),
+}
+
+
+# Apelidos comuns dos times (normalizados) -> nome normalizado na tabela
+TEAM_ALIASES = {
+    "mengao": "flamengo",
+    "verdao": "palmeiras",
+    "porco": "palmeiras",
+    "timao": "corinthians",
+    "fogao": "botafogo",
+    "galo": "atletico mineiro",
+    "atletico mg": "atletico mineiro",
+    "furacao": "athletico paranaense",
+    "athletico pr": "athletico paranaense",
+    "atletico go": "atletico goianiense",
+    "dragao": "atletico goianiense",
+    "inter": "internacional",
+    "colorado": "internacional",
+    "vasco": "vasco da gama",
+    "vascao": "vasco da gama",
+    "raposa": "cruzeiro",
+    "imortal": "gremio",
+    "tigre": "criciuma",
+    "massa bruta": "red bull bragantino",
+    "dourado": "cuiaba",
+    "leao do pici": "fortaleza",
+    "tricolor paulista": "sao paulo",
+    "tricolor carioca": "fluminense",
+    "tricolor de aco": "bahia",
+}
+
+# Palavras de nomes de times que também são palavras comuns em perguntas
+_AMBIGUOUS_WORDS = {"sao", "red", "bull", "gama", "vitoria"}
+
+
+def normalize_name(text: str) -> str:
+    """Normaliza nomes de times para busca (sem acentos, caixa ou espaços extras)"""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.split())
+
+
+class StandingsStore:
+    """Tabela de classificação em formato colunar com índices"""
+
+    def __init__(self, rows: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa o armazenamento
+
+        Args:
+            rows: Linhas da classificação (formato de `extract_brasileirao_table`)
+            metadata: Informações do campeonato (nome, temporada, fonte)
+        """
+        ordered = sorted(rows, key=lambda row: row.get("posicao", 0))
+        self.columns: Dict[str, list] = {
+            column: [row.get(column) for row in ordered] for column in COLUMNS
+        }
+        self.metadata = metadata or {}
+        self.size = len(ordered)
+
+        self._by_position = {pos: idx for idx, pos in enumerate(self.columns["posicao"])}
+        self._by_name = {normalize_name(name): idx for idx, name in enumerate(self.columns["time"])}
+        self._by_sigla = {
+            normalize_name(sigla): idx for idx, sigla in enumerate(self.columns["sigla"]) if sigla
+        }
+        self._mention_pattern = self._build_mention_pattern()
+
+    def _build_mention_pattern(self) -> Optional["re.Pattern"]:
+        """Expressão que encontra nomes, palavras exclusivas e apelidos dos times"""
+        phrases = {name: idx for name, idx in self._by_name.items()}
+
+        # Palavras que identificam um único time (ex.: "bragantino", "mineiro")
+        words = Counter(word for name in self._by_name for word in set(name.split()))
+        for name, idx in self._by_name.items():
+            for word in name.split():
+                if words[word] == 1 and len(word) >= 5 and word not in _AMBIGUOUS_WORDS:
+                    phrases.setdefault(word, idx)
+
+        for alias, name in TEAM_ALIASES.items():
+            if name in self._by_name:
+                phrases.setdefault(alias, self._by_name[name])
+
+        self._mention_index = phrases
+        if not phrases:
+            return None
+        alternatives = sorted(phrases, key=len, reverse=True)
+        return re.compile(r"\b(" + "|".join(re.escape(phrase) for phrase in alternatives) + r")\b")
+
+    @classmethod
+    def from_table(cls, data: Dict[str, Any]) -> "StandingsStore":
+        """
+        Constrói o armazenamento a partir do dicionário da tabela
+
+        Args:
+            data: Resultado de `standings_cache.get()` ou `get_mock_brasileirao_data()`
+
+        Returns:
+            Instância de StandingsStore
+        """
+        metadata = {key: value for key, value in data.items() if key != "classificacao"}
+        return cls(data.get("classificacao", []), metadata)
+
+    def row(self, idx: int) -> Dict[str, Any]:
+        """Reconstrói a linha completa de um índice"""
+        return {column: self.columns[column][idx] for column in COLUMNS}
+
+    def find_team(self, query: str) -> Optional[int]:
+        """
+        Localiza um time pelo nome, sigla ou parte do nome
+
+        Args:
+            query: Nome, sigla ou trecho do nome do time
+
+        Returns:
+            Índice do time ou None se não encontrado
+        """
+        key = normalize_name(query)
+        if not key:
+            return None
+
+        if key in self._by_sigla:
+            return self._by_sigla[key]
+        if key in self._by_name:
+            return self._by_name[key]
+
+        # Busca parcial (ex.: "bragantino" encontra "Red Bull Bragantino")
+        for name, idx in self._by_name.items():
+            if name.startswith(key) or key in name:
+                return idx
+        return None
+
+    def mentions(self, text: str) -> List[int]:
+        """
+        Localiza os times citados em um texto livre
+
+        Reconhece nomes completos, palavras que identificam um único time,
+        apelidos comuns e siglas escritas em maiúsculas (ex.: "FLA").
+
+        Args:
+            text: Pergunta do usuário
+
+        Returns:
+            Índices dos times na ordem em que aparecem, sem repetição
+        """
+        found = []
+        if self._mention_pattern is not None:
+            normalized = re.sub(r"[^\w]+", " ", normalize_name(text))
+            found.extend(
+                (match.start() / max(len(normalized), 1), self._mention_index[match.group(1)])
+                for match in self._mention_pattern.finditer(normalized)
+            )
+        found.extend(
+            (match.start() / max(len(text), 1), self._by_sigla[match.group(0).lower()])
+            for match in re.finditer(r"\b[A-Z]{3}\b", text)
+            if match.group(0).lower() in self._by_sigla
+        )
+
+        indexes = []
+        for _, idx in sorted(found):
+            if idx not in indexes:
+                indexes.append(idx)
+        return indexes
+
+    def strip_mentions(self, text: str) -> str:
+        """
+        Remove de um texto os nomes e apelidos de times reconhecidos por `mentions`
+
+        Args:
+            text: Texto livre
+
+        Returns:
+            Texto normalizado (sem acentos, pontuação e caixa) sem os nomes dos times
+        """
+        normalized = re.sub(r"[^\w]+", " ", normalize_name(text))
+        if self._mention_pattern is not None:
+            normalized = self._mention_pattern.sub(" ", normalized)
+        return " ".join(normalized.split())
+
+    def team(self, query: str) -> Optional[Dict[str, Any]]:
+        """Retorna a linha do time ou None se não encontrado"""
+        idx = self.find_team(query)
+        return self.row(idx) if idx is not None else None
+
+    def position_range(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """
+        Retorna as linhas entre duas posições (inclusive)
+
+        Args:
+            start: Primeira posição
+            end: Última posição
+
+        Returns:
+            Lista de linhas na ordem da classificação
+        """
+        if start > end:
+            start, end = end, start
+        return [
+            self.row(self._by_position[pos])
+            for pos in range(max(start, 1), min(end, self.size) + 1)
+            if pos in self._by_position
+        ]
+
+    def zone(self, name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Retorna os times de uma zona da tabela (g4, g6, libertadores, sulamericana, z4)
+
+        Args:
+            name: Nome da zona
+
+        Returns:
+            Lista de linhas ou None se a zona não existir
+        """
+        bounds = ZONES.get(normalize_name(name).replace(" ", "").replace("-", ""))
+        if bounds is None:
+            return None
+        start, end = (pos if pos > 0 else self.size + pos + 1 for pos in bounds)
+        return self.position_range(start, end)
+
+    def compare(self, team_a: str, team_b: str) -> Optional[Dict[str, Any]]:
+        """
+        Compara dois times lado a lado
+
+        Args:
+            team_a: Nome ou sigla do primeiro time
+            team_b: Nome ou sigla do segundo time
+
+        Returns:
+            Linhas dos dois times e diferenças de pontos e posição, ou None
+        """
+        idx_a, idx_b = self.find_team(team_a), self.find_team(team_b)
+        if idx_a is None or idx_b is None:
+            return None
+        row_a, row_b = self.row(idx_a), self.row(idx_b)
+        return {
+            "times": [row_a, row_b],
+            "diferenca_pontos": row_a["pontos"] - row_b["pontos"],
+            "diferenca_posicoes": row_b["posicao"] - row_a["posicao"],
+        }
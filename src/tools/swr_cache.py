@@ -0,0 +1,200 @@
+"""
+Cache de processo para a tabela de classificação do Brasileirão
+
+Implementa stale-while-revalidate: enquanto o dado está dentro do TTL ele é
+servido direto da memória; depois disso, durante a janela de "stale", o dado
+antigo continua sendo servido enquanto uma thread em segundo plano busca a
+versão nova. Falhas da fonte externa também são cacheadas (cache negativo)
+por um tempo menor, para que uma API bloqueada não seja consultada a cada
+mensagem.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry:
+    """Entrada do cache com os metadados de validade"""
+
+    __slots__ = ("data", "fetched_at", "expires_at", "stale_until", "is_fallback", "version")
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        fetched_at: float,
+        expires_at: float,
+        stale_until: float,
+        is_fallback: bool,
+        version: str,
+    ):
+        self.data = data
+        self.fetched_at = fetched_at
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.is_fallback = is_fallback
+        self.version = version
+
+
+class StandingsCache:
+    """Cache compartilhado por todas as sessões com revalidação em segundo plano"""
+
+    def __init__(
+        self,
+        loader: Callable[[], Optional[Dict[str, Any]]],
+        fallback: Callable[[], Dict[str, Any]],
+        ttl: float = 300.0,
+        stale_ttl: float = 3600.0,
+        negative_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        versioner: Optional[Callable[[Any], str]] = None,
+    ):
+        """
+        Inicializa o cache
+
+        Args:
+            loader: Função que busca os dados na fonte externa (None em caso de falha)
+            fallback: Função que retorna os dados usados quando a fonte falha
+            ttl: Segundos em que um dado buscado com sucesso é considerado fresco
+            stale_ttl: Segundos adicionais em que o dado expirado ainda pode ser servido
+            negative_ttl: Segundos em que uma falha da fonte fica cacheada
+            clock: Relógio monotônico (injetável para testes)
+            versioner: Calcula a versão dos dados (padrão: hash da classificação)
+        """
+        self._loader = loader
+        self._fallback = fallback
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._versioner = versioner or self.compute_version
+
+        self._entry: Optional[_CacheEntry] = None
+        self._lock = threading.Lock()
+        self._refresh_flag_lock = threading.Lock()
+        self._refreshing = False
+
+    @staticmethod
+    def compute_version(data: Dict[str, Any]) -> str:
+        """Calcula uma versão estável a partir do conteúdo da classificação"""
+        payload = json.dumps(data.get("classificacao", []), ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+    @property
+    def version(self) -> Optional[str]:
+        """Versão dos dados atualmente em cache (None se vazio)"""
+        entry = self._entry
+        return entry.version if entry else None
+
+    def get(self) -> Dict[str, Any]:
+        """
+        Retorna a tabela, buscando na fonte apenas quando necessário
+
+        Returns:
+            Dicionário com os dados da classificação
+        """
+        now = self._clock()
+        entry = self._entry
+
+        if entry is not None:
+            if now < entry.expires_at:
+                return entry.data
+            if now < entry.stale_until:
+                self._schedule_refresh()
+                return entry.data
+
+        # Cache vazio ou completamente expirado: busca síncrona.
+        # O lock garante que sessões concorrentes aguardem uma única busca.
+        with self._lock:
+            entry = self._entry
+            if entry is not None and self._clock() < entry.expires_at:
+                return entry.data
+            return self._refresh_locked().data
+
+    def peek(self) -> Optional[Dict[str, Any]]:
+        """
+        Retorna os dados em cache sem nunca bloquear na fonte
+
+        Com o cache vazio ou expirado, a busca é disparada em segundo plano.
+
+        Returns:
+            Dados ainda servíveis (frescos ou na janela de "stale") ou None
+        """
+        entry = self._entry
+        if entry is None or self._clock() >= entry.expires_at:
+            self._schedule_refresh()
+        if entry is None or self._clock() >= entry.stale_until:
+            return None
+        return entry.data
+
+    def invalidate(self):
+        """Descarta o conteúdo do cache, forçando nova busca na próxima leitura"""
+        with self._lock:
+            self._entry = None
+
+    def _schedule_refresh(self):
+        """Dispara a revalidação em segundo plano se ainda não houver uma em andamento"""
+        # Lock próprio: o lock principal fica ocupado durante a busca na rede
+        with self._refresh_flag_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        thread = threading.Thread(
+            target=self._background_refresh,
+            name="standings-cache-refresh",
+            daemon=True,
+        )
+        thread.start()
+
+    def _background_refresh(self):
+        """Executa a revalidação fora do caminho da requisição"""
+        try:
+            with self._lock:
+                self._refresh_locked()
+        finally:
+            with self._refresh_flag_lock:
+                self._refreshing = False
+
+    def _refresh_locked(self) -> _CacheEntry:
+        """Busca os dados na fonte e atualiza a entrada (requer o lock)"""
+        data = None
+        try:
+            data = self._loader()
+        except Exception as e:
+            logger.warning("Falha ao buscar classificação na fonte externa: %s", e)
+
+        now = self._clock()
+        expires_at = now + self.ttl
+        stale_until = expires_at + self.stale_ttl
+        is_fallback = False
+
+        if data is None:
+            is_fallback = True
+            expires_at = now + self.negative_ttl
+            previous = self._entry
+            if previous is not None and not previous.is_fallback and now < previous.stale_until:
+                # Mantém o último dado real enquanto a fonte estiver falhando,
+                # sem estender a janela em que ele pode ser servido
+                data = previous.data
+                is_fallback = False
+                stale_until = previous.stale_until
+                expires_at = min(expires_at, stale_until)
+            else:
+                data = self._fallback()
+                stale_until = expires_at
+
+        entry = _CacheEntry(
+            data=data,
+            fetched_at=now,
+            expires_at=expires_at,
+            stale_until=stale_until,
+            is_fallback=is_fallback,
+            version=self._versioner(data),
+        )
+        self._entry = entry
+        return entry
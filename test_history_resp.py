@@ -0,0 +1,132 @@
+"""
+Testes do cliente RESP usado pelo histórico no Redis
+Execute: python test_history_resp.py (ou pytest test_history_resp.py)
+
+Um servidor TCP local responde com respostas pré-definidas; não é preciso
+ter um Redis instalado.
+"""
+import os
+import socket
+import threading
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+
+from src.agents.history import RespConnection, RespError
+
+CLOSE = "close"
+
+
+class ScriptedServer:
+    """Servidor que, a cada envio do cliente, executa a próxima ação do roteiro"""
+
+    # Ações: bytes (responde), None (não responde) ou (bytes, CLOSE) (responde e encerra a conexão)
+
+    def __init__(self, actions):
+        self.actions = list(actions)
+        self.received = []
+        self.connections = 0
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: socket.socket):
+        with conn:
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    return
+                self.received.append(data)
+                action = self.actions.pop(0) if self.actions else None
+                if action is None:
+                    continue
+                if isinstance(action, tuple):
+                    conn.sendall(action[0])
+                    return
+                conn.sendall(action)
+
+    def close(self):
+        self._server.close()
+
+
+def test_pipeline_replies():
+    server = ScriptedServer([b"*2\r\n$3\r\nabc\r\n$2\r\nde\r\n:1\r\n"])
+    try:
+        conn = RespConnection(server.url)
+        assert conn.pipeline(("LRANGE", "k", 0, -1), ("EXPIRE", "k", 60)) == [["abc", "de"], 1]
+    finally:
+        server.close()
+
+
+def test_error_inside_array_keeps_connection_in_sync():
+    server = ScriptedServer([
+        # MULTI, DEL, RPUSH, EXEC: o primeiro comando da transação falhou
+        b"+OK\r\n+QUEUED\r\n+QUEUED\r\n*2\r\n-WRONGTYPE Operation against a key\r\n:3\r\n",
+        b"*1\r\n$3\r\nabc\r\n:1\r\n",
+    ])
+    try:
+        conn = RespConnection(server.url)
+        try:
+            conn.pipeline(("MULTI",), ("DEL", "k"), ("RPUSH", "k", "a"), ("EXEC",))
+        except RespError as e:
+            assert "WRONGTYPE" in str(e)
+        else:
+            raise AssertionError("RespError esperado")
+
+        # A resposta seguinte não pode receber o restante do array anterior
+        assert conn.pipeline(("LRANGE", "k", 0, -1), ("EXPIRE", "k", 60)) == [["abc"], 1]
+        assert server.connections == 1
+    finally:
+        server.close()
+
+
+def test_timeout_after_send_is_not_retried():
+    server = ScriptedServer([None])
+    try:
+        conn = RespConnection(server.url, timeout=0.3)
+        try:
+            conn.pipeline(("RPUSH", "k", "registro"), ("EXPIRE", "k", 60))
+        except OSError:
+            pass
+        else:
+            raise AssertionError("Tempo de leitura esgotado esperado")
+
+        time.sleep(0.1)
+        pushes = sum(data.count(b"RPUSH") for data in server.received)
+        assert pushes == 1
+        assert server.connections == 1
+    finally:
+        server.close()
+
+
+def test_reconnects_when_idle_connection_was_closed():
+    server = ScriptedServer([(b"+OK\r\n", CLOSE), b"$2\r\nok\r\n"])
+    try:
+        conn = RespConnection(server.url)
+        assert conn.pipeline(("SET", "k", "v")) == ["OK"]
+        time.sleep(0.1)
+        assert conn.pipeline(("GET", "k")) == ["ok"]
+        assert server.connections == 2
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    test_pipeline_replies()
+    test_error_inside_array_keeps_connection_in_sync()
+    test_timeout_after_send_is_not_retried()
+    test_reconnects_when_idle_connection_was_closed()
+    print("OK: cliente RESP")
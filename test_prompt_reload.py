@@ -0,0 +1,95 @@
+"""
+Testes da recarga dos prompts e das descrições das ferramentas ao editar os arquivos
+Execute: python test_prompt_reload.py (ou pytest test_prompt_reload.py)
+
+Usa uma cópia dos prompts em um diretório temporário; os arquivos do projeto
+não são alterados.
+"""
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+# As configurações são lidas na importação de `src.config`; o cliente do
+# modelo é criado, mas nenhuma chamada é feita
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+
+from src.agents import create_agent
+from src.agents.resources import clear_agent_resources, get_agent_resources
+from src.prompts import prompt_loader
+
+TOOL_NAME = "TabelaBrasileirão"
+PROMPT_KEY = "brasileirao_description"
+
+
+def _bound_description(resources) -> str:
+    """Descrição da ferramenta como enviada ao modelo"""
+    bound = resources.bind([TOOL_NAME])
+    (tool,) = bound.kwargs["tools"]
+    return tool["function"]["description"]
+
+
+def _edit_prompt(path: str, key: str, text: str):
+    """Altera um prompt no arquivo JSON, garantindo um mtime novo"""
+    with open(path, "r", encoding="utf-8") as f:
+        prompts = json.load(f)
+    prompts[key] = text
+    previous_mtime = os.stat(path).st_mtime_ns
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(prompts, f, ensure_ascii=False, indent=2)
+    # Mesmo em sistemas de arquivos de baixa resolução
+    os.utime(path, ns=(previous_mtime + 10**9, previous_mtime + 10**9))
+
+
+@contextmanager
+def temporary_prompts():
+    """Aponta o carregador de prompts para uma cópia temporária dos arquivos"""
+    original_dir = prompt_loader.prompts_dir
+    temp_dir = tempfile.mkdtemp()
+    try:
+        shutil.copytree(original_dir, temp_dir, dirs_exist_ok=True, ignore=shutil.ignore_patterns("__pycache__", "*.py"))
+        prompt_loader.prompts_dir = type(original_dir)(temp_dir)
+        prompt_loader.invalidate()
+        clear_agent_resources()
+        yield temp_dir
+    finally:
+        prompt_loader.prompts_dir = original_dir
+        prompt_loader.invalidate()
+        clear_agent_resources()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_tool_description_follows_prompt_file():
+    with temporary_prompts() as prompts_dir:
+        tool_prompts = os.path.join(prompts_dir, "tool_prompts.json")
+
+        _edit_prompt(tool_prompts, PROMPT_KEY, "Descrição antiga da tabela")
+        assert _bound_description(get_agent_resources()) == "Descrição antiga da tabela"
+
+        _edit_prompt(tool_prompts, PROMPT_KEY, "Descrição nova da tabela")
+        resources = get_agent_resources()
+        assert _bound_description(resources) == "Descrição nova da tabela"
+        assert resources.registry.get(TOOL_NAME).description == "Descrição nova da tabela"
+
+
+def test_open_session_follows_prompt_file():
+    with temporary_prompts() as prompts_dir:
+        agent_prompts = os.path.join(prompts_dir, "agent_prompts.json")
+        tool_prompts = os.path.join(prompts_dir, "tool_prompts.json")
+        agent = create_agent(session_id="teste-recarga")
+
+        _edit_prompt(agent_prompts, "system_prompt", "Prompt do sistema novo")
+        _edit_prompt(tool_prompts, PROMPT_KEY, "Descrição nova da tabela")
+        # Feito no início de cada turno de chat, achat e stream_chat
+        agent._refresh_resources()
+
+        assert agent.resources is get_agent_resources()
+        assert agent.system_prompt.startswith("Prompt do sistema novo")
+        assert _bound_description(agent.resources) == "Descrição nova da tabela"
+
+
+if __name__ == "__main__":
+    test_tool_description_follows_prompt_file()
+    test_open_session_follows_prompt_file()
+    print("OK: ferramentas e sessões abertas acompanham os arquivos de prompt")
@@ -0,0 +1,126 @@
+"""
+Testes do circuit breaker e da cadeia de fontes com hedge
+Execute: python test_providers.py (ou pytest test_providers.py)
+"""
+import os
+import threading
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+
+from src.ingestion.providers import CircuitBreaker, ProviderChain, StandingsProvider, UpstreamError
+
+
+class FakeClock:
+    """Relógio controlado pelo teste"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScriptedProvider(StandingsProvider):
+    """Fonte com atraso e falha configuráveis"""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.release = threading.Event()
+
+    def fetch(self):
+        self.calls += 1
+        if self.delay:
+            self.release.wait(self.delay)
+        if self.fail:
+            raise UpstreamError(f"{self.name} falhou")
+        return {"fonte": self.name}
+
+
+def test_breaker_opens_after_threshold_and_probes_once():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    # Passado o tempo de espera, uma única requisição de teste
+    clock.now = 31
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_the_circuit():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now = 31
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_explicit_failure_falls_through_immediately():
+    failing, backup = ScriptedProvider("a", fail=True), ScriptedProvider("b")
+    chain = ProviderChain([failing, backup], hedge_delay=5, timeout=5)
+    started = time.monotonic()
+    assert chain.fetch() == {"fonte": "b"}
+    assert time.monotonic() - started < 1
+
+
+def test_slow_provider_is_hedged():
+    slow, fast = ScriptedProvider("lenta", delay=5), ScriptedProvider("rapida")
+    chain = ProviderChain([slow, fast], hedge_delay=0.05, timeout=2)
+    try:
+        started = time.monotonic()
+        assert chain.fetch() == {"fonte": "rapida"}
+        assert time.monotonic() - started < 1
+    finally:
+        slow.release.set()
+
+
+def test_hung_provider_does_not_block_later_fetches():
+    hung, backup = ScriptedProvider("travada", delay=5), ScriptedProvider("reserva")
+    chain = ProviderChain([hung, backup], hedge_delay=1, timeout=0.1)
+    try:
+        # A primeira consulta esgota o prazo com a fonte travada
+        assert chain.fetch() is None
+        # As seguintes pulam a chamada ainda em andamento e usam a reserva
+        for _ in range(3):
+            assert chain.fetch() == {"fonte": "reserva"}
+        assert hung.calls == 1
+    finally:
+        hung.release.set()
+
+
+def test_open_breaker_skips_provider():
+    broken, backup = ScriptedProvider("quebrada", fail=True), ScriptedProvider("reserva")
+    broken.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    chain = ProviderChain([broken, backup], hedge_delay=1, timeout=2)
+    chain.fetch()
+    chain.fetch()
+    assert broken.calls == 1
+    assert backup.calls == 2
+
+
+if __name__ == "__main__":
+    test_breaker_opens_after_threshold_and_probes_once()
+    test_failed_probe_reopens_the_circuit()
+    test_explicit_failure_falls_through_immediately()
+    test_slow_provider_is_hedged()
+    test_hung_provider_does_not_block_later_fetches()
+    test_open_breaker_skips_provider()
+    print("OK: circuit breaker e cadeia de fontes")
@@ -0,0 +1,75 @@
+"""
+Testes da chave e da validade do cache de respostas
+Execute: python test_response_cache.py (ou pytest test_response_cache.py)
+"""
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+
+from src.agents.response_cache import ResponseCache, normalize_question
+
+
+class FakeClock:
+    """Relógio controlado pelo teste"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_question_normalization():
+    assert normalize_question("  Quem está no Z4?! ") == "quem esta no z4"
+    assert normalize_question("QUEM ESTÁ  no   z4") == "quem esta no z4"
+
+
+def test_hit_only_for_same_question_and_data_version():
+    cache = ResponseCache(ttl=60, clock=FakeClock())
+    cache.put("Quem está no Z4?", "v1", "Z4: ...")
+
+    assert cache.get("quem esta no z4", "v1") == "Z4: ..."
+    assert cache.get("Quem está no G4?", "v1") is None
+    assert cache.get("Quem está no Z4?", "v2") is None
+    # A troca de versão descarta as respostas antigas
+    assert cache.get("Quem está no Z4?", "v1") is None
+    assert cache.hits == 1 and cache.misses == 3
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ttl=60, clock=clock)
+    cache.put("tabela", "v1", "resposta")
+    clock.now = 59
+    assert cache.get("tabela", "v1") == "resposta"
+    clock.now = 60
+    assert cache.get("tabela", "v1") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2, ttl=60, clock=FakeClock())
+    cache.put("a", "v1", "A")
+    cache.put("b", "v1", "B")
+    cache.get("a", "v1")
+    cache.put("c", "v1", "C")
+    assert cache.get("b", "v1") is None
+    assert cache.get("a", "v1") == "A" and cache.get("c", "v1") == "C"
+
+
+def test_semantic_hit_respects_threshold_and_version():
+    vectors = {"quem lidera": [1.0, 0.0], "quem e o lider": [0.9, 0.1], "tabela": [0.0, 1.0]}
+    cache = ResponseCache(ttl=60, similarity_threshold=0.95, embedder=vectors.get, clock=FakeClock())
+    cache.put("Quem lidera?", "v1", "Botafogo")
+
+    assert cache.get("Quem é o líder?", "v1") == "Botafogo"
+    assert cache.get("Tabela", "v1") is None
+    assert cache.semantic_hits == 1
+
+
+if __name__ == "__main__":
+    test_question_normalization()
+    test_hit_only_for_same_question_and_data_version()
+    test_entries_expire_after_ttl()
+    test_least_recently_used_entry_is_evicted()
+    test_semantic_hit_respects_threshold_and_version()
+    print("OK: cache de respostas")
@@ -0,0 +1,82 @@
+"""
+Testes das regras do roteador de intenções
+Execute: python test_router.py (ou pytest test_router.py)
+
+Usa os dados de exemplo da tabela; nenhuma chamada de rede ou ao modelo.
+"""
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+
+from src.agents.router import IntentRouter
+from src.tools import StandingsStore
+from src.tools.agent_tools import get_mock_brasileirao_data
+
+STORE = StandingsStore.from_table(get_mock_brasileirao_data())
+ROUTER = IntentRouter(store_provider=lambda: STORE, min_confidence=0.8)
+
+ROUTED = [
+    ("Tabela completa", "tabela"),
+    ("Mostre a tabela do Brasileirão 2024", "tabela"),
+    ("Quem é o líder?", "lider"),
+    ("Quem está no Z4?", "zona"),
+    ("Quais times estão no G4?", "zona"),
+    ("Palmeiras x Flamengo", "comparacao"),
+    ("Quantos pontos tem o Flamengo?", "estatistica_time"),
+    ("Qual o saldo de gols do Internacional?", "estatistica_time"),
+    ("Quantas vitórias tem o Grêmio?", "estatistica_time"),
+    ("Como está o Bahia?", "estatistica_time"),
+]
+
+# Perguntas sobre jogos específicos, datas, projeções ou outras temporadas
+FALLTHROUGH = [
+    "O Flamengo ganhou ontem?",
+    "O Flamengo ganhou?",
+    "Quantos pontos o Flamengo precisa para ser campeão?",
+    "quantos pontos faltam pro Fortaleza alcançar o G4?",
+    "Como foi o último jogo do Palmeiras?",
+    "Quem joga hoje?",
+    "Qual o próximo jogo do Bahia?",
+    "Tabela da Série B",
+    "Quem foi o líder em 2019?",
+    "O Vasco vai cair?",
+]
+
+
+def test_routes_simple_questions():
+    for question, expected in ROUTED:
+        result = ROUTER.route(question)
+        assert result is not None, question
+        intent, answer = result
+        assert intent.name == expected, question
+        assert answer
+
+
+def test_fallthrough_cues_go_to_agent():
+    for question in FALLTHROUGH:
+        assert ROUTER.classify(question) is None, question
+        assert ROUTER.route(question) is None, question
+
+
+def test_confidence_reflects_unmatched_words():
+    intent = ROUTER.classify("Quantos pontos tem o Flamengo?")
+    assert intent.confidence == 1.0
+
+    # Cita uma estatística, mas "fez no primeiro turno" não é explicado pela regra
+    intent = ROUTER.classify("quantos pontos o flamengo fez no primeiro turno")
+    assert intent is not None and intent.confidence < 0.8
+    assert ROUTER.route("quantos pontos o flamengo fez no primeiro turno") is None
+
+
+def test_team_statistic_answer():
+    intent, answer = ROUTER.route("Quantos pontos tem o Flamengo?")
+    assert intent.params["stat"] == "pontos"
+    assert "Flamengo" in answer and "69 pontos" in answer
+
+
+if __name__ == "__main__":
+    test_routes_simple_questions()
+    test_fallthrough_cues_go_to_agent()
+    test_confidence_reflects_unmatched_words()
+    test_team_statistic_answer()
+    print("OK: regras do roteador")
@@ -0,0 +1,66 @@
+"""
+Testes da simulação de Monte Carlo do restante da temporada
+Execute: python test_simulation.py (ou pytest test_simulation.py)
+"""
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline")
+
+from src.tools import StandingsStore
+from src.tools.agent_tools import get_mock_brasileirao_data
+from src.tools.simulation import simulate_season
+
+FINISHED = StandingsStore.from_table(get_mock_brasileirao_data())
+
+
+def _midseason() -> StandingsStore:
+    """Tabela de exemplo com 19 jogos por time (metade da temporada)"""
+    data = get_mock_brasileirao_data()
+    for row in data["classificacao"]:
+        for column in ("pontos", "jogos", "vitorias", "empates", "derrotas", "gols_pro", "gols_contra"):
+            row[column] //= 2
+    return StandingsStore.from_table(data)
+
+
+def test_finished_season_is_decided():
+    result = simulate_season(FINISHED, runs=500, seed=1)
+    assert result["jogos_restantes"] == 0
+    rows = result["probabilidades"]
+    assert rows[0]["time"] == "Botafogo" and rows[0]["titulo"] == 100.0
+    assert all(row["titulo"] == 0.0 for row in rows[1:])
+    # Os dados de exemplo não estão ordenados por pontos no fim da tabela
+    lowest = sorted(rows, key=lambda row: row["pontos"])[:4]
+    assert all(row["rebaixamento"] == 100.0 for row in lowest)
+    assert sum(row["rebaixamento"] for row in rows) == 400.0
+
+
+def test_probabilities_are_consistent():
+    result = simulate_season(_midseason(), runs=2000, seed=7)
+    rows = result["probabilidades"]
+    assert result["simulacoes"] == 2000
+    assert result["jogos_restantes"] > 0
+    assert abs(sum(row["titulo"] for row in rows) - 100) < 1
+    assert abs(sum(row["rebaixamento"] for row in rows) - 400) < 1
+    for row in rows:
+        assert 0 <= row["titulo"] <= row["libertadores"] <= 100
+        assert row["pontos_esperados"] >= row["pontos"]
+
+
+def test_same_seed_same_result():
+    store = _midseason()
+    assert simulate_season(store, runs=1000, seed=3) == simulate_season(store, runs=1000, seed=3)
+
+
+def test_fixtures_outside_the_table_are_skipped():
+    result = simulate_season(_midseason(), [("Botafogo", "Palmeiras"), ("Botafogo", "Santos")], runs=200, seed=1)
+    assert result["jogos_restantes"] == 1
+    assert result["partidas_ignoradas"] == 1
+    assert result["calendario"] == "partidas restantes"
+
+
+if __name__ == "__main__":
+    test_finished_season_is_decided()
+    test_probabilities_are_consistent()
+    test_same_seed_same_result()
+    test_fixtures_outside_the_table_are_skipped()
+    print("OK: simulação da temporada")
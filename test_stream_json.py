@@ -0,0 +1,60 @@
+"""
+Testes da leitura incremental de JSON (páginas de eventos do SofaScore)
+Execute: python test_stream_json.py (ou pytest test_stream_json.py)
+"""
+import json
+
+from src.ingestion.stream_json import JsonArrayStream
+
+DOCUMENT = {
+    "events": [
+        {"id": 1, "homeTeam": {"name": "São Paulo"}, "homeScore": {"current": 2}, "nota": 7.25},
+        {"id": 2, "homeTeam": {"name": "Grêmio"}, "homeScore": {"current": 10}, "nota": -0.5},
+        {"id": 3, "tags": [], "vazio": {}, "nulo": None, "ok": True},
+    ],
+    "hasNextPage": True,
+}
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_elements_and_fields_for_every_chunk_size():
+    data = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+    # Blocos de 1 byte cortam caracteres UTF-8 e números ao meio
+    for size in (1, 2, 3, 7, 64, len(data)):
+        stream = JsonArrayStream(_chunks(data, size), "events")
+        assert list(stream) == DOCUMENT["events"], size
+        assert stream.fields == {"hasNextPage": True}, size
+
+
+def test_fields_before_and_after_the_array():
+    data = b'{"antes": 1, "events": [{"id": 9}], "hasNextPage": false}'
+    stream = JsonArrayStream(_chunks(data, 4), "events")
+    assert list(stream) == [{"id": 9}]
+    assert stream.fields == {"antes": 1, "hasNextPage": False}
+
+
+def test_empty_array_and_missing_key():
+    assert list(JsonArrayStream([b'{"events": []}'], "events")) == []
+    stream = JsonArrayStream([b'{"outro": [1, 2]}'], "events")
+    assert list(stream) == []
+    assert stream.fields == {"outro": [1, 2]}
+
+
+def test_invalid_document_raises_value_error():
+    for data in (b'[1, 2]', b'{"events": [1, 2', b'{"events": [1 2]}', b'<html>'):
+        try:
+            list(JsonArrayStream(_chunks(data, 3), "events"))
+        except ValueError:
+            continue
+        raise AssertionError(f"ValueError esperado para {data!r}")
+
+
+if __name__ == "__main__":
+    test_elements_and_fields_for_every_chunk_size()
+    test_fields_before_and_after_the_array()
+    test_empty_array_and_missing_key()
+    test_invalid_document_raises_value_error()
+    print("OK: leitura incremental de JSON")
@@ -0,0 +1,130 @@
+"""
+Testes do cache stale-while-revalidate da classificação
+Execute: python test_swr_cache.py (ou pytest test_swr_cache.py)
+"""
+import threading
+import time
+
+from src.tools.swr_cache import StandingsCache
+
+
+class FakeClock:
+    """Relógio controlado pelo teste"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader:
+    """Fonte que retorna versões numeradas (ou None para simular falha)"""
+
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.calls = 0
+        self.fail = fail
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            return None
+        return {"success": True, "classificacao": [{"time": "Botafogo", "pontos": self.calls}]}
+
+
+def _cache(loader, clock):
+    return StandingsCache(
+        loader=loader,
+        fallback=lambda: {"success": True, "classificacao": [], "observacao": "exemplo"},
+        ttl=10,
+        stale_ttl=100,
+        negative_ttl=5,
+        clock=clock,
+    )
+
+
+def _wait_refresh(cache: StandingsCache):
+    deadline = time.monotonic() + 2
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_fresh_data_served_from_memory():
+    clock, loader = FakeClock(), CountingLoader()
+    cache = _cache(loader, clock)
+    first = cache.get()
+    clock.now = 9
+    assert cache.get() is first
+    assert loader.calls == 1
+    assert cache.version == StandingsCache.compute_version(first)
+
+
+def test_stale_data_served_while_refreshing_once():
+    clock, loader = FakeClock(), CountingLoader()
+    cache = _cache(loader, clock)
+    first = cache.get()
+    loader.delay = 0.2
+
+    clock.now = 20
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Todas as leituras recebem o dado antigo na hora; uma única revalidação
+    assert all(result is first for result in results)
+    _wait_refresh(cache)
+    assert loader.calls == 2
+    assert cache.get()["classificacao"][0]["pontos"] == 2
+
+
+def test_expired_data_fetched_synchronously():
+    clock, loader = FakeClock(), CountingLoader()
+    cache = _cache(loader, clock)
+    cache.get()
+    clock.now = 200
+    assert cache.get()["classificacao"][0]["pontos"] == 2
+    assert loader.calls == 2
+
+
+def test_failure_keeps_last_real_data_without_extending_it():
+    clock, loader = FakeClock(), CountingLoader()
+    cache = _cache(loader, clock)
+    real = cache.get()
+
+    loader.fail = True
+    clock.now = 20
+    cache.get()
+    _wait_refresh(cache)
+    assert cache.get() is real
+
+    # Passada a janela de "stale" do dado real, entra o fallback
+    clock.now = 111
+    assert cache.get()["observacao"] == "exemplo"
+
+
+def test_peek_never_blocks_and_warms_in_background():
+    clock, loader = FakeClock(), CountingLoader(delay=0.2)
+    cache = _cache(loader, clock)
+
+    started = time.monotonic()
+    assert cache.peek() is None
+    assert time.monotonic() - started < 0.1
+
+    _wait_refresh(cache)
+    assert cache.peek()["classificacao"][0]["pontos"] == 1
+    assert loader.calls == 1
+
+
+if __name__ == "__main__":
+    test_fresh_data_served_from_memory()
+    test_stale_data_served_while_refreshing_once()
+    test_expired_data_fetched_synchronously()
+    test_failure_keeps_last_real_data_without_extending_it()
+    test_peek_never_blocks_and_warms_in_background()
+    print("OK: cache stale-while-revalidate")